@@ -40,6 +40,7 @@ bl_info = {
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++
 import importlib
 import sys, platform
+import time
 
 
 # Load Globals
@@ -68,6 +69,7 @@ LookingGlassAddon.debugging_print_internal_logger_all = False
 
 # --------------------- LOGGER -----------------------
 import logging, logging.handlers
+import queue, atexit
 
 # log uncaught exceptions
 # +++++++++++++++++++++++++++++++++++++++++++++
@@ -102,7 +104,6 @@ def logfile_namer(default_name):
 #		To log messages for Alice/LG use the logger defined below.
 # create logger
 logger = logging.getLogger('pyLightIO')
-logger.setLevel(logging.DEBUG)
 
 # create console handler and set level to WARNING
 console_handler = logging.StreamHandler()
@@ -123,16 +124,22 @@ logfile_formatter = logging.Formatter('[%(levelname)s] %(asctime)s - %(message)s
 console_handler.setFormatter(console_formatter)
 logfile_handler.setFormatter(logfile_formatter)
 
-# add console handler to logger
-logger.addHandler(console_handler)
-logger.addHandler(logfile_handler)
+# add a queue handler to the logger, which passes the messages to the console
+# and file handlers in a background thread
+# NOTE: This keeps the console and file output off the live view's frame path
+logger_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(logger_queue))
+LookingGlassAddon.logger_listeners['pyLightIO'] = logging.handlers.QueueListener(logger_queue, console_handler, logfile_handler, respect_handler_level=True)
+LookingGlassAddon.logger_listeners['pyLightIO'].start()
+
+# the logger drops all messages that none of the handlers would write
+logger.setLevel(min(console_handler.level, logfile_handler.level))
 
 # logger for Alice/LG
 # +++++++++++++++++++++++++++++++++++++++++++++
 # NOTE: This is the addon's own logger. Use it to log messages on different levels.
 # create logger
 LookingGlassAddonLogger = logging.getLogger('Alice/LG')
-LookingGlassAddonLogger.setLevel(logging.DEBUG)
 
 # create console handler and set level to WARNING
 console_handler = logging.StreamHandler()
@@ -153,9 +160,24 @@ logfile_formatter = logging.Formatter('[%(levelname)s] %(asctime)s - %(message)s
 console_handler.setFormatter(console_formatter)
 logfile_handler.setFormatter(logfile_formatter)
 
-# add console handler to logger
-LookingGlassAddonLogger.addHandler(console_handler)
-LookingGlassAddonLogger.addHandler(logfile_handler)
+# add a queue handler to the logger, which passes the messages to the console
+# and file handlers in a background thread
+logger_queue = queue.SimpleQueue()
+LookingGlassAddonLogger.addHandler(logging.handlers.QueueHandler(logger_queue))
+LookingGlassAddon.logger_listeners['Alice/LG'] = logging.handlers.QueueListener(logger_queue, console_handler, logfile_handler, respect_handler_level=True)
+LookingGlassAddon.logger_listeners['Alice/LG'].start()
+
+# the logger drops all messages that none of the handlers would write
+LookingGlassAddonLogger.setLevel(min(console_handler.level, logfile_handler.level))
+
+# stop the background threads of the loggers
+# NOTE: This writes the queued messages before Blender quits
+def stop_logger_listeners():
+	for listener in LookingGlassAddon.logger_listeners.values():
+		listener.stop()
+	LookingGlassAddon.logger_listeners.clear()
+
+atexit.register(stop_logger_listeners)
 
 
 
@@ -220,15 +242,28 @@ else:
 
 	except:
 
+		# NOTE: The time each module adds to the startup is logged. The first
+		#		module that imports pyLightIO also includes its import time.
+		#		The heavy dependencies of pyLightIO (pynng and OpenCV) are only
+		#		imported on first use.
+
 		# import all preferences' related code
+		import_start = time.time()
 		from .preferences import *
+		LookingGlassAddonLogger.info(" [#] Imported 'preferences' in %.3f s." % (time.time() - import_start))
 
 		# import the modal operators for the viewport & quilt rendering
+		import_start = time.time()
 		from .lightfield_viewport import *
+		LookingGlassAddonLogger.info(" [#] Imported 'lightfield_viewport' in %.3f s." % (time.time() - import_start))
+		import_start = time.time()
 		from .lightfield_render import *
+		LookingGlassAddonLogger.info(" [#] Imported 'lightfield_render' in %.3f s." % (time.time() - import_start))
 
 		# import all UI related code
+		import_start = time.time()
 		from .ui import *
+		LookingGlassAddonLogger.info(" [#] Imported 'ui' in %.3f s." % (time.time() - import_start))
 
 
 
@@ -271,6 +306,13 @@ def LookingGlassAddonInitHandler(dummy1, dummy2):
 		# check if lockfile exists and set status variable
 		LookingGlassAddon.has_lockfile = os.path.exists(bpy.path.abspath(LookingGlassAddon.tmp_path + os.path.basename(bpy.data.filepath) + ".lock"))
 
+		# in background mode, connect to the Looking Glass Bridge only if a
+		# quilt shall be rendered, since the render settings may use the device
+		# NOTE: With a lockfile, this also waits for a running connection
+		#		attempt, since the render settings are restored right away
+		if LookingGlassAddon.has_lockfile or (LookingGlassAddon.background and ('--alicelg-render' in LookingGlassAddon.addon_arguments or '--alicelg-render-anim' in LookingGlassAddon.addon_arguments)):
+			LookingGlassAddon.connect_service()
+
 		# if the loaded file has a lockfile
 		if LookingGlassAddon.has_lockfile:
 
@@ -278,25 +320,12 @@ def LookingGlassAddonInitHandler(dummy1, dummy2):
 			# NOTE: This  loads the last render settings from the lockfile
 			RenderSettings(bpy.context.scene, False, LookingGlassAddon.has_lockfile, (bpy.context.preferences.addons[__package__].preferences.camera_mode == '1'), blocking=LookingGlassAddon.background)
 
-		else:
-
-			# get active device
-			device = pylio.DeviceManager.get_active()
-
-			# try to find the suitable default quilt preset
-			if device: preset = pylio.LookingGlassQuilt.formats.find(device.default_quilt_width, device.default_quilt_height, device.default_quilt_rows, device.default_quilt_columns)
-
-			# then update the selected quilt preset from the device's default quilt
-			if device and preset:
-				bpy.context.scene.addon_settings.quiltPreset = str(preset)
-				bpy.context.scene.addon_settings.render_quilt_preset = str(preset)
+		# if the Looking Glass Bridge connection is still running, the device
+		# settings are applied when the devices are known
+		elif not LookingGlassAddon.is_connecting():
 
-			elif not (device and preset):
-
-				# fallback solution, if the default quilt is not found:
-				# We use the Looking Glass Go standard quilt (48 views)
-				bpy.context.scene.addon_settings.quiltPreset = "5"
-				bpy.context.scene.addon_settings.render_quilt_preset = "5"
+			# update the selected quilt preset from the device's default quilt
+			LookingGlassAddonQuiltDefaults(bpy.context.scene)
 
 		# check if Blender is run in background mode
 		if LookingGlassAddon.background:
@@ -347,7 +376,7 @@ def LookingGlassAddonInitHandler(dummy1, dummy2):
 				    window_manager.addon_settings.ShowLightfieldWindow = False
 
 			# if no Looking Glass was detected AND debug mode is not activated
-			if not pylio.DeviceManager.count() and not LookingGlassAddon.debugging_use_dummy_device:
+			if not pylio.DeviceManager.count() and not LookingGlassAddon.debugging_use_dummy_device and not LookingGlassAddon.is_connecting():
 
 				# set the "use device" checkbox in quilt setup to False
 				# (because there is no device we could take the settings from)
@@ -362,6 +391,46 @@ def LookingGlassAddonInitHandler(dummy1, dummy2):
 
 
 
+# update the selected quilt preset from the active device's default quilt
+def LookingGlassAddonQuiltDefaults(scene):
+
+	# get active device
+	device = pylio.DeviceManager.get_active()
+
+	# try to find the suitable default quilt preset
+	if device: preset = pylio.LookingGlassQuilt.formats.find(device.default_quilt_width, device.default_quilt_height, device.default_quilt_rows, device.default_quilt_columns)
+
+	# then update the selected quilt preset from the device's default quilt
+	if device and preset:
+		scene.addon_settings.quiltPreset = str(preset)
+		scene.addon_settings.render_quilt_preset = str(preset)
+
+	elif not (device and preset):
+
+		# fallback solution, if the default quilt is not found:
+		# We use the Looking Glass Go standard quilt (48 views)
+		scene.addon_settings.quiltPreset = "5"
+		scene.addon_settings.render_quilt_preset = "5"
+
+# apply the device settings to the loaded file, if the Looking Glass Bridge
+# connection was established after the file was loaded
+def LookingGlassAddonServiceConnected():
+
+	# if the loaded file has no lockfile
+	if not LookingGlassAddon.has_lockfile:
+
+		# update the selected quilt preset from the device's default quilt
+		LookingGlassAddonQuiltDefaults(bpy.context.scene)
+
+	# if no Looking Glass was detected AND debug mode is not activated
+	if not pylio.DeviceManager.count() and not LookingGlassAddon.debugging_use_dummy_device:
+
+		# set the "use device" checkbox in quilt setup to False
+		# (because there is no device we could take the settings from)
+		bpy.context.scene.addon_settings.render_use_device = False
+
+
+
 # ---------- ADDON INITIALIZATION & CLEANUP -------------
 def register():
 
@@ -464,43 +533,12 @@ def register():
 		# log info
 		LookingGlassAddonLogger.info(" [#] Done.")
 
-		# log info
-		LookingGlassAddonLogger.info("Connecting to Looking Glass Bridge ...")
-
-		# create a service using "Looking Glass Bridge" backend
-		LookingGlassAddon.service = pylio.ServiceManager.add(pylio.lookingglass.services.LookingGlassBridge, client_name = LookingGlassAddon.name)
-
-		# if a service was added
-		if type(LookingGlassAddon.service) == pylio.lookingglass.services.LookingGlassBridge:
-
-			# if the service is ready
-			if LookingGlassAddon.service.is_ready():
-
-				# log info
-				LookingGlassAddonLogger.info(" [#] Connected to Looking Glass Bridge version: %s" % LookingGlassAddon.service.get_version())
-
-			else:
-
-				# log info
-				LookingGlassAddonLogger.info(" [#] Connection failed.")
-
-			# make the device manager use the created service instance
-			pylio.DeviceManager.set_service(LookingGlassAddon.service)
-
-			# create a set of emulated devices
-			# NOTE: This automatically creates an emulated Looking Glass for
-			#		each device type that is defined in pyLightIO.
-			pylio.DeviceManager.add_emulated()
-
-		# if the service is ready OR dummy devices shall be added
-		if LookingGlassAddon.service.is_ready() or LookingGlassAddon.debugging_use_dummy_device:
-
-			# refresh the list of connected devices using the active pylio service
-			pylio.DeviceManager.refresh()
-
-			# if device are connected, make the first one the active one
-			if LookingGlassAddon.debugging_use_dummy_device: pylio.DeviceManager.set_active(pylio.DeviceManager.to_list(None, None)[0].id)
-			if pylio.DeviceManager.count(): pylio.DeviceManager.set_active(pylio.DeviceManager.to_list()[0].id)
+		# connect to the Looking Glass Bridge, if Blender has a UI
+		# NOTE: In background mode, the service is connected on demand. With a
+		#		UI, the connection runs in the background so that Blender does
+		#		not wait for the connection timeout if the Bridge is not running.
+		if not LookingGlassAddon.background:
+			LookingGlassAddon.connect_service(blocking=False, callback=LookingGlassAddonServiceConnected)
 
 
 			# # prepare the error string from the error code
@@ -528,11 +566,8 @@ def register():
 
 def unregister():
 
-	# if the a service for display communication is active
-	if LookingGlassAddon.service:
-
-		# Unregister at Looking Glass Bridge
-		pylio.ServiceManager.remove(LookingGlassAddon.service)
+	# disconnect from the Looking Glass Bridge
+	LookingGlassAddon.disconnect_service()
 
 	# log info
 	LookingGlassAddonLogger.info("Unregister the addon:")
@@ -622,6 +657,8 @@ def unregister():
 	LookingGlassAddonLogger.info(" [#] Shutting down the loggers.")
 
 	# shut down both loggers (pylightio and Alice/LG)
+	stop_logger_listeners()
+	atexit.unregister(stop_logger_listeners)
 	logger.handlers.clear()
 	LookingGlassAddonLogger.handlers.clear()
 	logging.shutdown()
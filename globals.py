@@ -23,7 +23,8 @@
 
 # ------------------- EXTERNAL MODULES -------------------
 import bpy
-import sys, os, json
+import sys, os, json, tempfile, functools
+from concurrent.futures import ThreadPoolExecutor
 from bpy.props import FloatProperty, PointerProperty
 from bpy.app.handlers import persistent
 
@@ -45,13 +46,20 @@ class LookingGlassAddon:
 	debugging_print_pylio_logger_all = False
 	debugging_print_internal_logger_all = False
 
+	# the background threads, which write the messages of the loggers to the
+	# console and the log files
+	# NOTE: The dictionary has the form {logger name: QueueListener}
+	logger_listeners = {}
+
 	# addon name
 	name = None
 
 	# path to the addon directory
 	path = bpy.path.abspath(os.path.dirname(os.path.realpath(__file__)))
 	tmp_path = bpy.path.abspath(path + "/tmp/")
+	cache_path = bpy.path.abspath(path + "/tmp/cache/")
 	libpath = bpy.path.abspath(path + "/lib/")
+	manifestpath = bpy.path.abspath(path + "/tmp/dependencies.manifest")
 	logpath = bpy.path.abspath(path + "/logs/")
 	presetpath = bpy.path.abspath(path + "/presets/")
 
@@ -64,6 +72,11 @@ class LookingGlassAddon:
 							]
 	external_dependecies_installer = False
 
+	# results of the last dependency check, which are reused as long as the
+	# "lib" directory was not modified
+	# NOTE: The manifest has the form {'stamp': [...], 'modules': {import name: found}}
+	dependency_manifest = None
+
 	# Blender arguments
 	blender_arguments = ""
 	addon_arguments = ""
@@ -71,6 +84,9 @@ class LookingGlassAddon:
 
 	# the pyLightIO service for display communication
 	service = None
+	service_connection = None
+	service_connection_timer = None
+	service_connection_callback = None
 
 	# Lockfile
 	has_lockfile = False
@@ -87,6 +103,9 @@ class LookingGlassAddon:
 	BlenderWindow = None
 	BlenderViewport = None
 
+	# The running lightfield viewport operator
+	LightfieldViewport = None
+
 	# Rendering status
 	RenderInvoked = False
 	RenderAnimation = None
@@ -149,18 +168,97 @@ class LookingGlassAddon:
 		return False
 
 	# check if all defined dependencies can be found in the "lib" directory
+	# NOTE: The module lookups scan the dist-info directories, so the results
+	#		are stored in a manifest and only checked again if the "lib"
+	#		directory, the dependency list, or the Python version changed
 	@classmethod
 	def check_dependecies(cls, debug=False):
 
-		# status
-		found_all = True
+		# stamp of the current state
+		stamp = cls.get_dependency_stamp()
+
+		# if the manifest is not loaded or outdated, try the manifest file
+		if cls.dependency_manifest is None or cls.dependency_manifest['stamp'] != stamp:
+			cls.dependency_manifest = cls.read_dependency_manifest(stamp)
+
+			# if the manifest file is missing or outdated, check all modules
+			if cls.dependency_manifest is None:
+
+				# are all modules in the packages list available in the "lib" directory?
+				cls.dependency_manifest = {'stamp': stamp, 'modules': {module[0]: cls.is_installed(module, debug) for module in cls.external_dependecies}}
+
+				# store the results for the next Blender session
+				cls.write_dependency_manifest()
+
+			elif debug:
+				for module_name, found in cls.dependency_manifest['modules'].items():
+					LookingGlassAddonLogger.info(" [#] %s module '%s' (cached)." % ("Found" if found else "Could not find", module_name))
+
+		return all(cls.dependency_manifest['modules'].values())
+
+	# return the stamp that identifies the state of the "lib" directory
+	# NOTE: Installing, upgrading, or removing a package adds or removes
+	#		directories in the "lib" directory, which changes its mtime
+	@classmethod
+	def get_dependency_stamp(cls):
+
+		try:
+			lib_mtime = os.stat(cls.libpath).st_mtime_ns
+		except OSError:
+			lib_mtime = None
+
+		# NOTE: The lists are compared with the JSON data of the manifest file
+		return [lib_mtime, "%i.%i" % sys.version_info[:2], [list(module[0:3]) for module in cls.external_dependecies]]
+
+	# read the manifest file and return it, if it matches the stamp
+	@classmethod
+	def read_dependency_manifest(cls, stamp):
+
+		try:
+			with open(cls.manifestpath) as manifest_file:
+				manifest = json.load(manifest_file)
+
+			if manifest.get('stamp') == stamp and isinstance(manifest.get('modules'), dict):
+				return manifest
+
+		except (OSError, ValueError):
+			pass
+
+		return None
+
+	# write the manifest to the manifest file
+	@classmethod
+	def write_dependency_manifest(cls):
+
+		try:
+			os.makedirs(os.path.dirname(cls.manifestpath), exist_ok=True)
+
+			# write to a unique temporary file first, so that parallel Blender
+			# sessions never read an incomplete manifest or write into the
+			# same temporary file
+			file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(cls.manifestpath), prefix="dependencies.", suffix=".part")
+			try:
+				with os.fdopen(file_descriptor, 'w') as manifest_file:
+					json.dump(cls.dependency_manifest, manifest_file)
+				os.replace(temp_path, cls.manifestpath)
+
+			except OSError:
+				os.remove(temp_path)
+				raise
+
+		except OSError as e:
+			LookingGlassAddonLogger.info(" [#] Could not write the dependency manifest: %s" % e)
+
+	# discard the results of the last dependency check
+	@classmethod
+	def invalidate_dependency_manifest(cls):
 
-		# are all modules in the packages list available in the "lib" directory?
-		for module in cls.external_dependecies:
-			if not cls.is_installed(module, debug):
-				found_all = False
+		cls.dependency_manifest = None
 
-		return found_all
+		try:
+			os.remove(cls.manifestpath)
+		except OSError:
+			pass
 
 	# unload all dependencies
 	@classmethod
@@ -176,7 +274,8 @@ class LookingGlassAddon:
 				module_name, install_name, install_version, install_options = module
 
 				# unload the module
-				del sys.modules[module_name]
+				# NOTE: lazily imported modules may not have been loaded
+				sys.modules.pop(module_name, None)
 				#del module_name
 
 
@@ -204,6 +303,193 @@ class LookingGlassAddon:
 		pylio.LookingGlassQuilt.formats.add({'description': "Low-resolution Preview", 'quilt_width': 1024, 'quilt_height': 1024, 'view_width': 256, 'view_height': 128, 'columns': 4, 'rows': 8, 'total_views': 32, 'hidden': True})
 
 
+	# LOOKING GLASS BRIDGE SERVICE
+	# +++++++++++++++++++++++++++++++++++++++
+	# connect to the Looking Glass Bridge and detect the connected devices
+	# NOTE: This is called on add-on registration if Blender has a UI and on
+	#		demand in background mode, where most sessions never need a device.
+	#		If the Bridge is not running, the connection attempt only returns
+	#		after the timeout. So with blocking=False, the connection and the
+	#		first device refresh run in a worker thread and a timer publishes
+	#		the service on the main thread. The callback is then called there.
+	@classmethod
+	def connect_service(cls, blocking=True, callback=None):
+
+		# if the service was already created
+		if cls.service is not None:
+			return cls.service
+
+		# if no connection attempt is running, start one
+		if cls.service_connection is None:
+
+			# log info
+			LookingGlassAddonLogger.info("Connecting to Looking Glass Bridge ...")
+
+			# NOTE: The executor is shut down right away, the submitted
+			#		connection attempt still runs to completion
+			executor = ThreadPoolExecutor(max_workers=1)
+			cls.service_connection = executor.submit(cls.create_service)
+			executor.shutdown(wait=False)
+
+		# if the result is published by a timer
+		if not blocking:
+
+			if callback: cls.service_connection_callback = callback
+
+			# NOTE: Timers are identified by the function object, so the bound
+			#		method is stored to check the registration later
+			if cls.service_connection_timer is None:
+				cls.service_connection_timer = cls.check_service_connection
+				bpy.app.timers.register(cls.service_connection_timer, first_interval=0.1, persistent=True)
+
+			return None
+
+		# otherwise wait for the connection attempt
+		return cls.publish_service()
+
+	# return True, if a non-blocking connection attempt is still running
+	@classmethod
+	def is_connecting(cls):
+		return cls.service is None and cls.service_connection is not None
+
+	# create the service and request the connected devices
+	# NOTE: This runs in the worker thread and must not use the Blender API
+	@classmethod
+	def create_service(cls):
+
+		# TODO: Would be better, if from .lib import pylightio could be called,
+		#		but for some reason that does not import all modules and throws
+		#		"AliceLG.lib.pylio has no attribute 'lookingglass"
+		import pylightio as pylio
+
+		# create a service using "Looking Glass Bridge" backend
+		service = pylio.ServiceManager.add(pylio.lookingglass.services.LookingGlassBridge, client_name = cls.name)
+
+		# if a service was added
+		if type(service) == pylio.lookingglass.services.LookingGlassBridge:
+
+			# make the device manager use the created service instance
+			pylio.DeviceManager.set_service(service)
+
+			# refresh the list of connected devices using the active pylio service
+			if service.is_ready(): pylio.DeviceManager.refresh()
+
+		return service
+
+	# timer function, which publishes the service when the connection attempt finished
+	@classmethod
+	def check_service_connection(cls):
+
+		# if the service was already published (e.g., by a blocking call)
+		if cls.service_connection is None or cls.service is not None:
+			cls.service_connection_timer = None
+			return None
+
+		# if the connection attempt is still running, check again later
+		if not cls.service_connection.done():
+			return 0.1
+
+		cls.service_connection_timer = None
+		cls.publish_service()
+
+		return None
+
+	# wait for the connection attempt and make the service available to the add-on
+	# NOTE: This runs on the main thread
+	@classmethod
+	def publish_service(cls):
+
+		# TODO: Would be better, if from .lib import pylightio could be called,
+		#		but for some reason that does not import all modules and throws
+		#		"AliceLG.lib.pylio has no attribute 'lookingglass"
+		import pylightio as pylio
+
+		# wait for the result of the worker thread
+		try:
+			service = cls.service_connection.result()
+
+		# if the connection attempt failed, the add-on continues without a
+		# service and a later call can try again
+		except Exception as e:
+			LookingGlassAddonLogger.error("Could not connect to Looking Glass Bridge: %s" % e)
+			cls.service_connection = None
+			cls.service_connection_callback = None
+			return None
+
+		# if a service was added
+		if type(service) == pylio.lookingglass.services.LookingGlassBridge:
+
+			# if the service is ready
+			if service.is_ready():
+
+				# log info
+				LookingGlassAddonLogger.info(" [#] Connected to Looking Glass Bridge version: %s" % service.get_version())
+
+			else:
+
+				# log info
+				LookingGlassAddonLogger.info(" [#] Connection failed.")
+
+			# create a set of emulated devices
+			# NOTE: This automatically creates an emulated Looking Glass for
+			#		each device type that is defined in pyLightIO.
+			pylio.DeviceManager.add_emulated()
+
+		# if the service is ready OR dummy devices shall be added
+		if service.is_ready() or cls.debugging_use_dummy_device:
+
+			# refresh the list of connected devices, if that was not done
+			# by the worker thread
+			if not service.is_ready(): pylio.DeviceManager.refresh()
+
+			# if device are connected, make the first one the active one
+			if cls.debugging_use_dummy_device: pylio.DeviceManager.set_active(pylio.DeviceManager.to_list(None, None)[0].id)
+			if pylio.DeviceManager.count(): pylio.DeviceManager.set_active(pylio.DeviceManager.to_list()[0].id)
+
+		cls.service = service
+
+		# notify the add-on
+		if cls.service_connection_callback:
+			cls.service_connection_callback()
+			cls.service_connection_callback = None
+
+		# redraw the UI to show the detected devices
+		for window in bpy.context.window_manager.windows:
+			for area in window.screen.areas:
+				area.tag_redraw()
+
+		return cls.service
+
+	# disconnect from the Looking Glass Bridge
+	@classmethod
+	def disconnect_service(cls):
+
+		# TODO: Would be better, if from .lib import pylightio could be called,
+		#		but for some reason that does not import all modules and throws
+		#		"AliceLG.lib.pylio has no attribute 'lookingglass"
+		import pylightio as pylio
+
+		# stop waiting for a running connection attempt
+		if cls.service_connection_timer is not None and bpy.app.timers.is_registered(cls.service_connection_timer):
+			bpy.app.timers.unregister(cls.service_connection_timer)
+		cls.service_connection_timer = None
+		cls.service_connection_callback = None
+
+		# if the a service for display communication is active
+		if cls.service:
+
+			# Unregister at Looking Glass Bridge
+			pylio.ServiceManager.remove(cls.service)
+
+		# if the connection attempt is still running, remove the service
+		# when it is created
+		elif cls.service_connection is not None:
+			cls.service_connection.add_done_callback(lambda connection: connection.exception() is None and pylio.ServiceManager.remove(connection.result()))
+
+		cls.service = None
+		cls.service_connection = None
+
+
 	# GLOBAL LIGHTFIELD VIEWPORT DATA
 	# +++++++++++++++++++++++++++++++++++++++
 	# the timeout value that determines when after the last depsgraph update
@@ -211,6 +497,12 @@ class LookingGlassAddon:
 	# quilt preset
 	low_resolution_preview_timout = 0.4
 
+	# estimated GPU memory of the allocated live view offscreens in bytes
+	viewport_offscreen_memory = 0
+
+	# the quilt that is sent to the device by a worker thread of the lightfield viewport
+	display_future = None
+
 
 	# GLOBAL QUILT VIEWER DATA
 	# +++++++++++++++++++++++++++++++++++++++
@@ -233,9 +525,10 @@ class LookingGlassAddon:
 		LookingGlassAddon.debugging_print_internal_logger_all = bpy.context.preferences.addons[__package__].preferences.console_output
 
 		# set logger levels according to the add-on preferences
-		loggers_list = [logging.getLogger('pyLightIO'), logging.getLogger('Alice/LG')]
-		for logger in loggers_list:
-			for handler in logger.handlers:
+		# NOTE: The console and file handlers are attached to the queue
+		#		listeners of the loggers
+		for logger_name, listener in LookingGlassAddon.logger_listeners.items():
+			for handler in listener.handlers:
 
 				# if this is the TimedRotatingFileHandler
 				if type(handler) == logging.handlers.TimedRotatingFileHandler:
@@ -276,26 +569,54 @@ class LookingGlassAddon:
 						# deactivate console output
 						handler.setLevel(logging.CRITICAL + 1)
 
+			# the logger drops all messages that none of the handlers would write
+			# NOTE: This makes the isEnabledFor() checks on the frame path
+			#		return False for disabled debug messages
+			logging.getLogger(logger_name).setLevel(min(handler.level for handler in listener.handlers))
+
 	# update the lightfield window to display a lightfield on the device
 	@staticmethod
 	def update_lightfield_window(window_mode, lightfield_image, flip_views=None, invert=None):
 		''' update the lightfield image that is displayed on the current device '''
 		''' window_mode = 0: Lightfield Viewport, window_mode = 1: Quilt Viewer, window_mode = -1: demo quilt '''
 
-		# append the add-on's path to Blender's python PATH
-		sys.path.insert(0, LookingGlassAddon.path)
-		sys.path.insert(0, LookingGlassAddon.libpath)
+		# wait until a quilt that is sent in the background was sent
+		# NOTE: The socket of the service must not be used by two threads at once
+		LookingGlassAddon.wait_for_display()
+
+		# send the lightfield image to the device
+		send = LookingGlassAddon.prepare_lightfield_window(window_mode, lightfield_image, flip_views, invert)
+		if send: send()
+
+	# wait until the quilt that is sent by a worker thread was sent
+	# NOTE: Errors of the background send are reported by the lightfield viewport
+	@classmethod
+	def wait_for_display(cls):
+
+		if cls.display_future is not None:
+			cls.display_future.exception()
+			cls.display_future = None
+
+	# return a function, which sends the lightfield image to the current device
+	# NOTE: The device and the display settings are obtained on the main thread,
+	#		so that the returned function only sends the lightfield image and
+	#		can be called by a worker thread
+	@staticmethod
+	def prepare_lightfield_window(window_mode, lightfield_image, flip_views=None, invert=None):
+		''' return a function that displays the lightfield image on the current device or None '''
+		''' window_mode = 0: Lightfield Viewport, window_mode = 1: Quilt Viewer, window_mode = -1: demo quilt '''
 
 		# TODO: Would be better, if from .lib import pylightio could be called,
 		#		but for some reason that does not import all modules and throws
 		#		"AliceLG.lib.pylio has no attribute 'lookingglass"
+		# NOTE: The "lib" directory was added to the python PATH on import
 		import pylightio as pylio
 
 		# update the variable for the current Looking Glass device
 		device = pylio.DeviceManager.get_active()
 
 		# if a valid device is connected
-		if device:
+		if device and device.service:
 
 			# if a LightfieldImage was given
 			if lightfield_image:
@@ -308,7 +629,7 @@ class LookingGlassAddon:
 					if invert is None: invert = False
 
 					# let the device display the image
-					if device.service: device.display(lightfield_image, flip_views=flip_views, invert=invert)
+					return functools.partial(device.display, lightfield_image, flip_views=flip_views, invert=invert)
 
 				# QUILT VIEWER MODE
 				##################################################################
@@ -319,17 +640,19 @@ class LookingGlassAddon:
 					if invert is None: invert = False
 
 					# let the device display the image
-					if device.service: device.display(lightfield_image, flip_views=flip_views, invert=invert)
+					return functools.partial(device.display, lightfield_image, flip_views=flip_views, invert=invert)
 
 			# if the demo quilt was requested
 			elif lightfield_image is None:
 
 				# let the device display the demo quilt
-				if device.service: device.display(None)
+				return functools.partial(device.display, None)
 
 			else:
 				LookingGlassAddonLogger.error("Could not update the lightfield window. No LightfieldImage was given.")
 
+		return None
+
 
 	# Internal string cache as workaround for UnicodeDecodeError reported in issue #114
 	# see: https://blender.stackexchange.com/questions/299978/how-to-fix-unicodedecodeerror
@@ -0,0 +1,72 @@
+# ###################### BEGIN LICENSE BLOCK ###########################
+#
+# Copyright © 2021 Christian Stolze
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ####################### END LICENSE BLOCK ############################
+
+# EXTERNAL PACKAGE DEPENDENCIES
+###################################################
+import importlib
+import time
+
+# INTERNAL PACKAGE DEPENDENCIES
+###################################################
+# NONE
+
+# PREPARE LOGGING
+###################################################
+import logging
+
+# get the library logger
+logger = logging.getLogger('pyLightIO')
+
+
+
+# LAZY IMPORTS
+###############################################
+# proxy for heavy dependencies, which imports the module on first use instead of
+# when pyLightIO is imported
+class LazyModule(object):
+
+    # DEFINE PUBLIC CLASS ATTRIBUTES
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    load_times = {}             # time in seconds it took to import each module
+
+    # INSTANCE METHODS
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    def __init__(self, name):
+        ''' create a proxy for the module with the given import name '''
+        self.__name = name
+        self.__module = None
+
+    def __getattr__(self, attribute):
+        ''' import the module on first access and forward the attribute lookup '''
+
+        # NOTE: __getattr__ is only called for attributes that are not found
+        #       on the proxy itself
+        if self.__module is None:
+
+            start = time.time()
+            self.__module = importlib.import_module(self.__name)
+            LazyModule.load_times[self.__name] = time.time() - start
+
+            logger.info("Imported '%s' on first use in %.3f s." % (self.__name, LazyModule.load_times[self.__name]))
+
+        return getattr(self.__module, attribute)
+
+    @property
+    def is_loaded(self):
+        ''' return True, if the module was imported '''
+        return self.__module is not None
@@ -17,3 +17,4 @@
 # ####################### END LICENSE BLOCK ############################
 
 from pylightio.formats.lightfields import *
+from pylightio.formats.conversion import *
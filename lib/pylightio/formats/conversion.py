@@ -0,0 +1,111 @@
+# ###################### BEGIN LICENSE BLOCK ###########################
+#
+# Copyright © 2021 Christian Stolze
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ####################### END LICENSE BLOCK ############################
+
+# EXTERNAL PACKAGE DEPENDENCIES
+###################################################
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# INTERNAL PACKAGE DEPENDENCIES
+###################################################
+# NONE
+
+# PREPARE LOGGING
+###################################################
+import logging
+
+# get the library logger
+logger = logging.getLogger('pyLightIO')
+
+
+
+# PIXEL DATA CONVERSION
+###############################################
+# the following class is used to convert pixel data between the data types
+# used by the host applications and the lightfield image formats
+class PixelConverter(object):
+
+    # DEFINE PUBLIC CLASS ATTRIBUTES
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    block_size = 65536          # number of values converted at once (fits into the CPU cache)
+    max_workers = min(4, os.cpu_count() or 1)   # number of threads used for the conversion
+
+    # PRIVATE ATTRIBUTES
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    __executor = None           # thread pool, which is created on first use
+
+    # CLASS METHODS
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    @classmethod
+    def float_to_uint8(cls, data, out=None, in_place=False, dither=False):
+        ''' convert float pixel data in the range [0, 1] to rounded and clipped uint8 values '''
+        ''' out: preallocated uint8 array of the same size, in_place: write into the memory of data and return a uint8 view of it '''
+
+        # the data is processed as a flat array
+        if in_place and not (data.dtype == np.float32 and data.flags['C_CONTIGUOUS']):
+            raise TypeError("In-place conversion requires a C-contiguous float32 array.")
+        source = data.reshape(-1)
+
+        # prepare the destination array
+        if in_place:
+            destination = data.view(np.uint8).reshape(-1)[0:source.size]
+        elif out is None:
+            destination = np.empty(source.size, dtype=np.uint8)
+        elif out.dtype == np.uint8 and out.size == source.size and out.flags['C_CONTIGUOUS']:
+            destination = out.reshape(-1)
+        else:
+            raise TypeError("The destination must be a C-contiguous uint8 array with %i values." % source.size)
+
+        # the blocks of the flat arrays
+        blocks = [(start, min(start + cls.block_size, source.size)) for start in range(0, source.size, cls.block_size)]
+
+        # NOTE: In-place, the output of a block overwrites the input of the same
+        #       or previous blocks, so the blocks must be converted in order.
+        if in_place or len(blocks) < 2:
+            for index, (start, end) in enumerate(blocks):
+                cls.__convert_block(source[start:end], destination[start:end], dither, index)
+
+        # otherwise the blocks are converted by the thread pool, since numpy
+        # releases the GIL during the calculations
+        else:
+            if cls.__executor is None: cls.__executor = ThreadPoolExecutor(max_workers=cls.max_workers)
+            list(cls.__executor.map(lambda args: cls.__convert_block(source[args[1][0]:args[1][1]], destination[args[1][0]:args[1][1]], dither, args[0]), enumerate(blocks)))
+
+        # return the destination in the shape of the data
+        return destination.reshape(data.shape)
+
+    # PRIVATE CLASS METHODS
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    @staticmethod
+    def __convert_block(source, destination, dither, seed):
+        ''' scale, dither, round, and clip a block of values '''
+
+        # scale to [0, 255] in a block-sized temporary array
+        values = np.multiply(source, 255.0, dtype=np.float32)
+
+        # add triangular noise of +-1 LSB to avoid banding in gradients
+        if dither:
+            generator = np.random.default_rng(seed)
+            values += generator.random(values.size, dtype=np.float32)
+            values -= generator.random(values.size, dtype=np.float32)
+
+        # round to the nearest integer and clip to the uint8 range
+        values += 0.5
+        np.clip(values, 0.0, 255.0, out=values)
+        np.copyto(destination, values, casting='unsafe')
@@ -229,6 +229,9 @@ class LookingGlassQuilt(BaseLightfieldImageFormat):
             # if no fitting quilt format was found
             if not found: raise TypeError("The loaded image is not in a supported format. Please check the image dimensions.")
 
+            # convert float data in the range [0, 1] to uint8
+            if np.issubdtype(data.dtype, np.floating): data = PixelConverter.float_to_uint8(data)
+
             # convert it to a numpy array
             quilt_np = data.reshape(height, width, colorchannels)
 
@@ -313,6 +316,38 @@ class LookingGlassQuilt(BaseLightfieldImageFormat):
         # otherwise raise exception
         raise TypeError("The requested lightfield format '%s' is not supported." % format)
 
+    def quilt_buffer(self):
+        ''' return a contiguous numpy array of shape (quilt_height, quilt_width, colorchannels) that backs all views '''
+
+        # if no merged numpy array exists OR it is not laid out in quilt order
+        if self.__merged_numpy is None or not self.__merged_numpy.flags['C_CONTIGUOUS']:
+
+            start = time.time()
+
+            # allocate the quilt in memory order (rows, view_height, columns, view_width, colorchannels),
+            # which is the order a framebuffer holding the full quilt is read back in
+            merged_numpy = np.empty((self.metadata['rows'], self.metadata['view_height'], self.metadata['columns'], self.metadata['view_width'], self.colorchannels), dtype=np.uint8)
+
+            # copy the current view data and re-assign the numpy arrays for all
+            # underlying LightfieldView-objects as (memory)views into the new array
+            for i, view in enumerate(self.views):
+
+                # choose column and row
+                i_x = i % self.metadata['columns']
+                i_y = i // self.metadata['columns']
+
+                # create subarray view into the quilt pixel data
+                merged_numpy[i_y, :, i_x, :, :] = view['view'].data
+                view['view'].data = merged_numpy[i_y, :, i_x, :, :]
+
+            self.__merged_numpy = merged_numpy
+
+            # log info
+            logger.debug(" [#] Prepared contiguous quilt buffer of shape %s in %.3f ms." % (self.__merged_numpy.shape, (time.time() - start) * 1000))
+
+        # return the quilt shaped view of the merged numpy array
+        return self.__merged_numpy.reshape(self.metadata['quilt_height'], self.metadata['quilt_width'], self.colorchannels)
+
 
     # PRIVATE INSTANCE METHODS: CONVERT BETWEEN DECODERFORMATS
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -19,7 +19,6 @@
 # EXTERNAL PACKAGE DEPENDENCIES
 ###################################################
 import sys, os, io, struct
-import pynng, cv2
 import math
 import numpy as np
 
@@ -31,6 +30,12 @@ import time
 from pylightio.managers.services import BaseServiceType
 from pylightio.formats import *
 from pylightio.external import cbor
+from pylightio.external.lazy import LazyModule
+
+# the heavy dependencies are imported, when the first connection is
+# established or the first lightfield is displayed
+pynng = LazyModule('pynng')
+cv2 = LazyModule('cv2')
 
 # PREPARE LOGGING
 ###################################################
@@ -59,6 +64,10 @@ class LookingGlassBridge(BaseServiceType):
     __devices = []                                              # list of devices supported by this service (#TODO: this needs to be implemented)
     __decoder_format = LightfieldImage.decoderformat.numpyarray # the decoder format in which the lightfield data is passed to the service
 
+    # DEFINE CLASS PROPERTIES AS PUBLIC MEMBERS
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    display_timings = {}                                        # durations (in seconds) of the 'decode', 'convert', and 'send' steps of the last display call
+
     # Error
     ###################
     #   Enum definition for errors returned from the HoloPlayCore dynamic library.
@@ -165,7 +174,11 @@ class LookingGlassBridge(BaseServiceType):
         ''' display a given lightfield image object on a device '''
         ''' Looking Glass Bridge expects a lightfield image in LookingGlassQuilt format '''
 
-        logger.info("Preparing lightfield image '%s' for display on '%s' ..." % (lightfield, device))
+        # NOTE: This is called for every frame of the live view, so the messages
+        #       are only formatted if they are logged. The timings of the last
+        #       call are available in display_timings.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug: logger.debug("Preparing lightfield image '%s' for display on '%s' ..." % (lightfield, device))
 
         # if the service is ready
         if self.is_ready():
@@ -177,16 +190,17 @@ class LookingGlassBridge(BaseServiceType):
                 # NOTE: Looking Glass Bridge expects a byte stream
                 start = time.time()
                 decoded_lightfield_data = lightfield.decode(self.__decoder_format, flip_views=flip_views, custom_decoder=custom_decoder)
+                timings = {'decode': time.time() - start}
 
                 # lightfield is decoded as numpy array
                 if self.__decoder_format == LightfieldImage.decoderformat.numpyarray and type(decoded_lightfield_data) == np.ndarray:
 
                     # flip the individual views vertically, if required
-                    start = time.time()
+                    start = start_convert = time.time()
                     if flip_views:
                         merged_numpy = lightfield.merged_numpy.view()[:, ::-1, :, :, :]
 
-                        logger.debug(" [#] Flipping the numpy array of shape %s took %.3f ms." % (merged_numpy.shape, (time.time() - start) * 1000))
+                        if debug: logger.debug(" [#] Flipping the numpy array of shape %s took %.3f ms." % (merged_numpy.shape, (time.time() - start) * 1000))
                         start = time.time()
                     else:
                         merged_numpy = lightfield.merged_numpy.view()
@@ -201,13 +215,13 @@ class LookingGlassBridge(BaseServiceType):
 
                             bytes = cv2.cvtColor(merged_numpy.reshape(lightfield.metadata['quilt_height'], lightfield.metadata['quilt_width'], lightfield.colorchannels), cv2.COLOR_BGR2RGB)
 
-                            logger.debug(" [#] Converting from BGR to RGB took %.3f ms." % ((time.time() - start) * 1000))
+                            if debug: logger.debug(" [#] Converting from BGR to RGB took %.3f ms." % ((time.time() - start) * 1000))
 
                         elif lightfield.colorchannels == 4:
 
                             bytes = cv2.cvtColor(merged_numpy.reshape(lightfield.metadata['quilt_height'], lightfield.metadata['quilt_width'], lightfield.colorchannels), cv2.COLOR_BGRA2RGB)
 
-                            logger.debug(" [#] Converting from BGRA to RGB took %.3f ms." % ((time.time() - start) * 1000))
+                            if debug: logger.debug(" [#] Converting from BGRA to RGB took %.3f ms." % ((time.time() - start) * 1000))
 
                     elif not sys.byteorder == "little" and lightfield.colorchannels == 4:
 
@@ -218,21 +232,26 @@ class LookingGlassBridge(BaseServiceType):
                         #       https://developer.blender.org/T91828
                         bytes = cv2.cvtColor(merged_numpy.reshape(lightfield.metadata['quilt_height'], lightfield.metadata['quilt_width'], lightfield.colorchannels), cv2.COLOR_RGBA2RGB)
 
-                        logger.debug(" [#] Converting from RGBA to RGB took %.3f ms." % ((time.time() - start) * 1000))
+                        if debug: logger.debug(" [#] Converting from RGBA to RGB took %.3f ms." % ((time.time() - start) * 1000))
 
                     else:
 
                         bytes = merged_numpy.reshape(lightfield.metadata['quilt_height'], lightfield.metadata['quilt_width'], lightfield.colorchannels)
 
-                        logger.debug(" [#] Reading bytes from %s took %.3f ms." % (type(bytes), (time.time() - start) * 1000))
+                        if debug: logger.debug(" [#] Reading bytes from %s took %.3f ms." % (type(bytes), (time.time() - start) * 1000))
 
                     # parse the quilt metadata
                     settings = {'vx': lightfield.metadata['columns'], 'vy':lightfield.metadata['rows'], 'vtotal': lightfield.metadata['rows'] * lightfield.metadata['columns'], 'aspect': aspect, 'invert': invert}
 
+                    timings['convert'] = time.time() - start_convert
+
                     # pass the quilt to the device
-                    logger.info(" [#] Lightfield image with shape %s is being sent to '%s'." % (bytes.shape, self))
+                    if debug: logger.debug(" [#] Lightfield image with shape %s is being sent to '%s'." % (bytes.shape, self))
+                    start = time.time()
                     self.__send_message(self.__show_quilt(device.configuration['index'], bytes, settings), image_shape=(lightfield.metadata['quilt_height'],lightfield.metadata['quilt_width'], 3))
-                    logger.info(" [#] Done (total time: %.3f ms)." % ((time.time() - start_total) * 1000))
+                    timings['send'] = time.time() - start
+                    self.display_timings = timings
+                    if debug: logger.debug(" [#] Done (total time: %.3f ms)." % ((time.time() - start_total) * 1000))
 
                     return True
 
@@ -347,6 +366,7 @@ class LookingGlassBridge(BaseServiceType):
 
         # if a NNG socket is open
         if self.__is_socket():
+            debug = logger.isEnabledFor(logging.DEBUG)
             start = time.time()
 
             # dump a CBOR message
@@ -355,13 +375,13 @@ class LookingGlassBridge(BaseServiceType):
             else:
                 cbor_dump = cbor.dumps(input_object, image_shape=image_shape)
 
-            logger.debug(" [#] Encoding command as CBOR before sending took %.3f ms." % ((time.time() - start) * 1000))
+            if debug: logger.debug(" [#] Encoding command as CBOR before sending took %.3f ms." % ((time.time() - start) * 1000))
             start = time.time()
 
             # send it to the socket
             self.__socket.send(cbor_dump)
 
-            logger.debug(" [#] Sending command of length %i took %.3f ms." % (len(cbor_dump), (time.time() - start) * 1000))
+            if debug: logger.debug(" [#] Sending command of length %i took %.3f ms." % (len(cbor_dump), (time.time() - start) * 1000))
             start = time.time()
 
             # receive the CBOR-formatted response
@@ -370,7 +390,7 @@ class LookingGlassBridge(BaseServiceType):
             else:
                 return#response = self.__socket.recv()
 
-            logger.debug(" [#] Waiting for response took %.3f ms." % ((time.time() - start) * 1000))
+            if debug: logger.debug(" [#] Waiting for response took %.3f ms." % ((time.time() - start) * 1000))
 
             # return the decoded CBOR response length and its conent
             return [len(response), cbor.loads(response)]
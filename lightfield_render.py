@@ -29,7 +29,8 @@ from .ui import LookingGlassAddonSettingsScene
 # ------------------- EXTERNAL MODULES -------------------
 import bpy
 import time
-import sys, os, platform, shutil, json
+import sys, os, platform, shutil, json, hashlib
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from math import *
 from mathutils import *
@@ -47,6 +48,427 @@ import pylightio as pylio
 import logging
 LookingGlassAddonLogger = logging.getLogger('Alice/LG')
 
+# ------------------ VIEW CACHE --------------------
+# a class that stores rendered views in a content-addressed cache on disk
+# NOTE: Each view file is named after a digest of all inputs that affect
+#		its pixels. If the cache exceeds its size limit, the least recently
+#		used files are deleted.
+class RenderViewCache:
+
+	# IDs reported by the depsgraph after the last frame change
+	# NOTE: Filled by the frame change handler during a render job
+	_frame_updates = []
+
+	# ID attributes that change between sessions without affecting the render
+	_volatile_keys = ['name', 'name_full', 'users', 'session_uid', 'is_evaluated', 'original', 'tag', 'is_runtime_data', 'use_fake_user', 'use_extra_user', 'is_library_indirect', 'is_missing', 'is_embedded_data', 'is_editmode']
+
+	# property name, number of values and numpy type of the generic attribute types
+	# NOTE: Attribute types that are not listed here are not covered by the digest
+	_attribute_types = {
+		'FLOAT': ('value', 1, np.float32),
+		'INT': ('value', 1, np.int32),
+		'INT8': ('value', 1, np.int32),
+		'INT32_2D': ('value', 2, np.int32),
+		'BOOLEAN': ('value', 1, np.bool_),
+		'FLOAT2': ('vector', 2, np.float32),
+		'FLOAT_VECTOR': ('vector', 3, np.float32),
+		'FLOAT_COLOR': ('color', 4, np.float32),
+		'BYTE_COLOR': ('color', 4, np.float32),
+		'QUATERNION': ('value', 4, np.float32),
+		'FLOAT4X4': ('value', 16, np.float32),
+	}
+
+	def __init__(self, path, max_size):
+
+		# path to the cache directory and maximum size in bytes
+		self.path = path
+		self.max_size = max_size
+
+		# statistics of the current render job
+		self.hits = 0
+		self.misses = 0
+
+		# if no cache directory exists, create one
+		if not os.path.exists(self.path):
+			os.makedirs(self.path)
+
+		# modification time and size of the cache files and their total size
+		# NOTE: The directory is only listed once, afterwards the entries are
+		#		updated when files are restored, stored, or deleted
+		self._entries = {entry.path: [entry.stat().st_mtime, entry.stat().st_size] for entry in os.scandir(self.path) if entry.is_file()}
+		self.size = sum(entry[1] for entry in self._entries.values())
+
+	# return the path of the cache file for the given digest
+	def filepath(self, digest, extension):
+		return os.path.join(self.path, digest + extension)
+
+	# copy the cached view to the given file path
+	def restore(self, digest, extension, filepath):
+
+		# if the view is in the cache
+		if os.path.isfile(self.filepath(digest, extension)):
+
+			# copy the file to the view file path
+			shutil.copyfile(self.filepath(digest, extension), filepath)
+
+			# update the modification time, which is used as LRU criterion
+			os.utime(self.filepath(digest, extension))
+			if self.filepath(digest, extension) in self._entries: self._entries[self.filepath(digest, extension)][0] = time.time()
+
+			self.hits += 1
+			return True
+
+		self.misses += 1
+		return False
+
+	# copy the given view file into the cache
+	def store(self, digest, extension, filepath):
+
+		# if the view file exists
+		if os.path.isfile(filepath):
+
+			# copy the file into the cache
+			shutil.copyfile(filepath, self.filepath(digest, extension))
+
+			# update the total size
+			if self.filepath(digest, extension) in self._entries: self.size -= self._entries[self.filepath(digest, extension)][1]
+			self._entries[self.filepath(digest, extension)] = [time.time(), os.path.getsize(filepath)]
+			self.size += self._entries[self.filepath(digest, extension)][1]
+
+			# remove the least recently used files, if required
+			if self.size > self.max_size: self.evict()
+
+	# delete the least recently used files until the cache fits its size limit
+	def evict(self):
+
+		# delete the oldest files first
+		for file_path, (mtime, file_size) in sorted(self._entries.items(), key=lambda entry: entry[1][0]):
+			if self.size <= self.max_size: break
+
+			try:
+				os.remove(file_path)
+			except FileNotFoundError:
+				# NOTE: Another Blender process may have deleted the file
+				pass
+			except OSError:
+				LookingGlassAddonLogger.warning("Could not delete view cache file: %s" % file_path)
+				continue
+
+			del self._entries[file_path]
+			self.size -= file_size
+
+	# add the primitive attributes of a Blender struct to the hash
+	@staticmethod
+	def hash_struct(hasher, struct, exclude=()):
+
+		# if no struct was given
+		if struct is None: return
+
+		for key in dir(struct):
+			if not key.startswith('_') and key not in exclude and key not in ['bl_rna', 'rna_type'] + RenderViewCache._volatile_keys:
+				try:
+					value = getattr(struct, key)
+				except AttributeError:
+					continue
+
+				# if the attribute is one of the following types: bool, int, float, str
+				if isinstance(value, (bool, int, float, str)):
+					hasher.update(("%s=%r;" % (key, value)).encode())
+
+				# if the attribute is an array (e.g., a color or vector)
+				elif hasattr(value, "__len__") and not callable(value) and len(value) < 64:
+					try:
+						hasher.update(("%s=%r;" % (key, tuple(value))).encode())
+					except TypeError:
+						pass
+
+	# add the values of a collection property (e.g., the vertex positions) to the hash
+	@staticmethod
+	def hash_collection(hasher, collection, key, length, dtype):
+
+		data = np.empty(len(collection) * length, dtype=dtype)
+		collection.foreach_get(key, data)
+
+		hasher.update(("%s:%i;" % (key, len(collection))).encode())
+		hasher.update(data.tobytes())
+
+	# add the points of a curve mapping (e.g., the color management curves) to the hash
+	@classmethod
+	def hash_curve_mapping(cls, hasher, curve_mapping):
+
+		cls.hash_struct(hasher, curve_mapping)
+		for curve in curve_mapping.curves:
+			for point in curve.points:
+				hasher.update(("%r;%r;" % (tuple(point.location), point.handle_type)).encode())
+
+	# add the generic attributes of a geometry to the hash
+	# NOTE: Returns False, if an attribute type is not covered
+	@classmethod
+	def hash_attributes(cls, hasher, attributes):
+
+		for attribute in attributes:
+
+			# internal attributes (e.g., the selection) do not affect the render
+			if attribute.name.startswith('.'): continue
+
+			# if the attribute type is not covered
+			if attribute.data_type not in cls._attribute_types: return False
+
+			key, length, dtype = cls._attribute_types[attribute.data_type]
+			hasher.update((attribute.name + attribute.domain + attribute.data_type).encode())
+			cls.hash_collection(hasher, attribute.data, key, length, dtype)
+
+		return True
+
+	# add the evaluated geometry of a mesh to the hash
+	# NOTE: Returns False, if the mesh contains data that is not covered
+	@classmethod
+	def hash_mesh(cls, hasher, mesh):
+
+		# vertex positions, faces, material indices, and shading
+		cls.hash_collection(hasher, mesh.vertices, 'co', 3, np.float32)
+		cls.hash_collection(hasher, mesh.loops, 'vertex_index', 1, np.int32)
+		cls.hash_collection(hasher, mesh.polygons, 'loop_total', 1, np.int32)
+		cls.hash_collection(hasher, mesh.polygons, 'material_index', 1, np.int32)
+		cls.hash_collection(hasher, mesh.polygons, 'use_smooth', 1, np.bool_)
+		cls.hash_struct(hasher, mesh, exclude=['total_vert_sel', 'total_edge_sel', 'total_face_sel'])
+
+		# custom normals
+		if mesh.has_custom_normals:
+			if hasattr(mesh, 'calc_normals_split'): mesh.calc_normals_split()
+			cls.hash_collection(hasher, mesh.loops, 'normal', 3, np.float32)
+
+		# UV maps and vertex colors
+		# NOTE: Newer Blender versions also store them as generic attributes
+		for uv_layer in mesh.uv_layers:
+			hasher.update(uv_layer.name.encode())
+			cls.hash_collection(hasher, uv_layer.data, 'uv', 2, np.float32)
+		for color_layer in getattr(mesh, 'vertex_colors', []):
+			hasher.update(color_layer.name.encode())
+			cls.hash_collection(hasher, color_layer.data, 'color', 4, np.float32)
+
+		return cls.hash_attributes(hasher, mesh.attributes)
+
+	# add the image datablock to the hash
+	# NOTE: Returns False, if the image source is not covered
+	@classmethod
+	def hash_image(cls, hasher, image, image_user=None):
+
+		hasher.update((image.name + image.source + image.filepath_raw).encode())
+		cls.hash_struct(hasher, image, exclude=['bindcode', 'has_data', 'is_dirty'])
+		cls.hash_struct(hasher, image.colorspace_settings)
+		cls.hash_struct(hasher, image_user)
+
+		# if the image was painted or is packed, hash the pixels
+		if image.is_dirty or image.packed_file:
+			pixels = np.empty(len(image.pixels), dtype=np.float32)
+			image.pixels.foreach_get(pixels)
+			hasher.update(pixels.tobytes())
+
+		# if the image is loaded from a file, hash the modification time
+		elif image.source in ['FILE', 'SEQUENCE', 'MOVIE']:
+
+			# NOTE: For image sequences this is the file of the current frame
+			file_path = bpy.path.abspath(image.filepath_from_user(image_user=image_user) if image_user else image.filepath, library=image.library)
+			try:
+				stat = os.stat(file_path)
+			except OSError:
+				return False
+
+			hasher.update(("%s;%i;%i;" % (file_path, stat.st_mtime_ns, stat.st_size)).encode())
+
+		# generated images are defined by their settings, but other sources
+		# (e.g., UDIM tiles) are not covered
+		elif image.source != 'GENERATED':
+			return False
+
+		return True
+
+	# add the node values of a node tree to the hash
+	# NOTE: Returns False, if the node tree contains data that is not covered
+	@classmethod
+	def hash_node_tree(cls, hasher, node_tree, hashed_trees=None):
+
+		# if no node tree was given
+		if node_tree is None: return True
+
+		# the node groups are only hashed once per tree
+		if hashed_trees is None: hashed_trees = set()
+		hashed_trees.add(node_tree.as_pointer())
+
+		for node in node_tree.nodes:
+			hasher.update((node.name + node.bl_idname).encode())
+			cls.hash_struct(hasher, node, exclude=['location', 'width', 'height', 'dimensions', 'select', 'hide', 'show_options', 'show_preview', 'show_texture'])
+
+			# the default values of all input sockets
+			for socket in node.inputs:
+				if hasattr(socket, "default_value"):
+					value = socket.default_value
+					hasher.update(("%s=%r;" % (socket.identifier, tuple(value) if hasattr(value, "__len__") and not isinstance(value, str) else value)).encode())
+
+			# the images of image and environment texture nodes
+			if getattr(node, 'image', None) is not None:
+				if not cls.hash_image(hasher, node.image, getattr(node, 'image_user', None)): return False
+
+			# the node trees of node groups
+			if getattr(node, 'node_tree', None) is not None:
+				hasher.update(node.node_tree.name.encode())
+				if node.node_tree.as_pointer() not in hashed_trees and not cls.hash_node_tree(hasher, node.node_tree, hashed_trees): return False
+
+		for link in node_tree.links:
+			hasher.update((link.from_node.name + link.from_socket.identifier + link.to_node.name + link.to_socket.identifier).encode())
+
+		return True
+
+	# calculate a digest of the evaluated scene data of the current frame
+	# NOTE: Returns None, if the scene contains data that is not covered by
+	#		the digest. In this case, the cache must not be used.
+	@classmethod
+	def scene_digest(cls, scene):
+
+		hasher = hashlib.sha1()
+
+		# OBJECTS
+		# ++++++++++++++++++++++
+		# get the evaluated depsgraph
+		depsgraph = bpy.context.evaluated_depsgraph_get()
+
+		# for all object instances that are rendered
+		hashed_data = set()
+		hashed_materials = set()
+		for instance in depsgraph.object_instances:
+			object = instance.object
+
+			# name, type and transformation of the object
+			hasher.update((object.name + object.type).encode())
+			hasher.update(np.array(instance.matrix_world, dtype=np.float32).tobytes())
+
+			# instances generated by particles, geometry nodes, etc.
+			if instance.is_instance:
+				hasher.update(("%s;%i;%r;" % (instance.parent.name if instance.parent else "", instance.random_id, tuple(instance.persistent_id))).encode())
+
+			# hair particles are not covered
+			if any(particle_system.settings.render_type == 'PATH' for particle_system in object.particle_systems): return None
+
+			# the evaluated object data is only hashed once (e.g., for instances)
+			# NOTE: Objects with different modifiers have different evaluated
+			#		data with the same name, so the data is identified by pointer
+			if object.data is not None and object.data.as_pointer() not in hashed_data:
+				hashed_data.add(object.data.as_pointer())
+
+				# geometry of the evaluated mesh (including modifier and geometry node results)
+				if object.type == 'MESH':
+					if not cls.hash_mesh(hasher, object.data): return None
+
+				# geometry of curves, surfaces, texts, and metaballs
+				elif object.type in ['CURVE', 'SURFACE', 'FONT', 'META']:
+					mesh = object.to_mesh()
+					covered = mesh is None or cls.hash_mesh(hasher, mesh)
+					object.to_mesh_clear()
+					if not covered: return None
+
+				# hair curves and point clouds
+				elif object.type in ['CURVES', 'POINTCLOUD']:
+					if not cls.hash_attributes(hasher, object.data.attributes): return None
+
+				# settings of lights, cameras, etc.
+				elif object.type in ['LIGHT', 'CAMERA', 'LIGHT_PROBE', 'SPEAKER', 'ARMATURE', 'LATTICE']:
+					cls.hash_struct(hasher, object.data)
+					if object.type == 'LIGHT' and object.data.use_nodes and not cls.hash_node_tree(hasher, object.data.node_tree): return None
+
+				# other object types (e.g., Grease Pencil and volumes) are not covered
+				else:
+					return None
+
+			# assigned materials
+			for slot in object.material_slots:
+				if slot.material is not None:
+					hasher.update(slot.material.name.encode())
+
+					# hash the node tree of each material only once
+					if slot.material.name not in hashed_materials:
+						hashed_materials.add(slot.material.name)
+						cls.hash_struct(hasher, slot.material)
+						if slot.material.use_nodes and not cls.hash_node_tree(hasher, slot.material.node_tree): return None
+
+		# WORLD
+		# ++++++++++++++++++++++
+		if scene.world is not None:
+			hasher.update(scene.world.name.encode())
+			cls.hash_struct(hasher, scene.world)
+			if scene.world.use_nodes and not cls.hash_node_tree(hasher, scene.world.node_tree): return None
+
+		# COLOR MANAGEMENT
+		# ++++++++++++++++++++++
+		# view transform, look, exposure, gamma, curves, and display device
+		cls.hash_struct(hasher, scene.view_settings)
+		if scene.view_settings.use_curve_mapping: cls.hash_curve_mapping(hasher, scene.view_settings.curve_mapping)
+		cls.hash_struct(hasher, scene.display_settings)
+		cls.hash_struct(hasher, scene.sequencer_colorspace_settings)
+
+		# MOTION BLUR
+		# ++++++++++++++++++++++
+		# NOTE: The motion blur depends on the neighboring frames, which are
+		#		not part of the hash. Therefore, it is only valid for this frame.
+		if scene.render.use_motion_blur:
+			hasher.update(("frame=%s;" % (scene.frame_current + scene.frame_subframe)).encode())
+
+		# DEPSGRAPH UPDATE TAGS
+		# ++++++++++++++++++++++
+		# NOTE: IDs updated by the frame change are animated. Since not every
+		#		data of such an ID is part of the hash (e.g., image sequences),
+		#		the frame is added for these IDs.
+		for name, is_updated_geometry, is_updated_shading, is_updated_transform in sorted(cls._frame_updates):
+			hasher.update(("%s:%i%i%i;" % (name, is_updated_geometry, is_updated_shading, is_updated_transform)).encode())
+			if is_updated_shading: hasher.update(("%s@%s" % (name, scene.frame_current + scene.frame_subframe)).encode())
+
+		return hasher.hexdigest()
+
+	# calculate the digest of the current view
+	@classmethod
+	def view_digest(cls, job):
+
+		hasher = hashlib.sha1()
+
+		# scene data of the current frame
+		hasher.update(job._scene_digest.encode())
+
+		# CAMERA
+		# ++++++++++++++++++++++
+		# camera matrix and camera settings after the setup
+		hasher.update(np.array(job._camera_active.matrix_world, dtype=np.float32).tobytes())
+		cls.hash_struct(hasher, job._camera_active.data)
+
+		# QUILT & RENDER SETTINGS
+		# ++++++++++++++++++++++
+		hasher.update(("%s;%s;%s;%s" % (job.view_cone, job.total_views, job.view_width, job.view_height)).encode())
+		cls.hash_struct(hasher, job.scene.render, exclude=['filepath', 'frame_path', 'stamp_note_text', 'use_lock_interface'])
+		cls.hash_struct(hasher, job.scene.render.image_settings)
+
+		# color management of the output file, if it overrides the scene settings
+		# NOTE: The scene color management is part of the scene digest
+		if getattr(job.scene.render.image_settings, 'color_management', 'FOLLOW_SCENE') == 'OVERRIDE':
+			cls.hash_struct(hasher, job.scene.render.image_settings.view_settings)
+			cls.hash_struct(hasher, job.scene.render.image_settings.display_settings)
+
+		# compositor nodes
+		if job.scene.render.use_compositing and job.scene.use_nodes and not cls.hash_node_tree(hasher, job.scene.node_tree): return None
+
+		# engine specific settings
+		if job.scene.render.engine == "CYCLES": cls.hash_struct(hasher, job.scene.cycles)
+		elif job.scene.render.engine in ["BLENDER_EEVEE", "BLENDER_EEVEE_NEXT"]: cls.hash_struct(hasher, job.scene.eevee)
+
+		return hasher.hexdigest()
+
+	# collect the depsgraph updates caused by a frame change
+	@classmethod
+	def track_frame_updates(cls, scene, depsgraph):
+
+		cls._frame_updates.clear()
+		for update in depsgraph.updates:
+			cls._frame_updates.append((update.id.name, update.is_updated_geometry, update.is_updated_shading, update.is_updated_transform))
+
+
 # ------------------ QUILT RENDERING --------------------
 # a class whose instances will store the variables required to control the
 # internal rendering jobs
@@ -75,6 +497,9 @@ class RenderJob:
 		self.view_start = None
 		self.view_end = None
 		self.seed = None
+		self.samples = None
+		self.sample_profile = '0'
+		self.sample_minimum = 1.0
 		self.view_width = None
 		self.view_height = None
 		self.rows = None
@@ -108,6 +533,33 @@ class RenderJob:
 		self._view_images_pixels = []
 		self._quilt_image = None
 
+		# view cache attributes
+		self.use_cache = False
+		self._cache = None
+		self._scene_digest = None
+		self._view_digest = None
+		self._view_cached = False
+
+		# draft attributes
+		self.use_draft = False
+		self.draft_step = 1
+		self._depth_viewer_name = '_quilt_render_depth'
+		self._depth_original = None
+		self._view_depths = {}
+
+		# statistics attributes
+		self._view_render_start = None
+		self._view_statistics = []
+
+		# telemetry attributes
+		# NOTE: The summary is printed, if the "--telemetry" argument is passed in background mode
+		self.use_telemetry = False
+		self._telemetry_print = LookingGlassAddon.background and ("-t" in LookingGlassAddon.addon_arguments or "--telemetry" in LookingGlassAddon.addon_arguments)
+		self._telemetry_start = None
+		self._telemetry_views = 0
+		self._assembly_time = None
+		self._save_time = None
+
 		# INITIALIZE OUTPUT PATH ATTRIBUTES
 		# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 	    # if a valid scene was given
@@ -116,6 +568,21 @@ class RenderJob:
 			# store the suffix option
 			self.add_suffix = self.scene.addon_settings.render_add_suffix
 
+			# store the view cache option
+			self.use_cache = self.scene.addon_settings.render_use_cache
+
+			# store the telemetry option
+			self.use_telemetry = self.scene.addon_settings.render_use_telemetry or self._telemetry_print
+
+			# store the draft options
+			# NOTE: Draft renders are only supported in single camera mode
+			self.use_draft = self.scene.addon_settings.render_use_draft and not self.use_multiview
+			self.draft_step = self.scene.addon_settings.render_draft_step if self.use_draft else 1
+
+			# store the sample profile options
+			self.sample_profile = self.scene.addon_settings.render_sample_profile
+			self.sample_minimum = self.scene.addon_settings.render_sample_minimum
+
 			# store the output path in an attribute
 			self.outputpath = bpy.path.abspath(bpy.context.scene.render.filepath)
 
@@ -196,6 +663,9 @@ class RenderJob:
 	# invoke a new render job
 	def invoke(self):
 
+		# remember the start time of the render job for the telemetry
+		if self._telemetry_start is None: self._telemetry_start = time.time()
+
 		# if this is the first view of this render job
 		# NOTE: - we do it this way in case the camera is animated and its position changes each frame
 		if self.init:
@@ -206,7 +676,10 @@ class RenderJob:
 			# FRAME AND VIEW
 			# ++++++++++++++++++++++
 			# set the current frame to be rendered
+			# NOTE: The depsgraph updates of the frame change are tracked for the view cache
+			if self.use_cache: bpy.app.handlers.frame_change_post.append(RenderViewCache.track_frame_updates)
 			self.scene.frame_set(self.frame, subframe=self.subframe)
+			if self.use_cache: bpy.app.handlers.frame_change_post.remove(RenderViewCache.track_frame_updates)
 
 			# get the subframe, that will be rendered
 			self.subframe = self.scene.frame_subframe
@@ -236,6 +709,22 @@ class RenderJob:
 				# increment the seed value only with the view number
 				self.scene.cycles.seed = self.seed + self.view
 
+		# CYCLES: ADAPTIVE SAMPLES
+		# ++++++++++++++++++++++
+		# NOTE: The outer views of the view cone are seen at a more oblique
+		#		angle and overlap with their neighbours. Therefore, they are
+		#		rendered with less samples than the central views.
+		if self.scene.render.engine == "CYCLES" and not self.use_multiview:
+
+			# if this is the first view of the current frame
+			if self.view == 0 or self.samples is None:
+
+				# use the user setting as sample basis
+				self.samples = self.scene.cycles.samples
+
+			# apply the samples of this view
+			self.scene.cycles.samples = self.view_samples()
+
 		# FILEPATH
 		# ++++++++++++++++++++++
 
@@ -256,9 +745,382 @@ class RenderJob:
 		# ++++++++++++++++++++++
 		self.setup_camera()
 
+		# DEPTH OUTPUT FOR DRAFT RENDERS
+		# ++++++++++++++++++++++
+		if self.use_draft and self.init: self.setup_depth_output()
+
+		# VIEW CACHE
+		# ++++++++++++++++++++++
+		# try to restore the view from the view cache
+		self.restore_from_cache()
+
 		# update status variable
 		self.init = False
 
+	# restore the current view from the view cache, if it was rendered before
+	def restore_from_cache(self):
+
+		# reset the cache status of this view
+		self._view_digest = None
+		self._view_cached = False
+
+		# the view cache is only used for single-camera rendering
+		# NOTE: Draft renders require the depth of each rendered view,
+		#		which is not stored in the cache
+		if self.use_cache and not self.use_multiview and not self.use_draft:
+
+			# create the cache, if it not already exists
+			if self._cache is None: self._cache = RenderViewCache(LookingGlassAddon.cache_path, bpy.context.preferences.addons[__package__].preferences.render_cache_size * 1024 * 1024)
+
+			# calculate the digest of the scene data only once per frame
+			if self.init: self._scene_digest = RenderViewCache.scene_digest(self.scene)
+
+			# calculate the digest of this view
+			if self._scene_digest is not None: self._view_digest = RenderViewCache.view_digest(self)
+
+			# if the scene contains data that is not covered by the digest,
+			# the view is rendered and not stored in the cache
+			if self._view_digest is None:
+				LookingGlassAddonLogger.debug(" [#] View cache skipped for view %i of frame %i, since the scene contains data the digest does not cover." % (self.view, self.frame))
+				return False
+
+			# copy the cached view file to the view file path, if it exists
+			self._view_cached = self._cache.restore(self._view_digest, self.file_extension, self.view_filepath())
+
+			LookingGlassAddonLogger.debug(" [#] View cache %s for view %i of frame %i (digest: %s)." % ("hit" if self._view_cached else "miss", self.view, self.frame, self._view_digest))
+
+		return self._view_cached
+
+	# store the rendered view in the view cache
+	def store_in_cache(self):
+
+		# if the view was rendered and not restored from the cache
+		if self._cache is not None and self._view_digest is not None and not self._view_cached:
+
+			# copy the view file into the cache
+			self._cache.store(self._view_digest, self.file_extension, self.view_filepath())
+
+	# DRAFT RENDERING
+	# ++++++++++++++++++++++++++++++++++
+	# return the list of views that are rendered
+	def draft_views(self):
+
+		# every k-th view of the view range and the last view are rendered
+		views = list(range(self.view_start, self.view_end, self.draft_step))
+		if views[-1] != self.view_end - 1: views.append(self.view_end - 1)
+
+		return views
+
+	# return the next view that shall be rendered
+	def next_view(self):
+		return min(self.view + self.draft_step, self.view_end - 1)
+
+	# add a viewer node to the compositor, which receives the depth pass
+	def setup_depth_output(self):
+
+		# if the viewer node already exists
+		if self.scene.use_nodes and self.scene.node_tree and self.scene.node_tree.nodes.find(self._depth_viewer_name) != -1: return
+
+		# remember the original settings and nodes
+		self._depth_original = {'use_nodes': self.scene.use_nodes, 'use_compositing': self.scene.render.use_compositing, 'use_pass_z': bpy.context.view_layer.use_pass_z, 'nodes': []}
+		original_nodes = set(self.scene.node_tree.nodes.keys()) if self.scene.node_tree else set()
+
+		# activate the depth pass and the compositor
+		bpy.context.view_layer.use_pass_z = True
+		self.scene.render.use_compositing = True
+		self.scene.use_nodes = True
+		node_tree = self.scene.node_tree
+
+		# NOTE: If the node tree had no nodes, Blender adds the default
+		#		"Render Layers" and "Composite" nodes, which are removed again
+		self._depth_original['nodes'].extend(name for name in node_tree.nodes.keys() if name not in original_nodes)
+
+		# find the render layer node or create a new one
+		render_layers = next((node for node in node_tree.nodes if node.bl_idname == 'CompositorNodeRLayers'), None)
+		if render_layers is None:
+			render_layers = node_tree.nodes.new('CompositorNodeRLayers')
+			self._depth_original['nodes'].append(render_layers.name)
+
+		# if the compositor was not used before, the image needs to be passed to the output
+		if not next((node for node in node_tree.nodes if node.bl_idname == 'CompositorNodeComposite'), None):
+			composite = node_tree.nodes.new('CompositorNodeComposite')
+			node_tree.links.new(render_layers.outputs['Image'], composite.inputs['Image'])
+			self._depth_original['nodes'].append(composite.name)
+
+		# pass the depth to a viewer node
+		viewer = node_tree.nodes.new('CompositorNodeViewer')
+		viewer.name = self._depth_viewer_name
+		node_tree.links.new(render_layers.outputs['Depth'], viewer.inputs['Image'])
+		self._depth_original['nodes'].append(viewer.name)
+
+		LookingGlassAddonLogger.info(" [#] Added depth output for draft rendering.")
+
+	# remove the depth output from the compositor
+	def clean_up_depth_output(self):
+
+		# if the depth output was set up
+		if self._depth_original is not None:
+
+			# remove the created nodes
+			if self.scene.node_tree:
+				for name in self._depth_original['nodes']:
+					if self.scene.node_tree.nodes.find(name) != -1:
+						self.scene.node_tree.nodes.remove(self.scene.node_tree.nodes[name])
+
+			# restore the original settings
+			self.scene.use_nodes = self._depth_original['use_nodes']
+			self.scene.render.use_compositing = self._depth_original['use_compositing']
+			bpy.context.view_layer.use_pass_z = self._depth_original['use_pass_z']
+			self._depth_original = None
+
+	# store the depth of the rendered view
+	def store_view_depth(self):
+
+		# if the viewer node image exists
+		if self.use_draft and bpy.data.images.find('Viewer Node') != -1:
+
+			# read the depth from the red channel
+			image = bpy.data.images['Viewer Node']
+			pixels = np.empty(len(image.pixels), np.float32)
+			image.pixels.foreach_get(pixels)
+			self._view_depths[self.view] = pixels[0::4].reshape((image.size[1], image.size[0])).copy()
+
+	# return the horizontal camera offset of a view
+	def view_offset(self, view):
+		return self.scene.addon_settings.focalPlane * tan((0.5 - view / (self.total_views - 1)) * radians(self.view_cone))
+
+	# reproject a view to a camera with a different offset using its depth
+	@staticmethod
+	def warp_view(pixels, depth, shift, focal_distance):
+
+		height, width = pixels.shape[:2]
+
+		# no depth available, so the view is used without reprojection
+		if depth is None or depth.shape != (height, width):
+			return pixels, np.ones((height, width), dtype=bool)
+
+		# calculate the target column of each pixel from its disparity
+		disparity = shift * (1.0 / np.maximum(depth, 1e-6) - 1.0 / focal_distance)
+		x = np.rint(np.arange(width, dtype=np.float32)[np.newaxis, :] + disparity).astype(np.int64)
+		y = np.broadcast_to(np.arange(height, dtype=np.int64)[:, np.newaxis], (height, width))
+
+		# ignore pixels that move out of the view
+		valid = (x >= 0) & (x < width)
+		target = (y * width + x)[valid]
+		source_depth = depth[valid]
+
+		# depth test: only the nearest pixel is written to each target pixel
+		zbuffer = np.full(height * width, np.inf, dtype=np.float32)
+		np.minimum.at(zbuffer, target, source_depth)
+		visible = source_depth <= zbuffer[target]
+
+		# write the visible pixels into the target view
+		warped = np.zeros((height * width, pixels.shape[2]), dtype=pixels.dtype)
+		warped[target[visible]] = pixels[valid][visible]
+
+		return warped.reshape(pixels.shape), np.isfinite(zbuffer).reshape((height, width))
+
+	# synthesize a view from its two neighbouring rendered views
+	def synthesize_view(self, view, left, right):
+
+		# scale factor of the image shift in horizontal pixels
+		# NOTE: Blender's camera shift is relative to the larger image
+		#		dimension, taking the pixel aspect ratio into account
+		camera = self._camera_active.data
+		if self.view_width * self.scene.render.pixel_aspect_x >= self.view_height * self.scene.render.pixel_aspect_y:
+			pixels_per_unit = self.view_width
+		else:
+			pixels_per_unit = self.view_height * self.scene.render.pixel_aspect_y / self.scene.render.pixel_aspect_x
+		scale = pixels_per_unit / (2 * tan(camera.angle / 2))
+
+		# reproject both neighbours into the view
+		focal_distance = self.scene.addon_settings.focalPlane
+		shape = (self.view_height, self.view_width, 4)
+		warped_left, mask_left = self.warp_view(self._view_images_pixels[left].reshape(shape), self._view_depths.get(left), scale * (self.view_offset(view) - self.view_offset(left)), focal_distance)
+		warped_right, mask_right = self.warp_view(self._view_images_pixels[right].reshape(shape), self._view_depths.get(right), scale * (self.view_offset(view) - self.view_offset(right)), focal_distance)
+
+		# blend the reprojected views according to the distance to the view
+		weight = (view - left) / (right - left)
+		pixels = np.where(mask_left[..., np.newaxis], warped_left, warped_right)
+		pixels = np.where((mask_left & mask_right)[..., np.newaxis], (1 - weight) * warped_left + weight * warped_right, pixels)
+
+		# fill remaining holes with the blended neighbours
+		holes = ~(mask_left | mask_right)
+		pixels[holes] = (1 - weight) * self._view_images_pixels[left].reshape(shape)[holes] + weight * self._view_images_pixels[right].reshape(shape)[holes]
+
+		return pixels.astype(np.float32).reshape(-1)
+
+	# synthesize all views that were not rendered
+	def synthesize_views(self):
+
+		# get the rendered views and the missing views with their neighbours
+		rendered = [view for view, pixels in enumerate(self._view_images_pixels) if pixels is not None]
+		missing = [(view, max(v for v in rendered if v < view), min(v for v in rendered if v > view)) for view, pixels in enumerate(self._view_images_pixels) if pixels is None]
+
+		LookingGlassAddonLogger.info(" [#] Synthesizing %i views from %i rendered views." % (len(missing), len(rendered)))
+
+		# synthesize the views in parallel
+		with ThreadPoolExecutor() as executor:
+			for (view, left, right), pixels in zip(missing, executor.map(lambda args: self.synthesize_view(*args), missing)):
+				self._view_images_pixels[view] = pixels
+
+	# return the sample factor of a view according to the sample profile
+	def view_sample_factor(self, view=None):
+
+		# if no view is given
+		if view is None: view = self.view
+
+		# distance of the view from the center of the view cone
+		# NOTE: 0.0 is the central view and 1.0 is the outermost view
+		distance = abs(2 * view / (self.total_views - 1) - 1) if self.total_views > 1 else 0.0
+
+		# linear profile
+		if self.sample_profile == '1':
+			return 1.0 - (1.0 - self.sample_minimum) * distance
+
+		# cosine profile
+		elif self.sample_profile == '2':
+			return self.sample_minimum + (1.0 - self.sample_minimum) * cos(distance * pi / 2)
+
+		# uniform profile
+		return 1.0
+
+	# return the number of samples of a view
+	def view_samples(self, view=None):
+		return max(1, round(self.samples * self.view_sample_factor(view)))
+
+	# log the samples and render times of the views of a frame
+	def log_view_statistics(self, frame=None):
+
+		# if no frame is given
+		if frame is None: frame = self.frame
+
+		# get the statistics of this frame
+		statistics = [entry for entry in self._view_statistics if entry['frame'] == frame]
+		if statistics:
+
+			LookingGlassAddonLogger.info("Render statistics of frame %i:" % frame)
+			for entry in statistics:
+
+				# NOTE: Multiview renders record all views as one entry
+				if entry['view'] is None: LookingGlassAddonLogger.info(" [#] all views (multiview): %s samples, %.3f s" % (entry['samples'], entry['time']))
+				else: LookingGlassAddonLogger.info(" [#] view %i: %s samples, %.3f s" % (entry['view'], entry['samples'], entry['time']))
+			LookingGlassAddonLogger.info(" [#] total: %i samples, %.3f s" % (sum(entry['samples'] for entry in statistics if entry['samples']), sum(entry['time'] for entry in statistics)))
+
+	# TELEMETRY
+	# ++++++++++++++++++++++++++++++++++
+	# return the file path of the telemetry log
+	def telemetry_filepath(self):
+		return os.path.join(self.file_dirname, self.file_basename + "_telemetry.jsonl")
+
+	# return the number of views that are rendered per frame
+	def views_per_frame(self):
+
+		# all views are rendered in one multiview render
+		if self.use_multiview: return self.view_end - self.view_start
+
+		return len(self.draft_views())
+
+	# return the frames of the render job
+	def frames(self):
+
+		# if an animation is rendered
+		if self.animation: return list(range(self.scene.frame_start, self.scene.frame_end + 1, self.scene.frame_step))
+
+		return [self.frame]
+
+	# return the rendering throughput and the estimated remaining time
+	def throughput(self):
+
+		# elapsed time since the start of the render job
+		elapsed = time.time() - self._telemetry_start if self._telemetry_start is not None else 0.0
+
+		# views per minute
+		views_per_minute = 60 * self._telemetry_views / elapsed if elapsed > 0 else 0.0
+
+		# remaining views of the current and the following frames
+		# NOTE: This is calculated from the frame position, so that it is also
+		#		correct for render jobs continued from a lockfile
+		views_done = len([entry for entry in self._view_statistics if entry['frame'] == self.frame]) * (self.views_per_frame() if self.use_multiview else 1)
+		remaining = len([frame for frame in self.frames() if frame >= self.frame]) * self.views_per_frame() - views_done
+		eta = 60 * max(remaining, 0) / views_per_minute if views_per_minute > 0 else None
+
+		return elapsed, views_per_minute, eta
+
+	# record the statistics of a rendered view
+	def record_view(self, samples, render_time, cached=False):
+
+		# the multiview render counts as all views of the frame
+		self._telemetry_views += self.views_per_frame() if self.use_multiview else 1
+
+		# store the statistics of this view
+		entry = {'frame': self.frame, 'view': self.view if not self.use_multiview else None, 'samples': samples, 'time': render_time, 'cached': cached}
+		self._view_statistics.append(entry)
+
+		# write the telemetry record
+		elapsed, views_per_minute, eta = self.throughput()
+		self.write_telemetry(dict({'type': 'view', 'timestamp': time.time(), 'views_per_minute': views_per_minute, 'eta': eta}, **entry))
+
+	# record the statistics of an assembled quilt
+	def record_frame(self):
+
+		# get the statistics of the current frame
+		statistics = [entry for entry in self._view_statistics if entry['frame'] == self.frame]
+		elapsed, views_per_minute, eta = self.throughput()
+
+		# write the telemetry record
+		record = {'type': 'frame', 'timestamp': time.time(), 'frame': self.frame, 'views': len(statistics), 'cached_views': len([entry for entry in statistics if entry['cached']]), 'render_time': sum(entry['time'] for entry in statistics), 'assembly_time': self._assembly_time, 'save_time': self._save_time, 'elapsed': elapsed, 'views_per_minute': views_per_minute, 'eta': eta}
+		self.write_telemetry(record)
+
+		# log info
+		LookingGlassAddonLogger.info("Frame %i: render %.3f s, assembly %.3f s, save %.3f s, %.1f views/min, remaining: %s" % (self.frame, record['render_time'], self._assembly_time or 0.0, self._save_time or 0.0, views_per_minute, ("%.0f s" % eta) if eta is not None else "unknown"))
+		if self._telemetry_print: print("[Alice/LG] frame %i: render %.3f s, assembly %.3f s, save %.3f s, %.1f views/min, remaining: %s" % (self.frame, record['render_time'], self._assembly_time or 0.0, self._save_time or 0.0, views_per_minute, ("%.0f s" % eta) if eta is not None else "unknown"))
+
+	# record the summary of the render job
+	def record_summary(self, completed):
+
+		# if the render job was started
+		if self._telemetry_start is not None:
+
+			elapsed, views_per_minute, eta = self.throughput()
+			frames = sorted(set(entry['frame'] for entry in self._view_statistics))
+
+			# write the telemetry record
+			record = {'type': 'summary', 'timestamp': time.time(), 'completed': completed, 'frames': len(frames), 'views': self._telemetry_views, 'cached_views': len([entry for entry in self._view_statistics if entry['cached']]), 'render_time': sum(entry['time'] for entry in self._view_statistics), 'elapsed': elapsed, 'views_per_minute': views_per_minute}
+			self.write_telemetry(record)
+
+			# log info
+			LookingGlassAddonLogger.info("Render job summary: %i frames, %i views in %.3f s (%.1f views/min)." % (record['frames'], record['views'], elapsed, views_per_minute))
+			if self._telemetry_print: print("[Alice/LG] summary: %s" % json.dumps(record))
+
+	# append a record to the telemetry log
+	def write_telemetry(self, record):
+
+		# if the telemetry log shall be written
+		if self.use_telemetry:
+
+			try:
+				with open(self.telemetry_filepath(), 'a') as telemetry_file:
+					telemetry_file.write(json.dumps(record) + "\n")
+			except OSError:
+				LookingGlassAddonLogger.warning("Could not write the render telemetry to '%s'." % self.telemetry_filepath())
+
+	# apply the settings of a camera data block to another camera data block
+	@staticmethod
+	def copy_camera_data(source, target):
+
+		# copy all attributes of the following types: bool, int, float, str
+		for key in dir(source):
+			if not key.startswith('_') and key not in ['bl_rna', 'rna_type', 'name', 'name_full', 'session_uid', 'users', 'is_lightfield'] and isinstance(getattr(source, key), (bool, int, float, str)):
+				try:
+					setattr(target, key, getattr(source, key))
+				except (AttributeError, TypeError):
+					pass
+
+		# depth of field settings
+		for key in ['use_dof', 'focus_object', 'focus_distance', 'aperture_fstop', 'aperture_blades', 'aperture_rotation', 'aperture_ratio']:
+			if hasattr(source.dof, key): setattr(target.dof, key, getattr(source.dof, key))
+
 	# setup the camera (system) for rendering
 	def setup_camera(self):
 
@@ -313,6 +1175,10 @@ class RenderJob:
 				# originals camera data, if it not already exists
 				if not self._camera_temp: self._camera_temp.append(bpy.data.objects.new(self._camera_temp_basename, self._camera_active.data.copy()))
 
+				# otherwise apply the current settings of the original camera
+				# NOTE: The camera is reused between the frames of an animation
+				else: self.copy_camera_data(self._camera_active.data, self._camera_temp[-1].data)
+
 				# use this new camera for rendering
 				self._camera_active = self._camera_temp[-1]
 
@@ -411,8 +1277,8 @@ class RenderJob:
 					# COPY CAMERA
 					# +++++++++++++++++++++++++++++++++++++++++++++++
 
-					# if the cameras not already exist
-					if not len(self._camera_temp) == self.total_views:
+					# if the camera of this view not already exists
+					if len(self._camera_temp) <= view - self.view_start:
 
 						# create a new, temporary camera using a copy of the original camera
 						self._camera_temp.append(bpy.data.objects.new(self._camera_temp_basename + "_v" + str(view).zfill(len(str(self.total_views - 1))), self._camera_active.data.copy()))
@@ -425,6 +1291,11 @@ class RenderJob:
 						# add this camera to the master collection of the scene
 						self.scene.collection.objects.link(self._camera_temp[view - self.view_start])
 
+					# otherwise apply the current settings of the original camera
+					# NOTE: The cameras are reused between the frames of an animation
+					else:
+						self.copy_camera_data(self._camera_original.data, self._camera_temp[view - self.view_start].data)
+
 
 					# use this camera for rendering
 					self._camera_active = self._camera_temp[view - self.view_start]
@@ -473,6 +1344,9 @@ class RenderJob:
 
 		LookingGlassAddonLogger.info("Assembling the quilt from the rendered views:")
 
+		# remember the start time for the telemetry
+		start = time.time()
+
 		# GET THE PIXEL DATA OF THE RENDERED VIEWS
 		# ++++++++++++++++++++++++++++++++++++++++++++
 		# clear the quilt pixel data for the (next) quilt
@@ -499,6 +1373,12 @@ class RenderJob:
 				# delete the Blender image of this view
 				bpy.data.images.remove(self._view_image)
 
+			# if the view is synthesized from its neighbours in draft mode
+			elif self.use_draft and self.view_start < view < self.view_end - 1 and view not in self.draft_views():
+
+				# append a placeholder
+				self._view_images_pixels.append(None)
+
 			# if the file does not exist
 			else:
 
@@ -512,40 +1392,39 @@ class RenderJob:
 
 		LookingGlassAddonLogger.info(" [#] Loaded all views into memory.")
 
+		# synthesize the views that were not rendered in draft mode
+		if self.use_draft: self.synthesize_views()
+
 
 		# ASSEMBLE THE QUILT
 		# ++++++++++++++++++++++++++++++++++++++++++++
 		# TODO: Would be good to implement the quilt assembly via pyLightIO
 		#
-		# then assemble the quilt from the views
-		verticalStack = []
-		horizontalStack = []
+		# allocate the quilt buffer once and copy each view into its tile
+		# NOTE: The pixel data of each view is released after it was copied,
+		#		so that no intermediate stacks of the full quilt are created
+		view_height, view_width = self.scene.render.resolution_y, self.scene.render.resolution_x
+		quiltPixels = np.empty((self.rows * view_height, self.columns * view_width, 4), dtype=np.float32)
 		for row in range(0, self.rows):
 			for column in range(0, self.columns):
 
-				# get pixel data and reshape into a reasonable format for stacking
-				viewPixels = self._view_images_pixels[row * self.columns + column]
-				viewPixels = viewPixels.reshape((self.scene.render.resolution_y, self.scene.render.resolution_x, 4))
-
-				# append the pixel data to the current horizontal stack
-				horizontalStack.append(viewPixels)
+				# copy the pixel data into the tile of this view
+				quiltPixels[row * view_height:(row + 1) * view_height, column * view_width:(column + 1) * view_width] = self._view_images_pixels[row * self.columns + column].reshape((view_height, view_width, 4))
+				self._view_images_pixels[row * self.columns + column] = None
 
 				# log info
-				LookingGlassAddonLogger.debug(" [#] Stacking view %i with shape %s." % (row * self.columns + column, viewPixels.shape))
-
-			# append the complete horizontal stack to the vertical stacks
-			verticalStack.append(np.hstack(horizontalStack.copy()))
-
-			# clear this horizontal stack
-			horizontalStack.clear()
+				LookingGlassAddonLogger.debug(" [#] Copied view %i into the quilt." % (row * self.columns + column))
 
-		# reshape the pixel data of all images into the quilt shape
-		quiltPixels = np.vstack(verticalStack.copy())
-		quiltPixels = np.reshape(quiltPixels, (self.columns * self.rows * (self.scene.render.resolution_x * self.scene.render.resolution_y * 4)))
+		# flatten the quilt pixel data for the image data block
+		quiltPixels = quiltPixels.reshape(-1)
 
 		# log info
 		LookingGlassAddonLogger.info(" [#] Assembled quilt in memory.")
 
+		# measure the assembly time
+		self._assembly_time = time.time() - start
+		start = time.time()
+
 		# copy the viewfile
 		# NOTE: We use copyfile() instead of copy(), because the latter failed
 		#		on network drives. Are there any downsides to this?
@@ -588,6 +1467,9 @@ class RenderJob:
 		# give the result image the temporary quilt file name
 		self._quilt_image.name = self.file_temp_name
 
+		# measure the save time
+		self._save_time = time.time() - start
+
 		# log info
 		LookingGlassAddonLogger.info(" [#] Done.")
 
@@ -615,14 +1497,20 @@ class RenderJob:
 			if os.path.isfile(self.quilt_filepath(frame)):
 				os.remove(self.quilt_filepath(frame))
 
-		# clear the pixel data
+		# clear the pixel and depth data
 		self._view_images_pixels.clear()
+		self._view_depths.clear()
 
 	# setup the camera system for rendering
-	def clean_up(self):
+	# NOTE: If "keep_cameras" is True, only the original cameras are restored,
+	#		while the temporary cameras and render views are kept for the next frame
+	def clean_up(self, keep_cameras=False):
 
 		LookingGlassAddonLogger.info("Cleaning up camera setup.")
 
+		# remove the depth output of draft renders
+		if not keep_cameras: self.clean_up_depth_output()
+
 		# if there is an active camera marker in this frame	
 		marker_camera_found = False
 		marker_cameras = [marker for marker in bpy.context.scene.timeline_markers if marker.camera is not None]
@@ -649,7 +1537,7 @@ class RenderJob:
 				self.scene.camera = self._camera_original
 
 			# delete the temporarily created camera data block
-			if bpy.data.objects.find(self._camera_temp_basename) != -1:
+			if not keep_cameras and bpy.data.objects.find(self._camera_temp_basename) != -1:
 
 				LookingGlassAddonLogger.info(" [#] Delete temporary camera: %s" % (bpy.data.objects[self._camera_temp_basename]))
 
@@ -671,6 +1559,13 @@ class RenderJob:
 				# restore the original active camera
 				self.scene.camera = self._camera_original
 
+			# if the temporary cameras and render views shall be reused
+			if keep_cameras:
+
+				LookingGlassAddonLogger.info(" [#] Keeping %i temporary cameras for the next frame." % len(self._camera_temp))
+
+				return
+
 			# loop through all views
 			for view, camera in enumerate(self._camera_temp):
 
@@ -740,6 +1635,9 @@ class RenderJob:
 		# update operator state
 		self._state = "PRE_RENDER"
 
+		# remember the start time of this render
+		self._view_render_start = time.time()
+
 		# SINGLE-CAMERA RENDERING
 		# ++++++++++++++++++++++++++++++++++
 		if not self.use_multiview:
@@ -784,6 +1682,11 @@ class RenderJob:
 		# update operator state
 		self._state = "COMPLETE_RENDER"
 
+		# record the samples and render time of this view
+		if self._view_render_start is not None:
+			self.record_view(self.scene.cycles.samples if self.scene.render.engine == "CYCLES" else None, time.time() - self._view_render_start)
+			self._view_render_start = None
+
 	# function that is called if rendering was cancelled
 	def cancel_render(self, Scene, depsgraph):
 
@@ -933,6 +1836,14 @@ class RenderSettings:
 					self.view_start = int(LookingGlassAddon.addon_arguments[index])
 					self.view_end = int(LookingGlassAddon.addon_arguments[index]) + 1
 
+				# if the render telemetry shall be written and printed
+				if "-t" in LookingGlassAddon.addon_arguments or "--telemetry" in LookingGlassAddon.addon_arguments:
+
+					# activate the telemetry log for this render job only
+					# NOTE: The scene setting is not changed, since it would be
+					#		saved in the .blend file
+					self.use_telemetry = True
+
 				# set the view range start
 				if "--view-range" in LookingGlassAddon.addon_arguments:
 
@@ -1339,6 +2250,9 @@ class LOOKINGGLASS_OT_render_quilt(bpy.types.Operator):
 	cancel_sign = "INFO"
 	cancel_message = "Quilt rendering was cancelled."
 
+	# status variable, which is set when the complete quilt was rendered
+	completed = False
+
 
 
 
@@ -1376,6 +2290,19 @@ class LOOKINGGLASS_OT_render_quilt(bpy.types.Operator):
 
 
 
+		# TELEMETRY SUMMARY
+		# +++++++++++++++++++++++++
+		# if this call was not just invoked to discard an incomplete render job
+		if not self.discard_lockfile:
+			self.render_settings.job.record_summary(self.completed)
+
+		# VIEW CACHE STATISTICS
+		# +++++++++++++++++++++++++
+		if self.render_settings.job._cache is not None:
+			LookingGlassAddonLogger.info("View cache: %i views restored, %i views rendered." % (self.render_settings.job._cache.hits, self.render_settings.job._cache.misses))
+
+
+
 		# CLEAR IMAGE & PIXEL DATA
 		# +++++++++++++++++++++++++
 		self.render_settings.job._view_image = None
@@ -1416,6 +2343,15 @@ class LOOKINGGLASS_OT_render_quilt(bpy.types.Operator):
 			# clean up the render job (e.g., the temporary cameras etc.)
 			self.render_settings.job.clean_up()
 
+			# CYCLES SPECIFIC
+			# NOTE: The seed and the adaptive samples are changed for every
+			#		view, so they are restored independent of how the job ended
+			if self.render_settings.engine == "CYCLES":
+
+				# restore seed and sample settings
+				if self.render_settings.job.seed is not None: self.render_settings.job.scene.cycles.seed = self.render_settings.job.seed
+				if self.render_settings.job.samples is not None: self.render_settings.job.scene.cycles.samples = self.render_settings.job.samples
+
 			# restore original render settings
 			self.render_settings.restore_original()
 
@@ -1456,6 +2392,11 @@ class LOOKINGGLASS_OT_render_quilt(bpy.types.Operator):
 	# invoke the modal operator
 	def invoke(self, context, event):
 
+		# make sure the Looking Glass Bridge is connected, since the render
+		# settings may be taken from the device
+		# NOTE: In background mode, the service is connected on demand
+		LookingGlassAddon.connect_service()
+
 		# RENDER SETTINGS
 		################################################################
 
@@ -1652,6 +2593,10 @@ class LOOKINGGLASS_OT_render_quilt(bpy.types.Operator):
 		# set the multiview mode of the scene
 		self.render_settings.job.scene.render.use_multiview = self.use_multiview
 
+		# the view cache is only available for single-camera rendering
+		if self.use_multiview and self.render_settings.job.use_cache:
+			LookingGlassAddonLogger.info("The view cache is not used in multiview camera mode.")
+
 		# HANDLERS FOR THE RENDERING PROCESS
 		# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 		bpy.app.handlers.render_init.append(self.render_settings.job.init_render)
@@ -1727,6 +2672,21 @@ class LOOKINGGLASS_OT_render_quilt(bpy.types.Operator):
 				# invoke the new render job
 				self.render_settings.job.invoke()
 
+				# if the view was restored from the view cache
+				if self.render_settings.job._view_cached:
+
+					# log info
+					LookingGlassAddonLogger.info("Restored view %i of frame %i from the view cache." % (self.render_settings.job.view, self.render_settings.job.frame))
+
+					# record the view for the telemetry
+					self.render_settings.job.record_view(None, 0.0, cached=True)
+
+					# skip the rendering of this view
+					self.render_settings.job._state = "COMPLETE_RENDER"
+
+					# pass event through
+					return {'PASS_THROUGH'}
+
 				# start rendering
 				result = bpy.ops.render.render("INVOKE_DEFAULT", animation=False, write_still=True)
 				if result != {'CANCELLED'}:
@@ -1762,14 +2722,30 @@ class LOOKINGGLASS_OT_render_quilt(bpy.types.Operator):
 			# if nothing is rendering, but the last view is not yet rendered
 			elif self.render_settings.job._state == "COMPLETE_RENDER" and not self.render_settings.addon_settings.render_stop:
 
+				# VIEW CACHE & DEPTH
+				# ++++++++++++++++++++++++++++++++++++++++++++
+				# store the rendered view in the view cache
+				self.render_settings.job.store_in_cache()
+
+				# store the depth of the rendered view for draft renders
+				self.render_settings.job.store_view_depth()
+
 				# QUILT ASSEMBLY
 				# ++++++++++++++++++++++++++++++++++++++++++++
 				# if this was the last view OR a multiview render
 				if self.render_settings.job.view == (self.render_settings.job.view_end - 1) or self.use_multiview:
 					start = time.time()
 
+					# log the samples and render times of the views
+					self.render_settings.job.log_view_statistics()
+
 					# assemble the quilt from the view data
-					if not self.render_settings.job.assemble_quilt():
+					if self.render_settings.job.assemble_quilt():
+
+						# record the telemetry of this frame
+						self.render_settings.job.record_frame()
+
+					else:
 
 						# cancel the operator
 						self.render_settings.addon_settings.render_stop = True
@@ -1824,7 +2800,7 @@ class LOOKINGGLASS_OT_render_quilt(bpy.types.Operator):
 					if self.render_settings.job.view < (self.render_settings.job.view_end - 1) and not self.use_multiview:
 
 						# increase view count
-						self.render_settings.job.view += 1
+						self.render_settings.job.view = self.render_settings.job.next_view()
 
 						# reset the render job state to IDLE
 						self.render_settings.job._state = "INVOKE_RENDER"
@@ -1833,6 +2809,7 @@ class LOOKINGGLASS_OT_render_quilt(bpy.types.Operator):
 					else:
 
 						# notify user
+						self.completed = True
 						self.cancel_sign = "INFO"
 						self.cancel_message = "Complete quilt rendered."
 
@@ -1847,7 +2824,7 @@ class LOOKINGGLASS_OT_render_quilt(bpy.types.Operator):
 					if self.render_settings.job.view < (self.render_settings.job.view_end - 1) and not self.use_multiview:
 
 						# increase view count
-						self.render_settings.job.view += 1
+						self.render_settings.job.view = self.render_settings.job.next_view()
 
 						# reset the render job state to IDLE
 						self.render_settings.job._state = "INVOKE_RENDER"
@@ -1861,8 +2838,9 @@ class LOOKINGGLASS_OT_render_quilt(bpy.types.Operator):
 							# CYCLES SPECIFIC
 							if self.render_settings.engine == "CYCLES":
 
-								# restore seed setting
+								# restore seed and sample settings
 								self.render_settings.job.scene.cycles.seed = self.render_settings.job.seed
+								if self.render_settings.job.samples is not None: self.render_settings.job.scene.cycles.samples = self.render_settings.job.samples
 
 							# if the view files shall not be kept
 							if ((self.render_settings.addon_settings.render_output == '1') and self.render_settings.job.file_force_keep == False):
@@ -1870,8 +2848,9 @@ class LOOKINGGLASS_OT_render_quilt(bpy.types.Operator):
 								# delete views of the rendered frame
 								self.render_settings.job.delete_files(self.render_settings.job.frame)
 
-							# delete the temporarily created camera
-							self.render_settings.job.clean_up()
+							# restore the original camera, but keep the temporary
+							# cameras for the next frame
+							self.render_settings.job.clean_up(keep_cameras=True)
 
 							# reset the initialization step variable for the render job
 							self.render_settings.job.init = True
@@ -1892,6 +2871,7 @@ class LOOKINGGLASS_OT_render_quilt(bpy.types.Operator):
 							self.render_settings.addon_settings.render_stop = True
 
 							# notify user
+							self.completed = True
 							self.cancel_sign = "INFO"
 							self.cancel_message = "Complete animation quilt rendered."
 
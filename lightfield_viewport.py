@@ -23,12 +23,16 @@
 
 # ------------------ INTERNAL MODULES --------------------
 from .globals import *
+from .ui import LookingGlassAddonUI
 
 # ------------------- EXTERNAL MODULES -------------------
 import sys, platform
+import re
 import bpy, bgl
 import gpu
 import time, timeit
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from math import *
 from mathutils import *
 from gpu_extras.batch import batch_for_shader
@@ -44,6 +48,10 @@ sys.path.insert(0, LookingGlassAddon.libpath)
 #		but for some reason that does not import all modules and throws
 #		"AliceLG.lib.pylio has no attribute 'lookingglass"
 import pylightio as pylio
+from pylightio.external.lazy import LazyModule
+
+# OpenCV is only needed for quilt playback and loaded on first use
+cv2 = LazyModule('cv2')
 
 # ---------------- GLOBAL ADDON LOGGER -------------------
 import logging
@@ -52,6 +60,302 @@ LookingGlassAddonLogger = logging.getLogger('Alice/LG')
 
 
 
+# ------------ FRAME PACING -------------
+# Class for measuring the frame pacing of the lightfield viewport
+class FramePacing:
+
+	# the measured stages of a frame
+	stages = ('draw', 'readback', 'convert', 'send')
+
+	# frame intervals longer than this (in seconds) are idle times and
+	# not taken into account for the frame rate
+	idle_interval = 1.0
+
+	# Inititalize the frame pacing
+	def __init__(self, window=60):
+
+		# rolling windows of the frame start times and stage durations
+		self.frame_starts = deque(maxlen=window)
+		self.stage_durations = {stage: deque(maxlen=window) for stage in self.stages}
+		self.frames = 0
+
+	# start a new frame
+	def begin_frame(self):
+
+		self.frame_starts.append(time.time())
+		self.frames += 1
+
+	# record the duration of a stage of the current frame
+	def record(self, stage, duration):
+
+		self.stage_durations[stage].append(duration)
+
+	# record the durations of the last display call of a service
+	def record_display(self, service):
+
+		for stage, duration in getattr(service, 'display_timings', {}).items():
+			if stage in self.stage_durations: self.record(stage, duration)
+
+	# time until the next frame may start to keep the given frame rate
+	def delay(self, fps):
+
+		if not self.frame_starts: return 0.0
+		return max(0.0, 1 / fps - (time.time() - self.frame_starts[-1]))
+
+	# intervals between consecutive frames, excluding idle times
+	def intervals(self):
+
+		frame_starts = list(self.frame_starts)
+		return [end - start for start, end in zip(frame_starts[:-1], frame_starts[1:]) if end - start < self.idle_interval]
+
+	# rolling frame rate
+	@property
+	def fps(self):
+
+		intervals = self.intervals()
+		if not intervals: return 0.0
+		return len(intervals) / sum(intervals)
+
+	# rolling jitter as the standard deviation of the frame intervals (in ms)
+	@property
+	def jitter(self):
+
+		intervals = self.intervals()
+		if len(intervals) < 2: return 0.0
+		mean = sum(intervals) / len(intervals)
+		return sqrt(sum((interval - mean) ** 2 for interval in intervals) / len(intervals)) * 1000
+
+	# rolling average duration of a stage (in ms)
+	def average(self, stage):
+
+		durations = self.stage_durations[stage]
+		if not durations: return 0.0
+		return sum(durations) / len(durations) * 1000
+
+	# human readable summary of the statistics
+	def summary(self):
+
+		return "%.1f fps, jitter %.1f ms | %s" % (self.fps, self.jitter, ", ".join("%s %.1f ms" % (stage, self.average(stage)) for stage in self.stages))
+
+
+
+# ------------ QUILT PLAYER -------------
+# Class for streaming the frames of image sequence and movie quilts to the device
+# NOTE: The frames are read from disk and converted to LookingGlassQuilts by
+#		worker threads, since the Blender API must not be used outside of the
+#		main thread. Only the frames in a ring ahead of the current frame are
+#		kept in memory.
+class QuiltPlayer:
+
+	# maximum number of frames that are prefetched ahead of the current frame
+	ring_size = 8
+
+	# maximum memory of the prefetched frames in bytes
+	# NOTE: For large quilts, fewer frames than ring_size are prefetched
+	ring_memory = 512 * 1024 * 1024
+
+	# number of worker threads for image sequences
+	# NOTE: movies are decoded sequentially by a single worker thread
+	sequence_workers = 3
+
+	# Inititalize the player for a Blender image
+	# NOTE: The color transform is obtained by LookingGlassAddonUI.color_transform()
+	#		on the main thread, since the worker threads must not use the Blender API
+	def __init__(self, image, color_transform):
+
+		# the image data that is required by the worker threads
+		self.key = (image.name_full, image.filepath)
+		self.source = image.source
+		self.filepath = bpy.path.abspath(image.filepath, library=image.library)
+		self.quilt_name = image.name
+		self.frame_duration = max(image.frame_duration, 1)
+		self.color_transform = color_transform
+
+		# memory of a decoded frame in bytes
+		# NOTE: If the image is not loaded yet, this is set by the first decoded frame
+		self.__frame_bytes = image.size[0] * image.size[1] * 4 or None
+
+		# for image sequences the frame number is the last number in the file name
+		self.__sequence_digits = None
+		self.__sequence_start = 0
+		if self.source == 'SEQUENCE':
+			directory, filename = os.path.split(self.filepath)
+			match = re.search(r'(\d+)(?!.*\d)', filename)
+			if match:
+				self.__sequence_digits = (directory, filename[:match.start()], filename[match.end():], len(match.group(1)))
+				self.__sequence_start = int(match.group(1))
+
+		# prefetched frames (frame index -> Future of a LookingGlassQuilt)
+		self.__frames = {}
+		self.__executor = ThreadPoolExecutor(max_workers=(1 if self.source == 'MOVIE' else self.sequence_workers))
+		self.__capture = None
+		self.__capture_position = None
+
+		# the requested and the displayed frame index
+		self.__requested = None
+		self.__displayed = None
+
+		# statistics
+		self.frames_displayed = 0
+		self.frames_dropped = 0
+
+		# NOTE: the bound method is stored, because application timers are
+		#		identified by the function object
+		self._display_timer = self.display_timer
+
+	# check if the player streams the given image with the given color transform
+	def is_playing(self, image, color_transform):
+		return self.key == (image.name_full, image.filepath) and self.color_transform == color_transform
+
+	# number of frames in the ring
+	def ring_length(self):
+
+		# if the frame size is not known yet, only the current frame is requested
+		if self.__frame_bytes is None: return 1
+
+		return max(1, min(self.ring_size, self.ring_memory // self.__frame_bytes, self.frame_duration))
+
+	# map a frame of the timeline to a frame index of the image
+	def frame_index(self, scene):
+		return (scene.frame_current - scene.frame_start) % self.frame_duration
+
+	# get the file path of a frame of an image sequence
+	def frame_filepath(self, index):
+
+		if self.__sequence_digits is None: return self.filepath
+
+		directory, prefix, suffix, digits = self.__sequence_digits
+		return os.path.join(directory, prefix + str(self.__sequence_start + index).zfill(digits) + suffix)
+
+	# read a frame and convert it to a LookingGlassQuilt (called by the worker threads)
+	def decode_frame(self, index):
+
+		# read the pixels of the frame
+		if self.source == 'MOVIE':
+
+			# open the movie on first use and only seek, if the frames are not read in order
+			if self.__capture is None: self.__capture = cv2.VideoCapture(self.filepath)
+			if self.__capture_position != index: self.__capture.set(cv2.CAP_PROP_POS_FRAMES, index)
+
+			success, pixels = self.__capture.read()
+			self.__capture_position = index + 1
+			if not success: return None
+
+		else:
+
+			pixels = cv2.imread(self.frame_filepath(index), cv2.IMREAD_UNCHANGED)
+			if pixels is None: return None
+
+		# convert to RGBA
+		if pixels.ndim == 2: pixels = cv2.cvtColor(pixels, cv2.COLOR_GRAY2RGBA)
+		elif pixels.shape[2] == 3: pixels = cv2.cvtColor(pixels, cv2.COLOR_BGR2RGBA)
+		else: pixels = cv2.cvtColor(pixels, cv2.COLOR_BGRA2RGBA)
+
+		# float data is stored in linear color space
+		transform = self.color_transform
+		if pixels.dtype not in (np.uint8, np.uint16): transform = ('NONE' if transform[0] == 'NONE' else 'LINEAR',) + transform[1:]
+
+		# if the color data is used as it is, convert 16 bit and float data to 8 bit
+		if LookingGlassAddonUI.is_identity_transform(transform):
+
+			if pixels.dtype == np.uint16: pixels = ((pixels.astype(np.uint32) + 128) // 257).astype(np.uint8)
+			elif pixels.dtype != np.uint8: pixels = pylio.PixelConverter.float_to_uint8(np.ascontiguousarray(pixels, dtype=np.float32))
+
+		# otherwise apply the color management of the image as in the quilt viewer
+		else:
+
+			if pixels.dtype == np.uint8: pixels = pixels.astype(np.float32) / 255
+			elif pixels.dtype == np.uint16: pixels = pixels.astype(np.float32) / 65535
+			else: pixels = np.ascontiguousarray(pixels, dtype=np.float32)
+
+			LookingGlassAddonUI.apply_color_transform(pixels.reshape(-1, 4)[:, :3], transform)
+			pixels = pylio.PixelConverter.float_to_uint8(pixels)
+
+		# remember the memory of a frame to limit the ring
+		self.__frame_bytes = pixels.nbytes
+
+		# the rows are flipped, since the quilt expects them in Blender's bottom-to-top order
+		height, width = pixels.shape[0:2]
+		pixels = np.ascontiguousarray(pixels[::-1])
+
+		return pylio.LightfieldImage.from_buffer(pylio.LookingGlassQuilt, pixels.reshape(-1), width, height, 4, quilt_name = self.quilt_name)
+
+	# prefetch the frames in the ring ahead of the given frame index
+	def prefetch(self, index):
+
+		# the frame indices of the ring
+		ring = [(index + offset) % self.frame_duration for offset in range(0, self.ring_length())]
+
+		# drop the frames outside of the ring
+		for frame in [frame for frame in self.__frames if frame not in ring]:
+			self.__frames.pop(frame).cancel()
+
+		# request the missing frames in the order they are displayed
+		for frame in ring:
+			if frame not in self.__frames: self.__frames[frame] = self.__executor.submit(self.decode_frame, frame)
+
+	# display the frame of the current timeline frame on the device
+	def show_frame(self, scene):
+
+		index = self.frame_index(scene)
+		if index == self.__requested: return
+
+		# a frame that was requested but not displayed yet is dropped
+		if self.__requested is not None and self.__requested != self.__displayed: self.frames_dropped += 1
+
+		# request the frame and the ones after it
+		self.__requested = index
+		self.prefetch(index)
+
+		# display the frame, if it is ready, otherwise as soon as it is ready
+		if self.display_timer() is not None and not bpy.app.timers.is_registered(self._display_timer):
+			bpy.app.timers.register(self._display_timer)
+
+	# send the requested frame to the device, as soon as it was decoded
+	def display_timer(self):
+
+		# if the requested frame is not decoded yet, check again later
+		future = self.__frames.get(self.__requested)
+		if future is None or future.cancelled(): return None
+		if not future.done(): return 0.005
+
+		# if the frame could be read
+		try:
+			quilt = future.result()
+		except Exception as e:
+			LookingGlassAddonLogger.error("Could not read frame %i of the quilt '%s': %s" % (self.__requested, self.quilt_name, e))
+			quilt = None
+
+		# if the quilt viewer is not active anymore, the frame is not displayed
+		if int(bpy.context.window_manager.addon_settings.renderMode) != 1 or not bpy.context.window_manager.addon_settings.ShowLightfieldWindow:
+			return None
+
+		if quilt is not None:
+
+			# display the quilt on the device
+			LookingGlassAddon.quiltViewerLightfieldImage = quilt
+			LookingGlassAddon.update_lightfield_window(1, quilt)
+			self.__displayed = self.__requested
+			self.frames_displayed += 1
+
+		return None
+
+	# stop the player and free all prefetched frames
+	def stop(self):
+
+		if bpy.app.timers.is_registered(self._display_timer): bpy.app.timers.unregister(self._display_timer)
+
+		# cancel the pending frames and wait for the running ones, before the
+		# movie is released
+		for future in self.__frames.values(): future.cancel()
+		self.__frames.clear()
+		self.__executor.shutdown(wait=True)
+		if self.__capture is not None: self.__capture.release()
+
+		LookingGlassAddonLogger.info(" [#] Stopped quilt playback of '%s' (displayed frames: %i, dropped: %i)." % (self.quilt_name, self.frames_displayed, self.frames_dropped))
+
+
+
 # ------------ CONTEXT OVERRIDE -------------
 # Class for managing a SpaceView3D context override for offscreen rendering
 class ContextOverride:
@@ -68,6 +372,14 @@ class ContextOverride:
 	__shading_restore_backup = {}
 	__overlay_restore_backup = {}
 
+	# ATTRIBUTE LISTS OF THE SHADING & OVERLAY SETTINGS
+	__shading_attributes = None
+	__overlay_attributes = None
+
+	# VIEW MATRICES CACHE
+	__view_matrices_key = None
+	__view_matrices = None
+
 	# Inititalize the context override
 	def __init__(self, context):
 
@@ -83,6 +395,11 @@ class ContextOverride:
 		# create an override context from the invoking context
 		self.__override = context.copy()
 
+		# original values of the overridden viewport settings
+		self.__settings_override_backup = {}
+		self.__shading_restore_backup = {}
+		self.__overlay_restore_backup = {}
+
 
 	# set a new context
 	def set_context(self, context):
@@ -125,39 +442,96 @@ class ContextOverride:
 		# return the projection matrix
 		return viewMatrix, projectionMatrix
 
+	# set up the cameras for all views at once
+	# NOTE: This is the vectorized version of setupVirtualCameraForView. The
+	#		matrices are cached until the camera, focal plane, view cone, or
+	#		aspect ratio change.
+	def setupVirtualCamerasForViews(self, total_views, view_cone, aspect, viewMatrix, projectionMatrix):
+
+		# get focal plane distance depending on synchronization mode
+		if self.__addon_settings_scene.toggleFocalSync and self.__addon_settings_scene.lookingglassCamera:
+			focalPlane = self.__addon_settings_scene.lookingglassCamera.data.dof.focus_distance
+		else:
+			focalPlane = self.__addon_settings_scene.focalPlane
+
+		# if nothing changed since the last call, return the cached matrices
+		key = (total_views, view_cone, aspect, focalPlane, tuple(map(tuple, viewMatrix)), tuple(map(tuple, projectionMatrix)))
+		if key == self.__view_matrices_key:
+			return self.__view_matrices
+
+		# The field of view set by the camera
+		fov = 2.0 * atan(1 / projectionMatrix[1][1])
+
+		# calculate cameraSize from its distance to the focal plane and the FOV
+		cameraDistance = focalPlane
+		cameraSize = cameraDistance * tan(fov / 2)
+
+		# start at viewCone * 0.5 and go up to -viewCone * 0.5
+		offsetAngles = np.linspace(0.5, -0.5, total_views) * radians(view_cone)
+
+		# calculate the offsets that the cameras should move
+		offsets = cameraDistance * np.tan(offsetAngles)
+
+		# translate the view matrices (position) by the calculated offsets in x-direction
+		viewMatrices = np.repeat(np.array(viewMatrix, dtype=np.float64)[np.newaxis], total_views, axis=0)
+		viewMatrices[:, 0, :] += offsets[:, np.newaxis] * viewMatrices[:, 3, :]
+
+		# modify the projection matrices, relative to the camera size and aspect ratio
+		projectionMatrices = np.repeat(np.array(projectionMatrix, dtype=np.float64)[np.newaxis], total_views, axis=0)
+		projectionMatrices[:, 0, 2] += offsets / (cameraSize * aspect)
+
+		# cache the matrices in the format required by draw_view3d
+		self.__view_matrices_key = key
+		self.__view_matrices = [(Matrix(viewMatrices[view].tolist()), Matrix(projectionMatrices[view].tolist())) for view in range(0, total_views)]
+
+		return self.__view_matrices
+
 
 
 	# Save the viewport settings
 	def saveViewportSettings(self):
 
-		# SHADING ATTRIBUTES
-		# define some exceptions that must not be taken into
-		attributeExceptions = ["__doc__", "__module__", "__slots__", "bl_rna", "rna_type", "color_type", "studio_light"]
+		# build the attribute lists once from the RNA definitions of the running
+		# Blender version, instead of scanning dir() on every call
+		if ContextOverride.__shading_attributes is None:
+			ContextOverride.__shading_attributes = self.__rna_attributes(bpy.types.View3DShading)
+			ContextOverride.__overlay_attributes = self.__rna_attributes(bpy.types.View3DOverlay)
 
+		# SHADING & OVERLAY ATTRIBUTES
 		# use the "space data" of the selected viewport
-		attributeList = dir(self.__override['space_data'].shading)
-		for attr in attributeList:
-
-			if not attr in attributeExceptions and hasattr(self.__override['space_data'].shading, attr):
-				#print("[SHADING]", attr, " = ", getattr(LookingGlassAddon.BlenderViewport.shading, attr))
+		for struct, attributes, backup in [(self.__override['space_data'].shading, ContextOverride.__shading_attributes, self.__shading_restore_backup), (self.__override['space_data'].overlay, ContextOverride.__overlay_attributes, self.__overlay_restore_backup)]:
+			for attr, is_array in attributes:
 
 				try:
-					self.__shading_restore_backup[attr] = getattr(self.__override['space_data'].shading, attr)
+					backup[attr] = tuple(getattr(struct, attr)) if is_array else getattr(struct, attr)
 				except Exception as e:
 					#print(" # ", e)
 					pass
 
-		attributeList = dir(self.__override['space_data'].overlay)
-		for attr in attributeList:
+	# list all writable, non-pointer attributes of a struct type
+	@staticmethod
+	def __rna_attributes(struct_type):
 
-			if not attr in attributeExceptions and hasattr(self.__override['space_data'].overlay, attr):
-				#print("[OVERLAY]", attr, " = ", getattr(self.__override['space_data'].overlay, attr))
+		# define some exceptions that must not be taken into
+		attributeExceptions = ["rna_type", "color_type", "studio_light"]
 
-				try:
-					self.__overlay_restore_backup[attr] = getattr(self.__override['space_data'].overlay, attr)
-				except Exception as e:
-					#print(" # ", e)
-					pass
+		return [(prop.identifier, getattr(prop, "is_array", False)) for prop in struct_type.bl_rna.properties if not prop.is_readonly and prop.type not in ('POINTER', 'COLLECTION') and not prop.identifier in attributeExceptions]
+
+	# override a single viewport setting and remember its original value
+	def __override_setting(self, struct, attr, value):
+
+		# if the setting was not overridden yet
+		key = (struct.as_pointer(), attr)
+		if not key in self.__settings_override_backup:
+
+			# nothing needs to be changed or restored
+			if getattr(struct, attr) == value:
+				return
+
+			# remember the original value
+			self.__settings_override_backup[key] = (struct, attr, getattr(struct, attr))
+
+		setattr(struct, attr, value)
 
 
 	# Update the viewport settings
@@ -167,39 +541,40 @@ class ContextOverride:
 		if space_data:
 			self.__override['space_data'] = space_data
 
-		# save all shading & overlay settings
-		self.saveViewportSettings()
+		shading = self.__override['space_data'].shading
+		overlay = self.__override['space_data'].overlay
 
 
 		# APPLY CUSTOM SETTINGS IF REQUIRED
+		# NOTE: only the settings that are changed here are remembered and restored
 		####################################################################
 
 		# if the custom settings shall be used OR the given space data is invalid
 		if (self.__addon_settings_scene.viewportMode == 'CUSTOM' and force_context_data == False) or space_data == None:
 
 			# SHADING ATTRIBUTES
-			self.__override['space_data'].shading.type = self.__addon_settings_scene.shadingMode
-			self.__override['space_data'].shading.show_xray = bool(self.__addon_settings_scene.viewport_show_xray)
-			self.__override['space_data'].shading.xray_alpha = float(self.__addon_settings_scene.viewport_xray_alpha)
-			self.__override['space_data'].shading.use_dof = bool(int(self.__addon_settings_scene.viewport_use_dof))
+			self.__override_setting(shading, 'type', self.__addon_settings_scene.shadingMode)
+			self.__override_setting(shading, 'show_xray', bool(self.__addon_settings_scene.viewport_show_xray))
+			self.__override_setting(shading, 'xray_alpha', float(self.__addon_settings_scene.viewport_xray_alpha))
+			self.__override_setting(shading, 'use_dof', bool(int(self.__addon_settings_scene.viewport_use_dof)))
 
 			# OVERLAY ATTRIBUTES: Guides
-			self.__override['space_data'].overlay.show_floor = bool(int(self.__addon_settings_scene.viewport_show_floor))
-			self.__override['space_data'].overlay.show_axis_x = bool(int(self.__addon_settings_scene.viewport_show_axes[0]))
-			self.__override['space_data'].overlay.show_axis_y = bool(int(self.__addon_settings_scene.viewport_show_axes[1]))
-			self.__override['space_data'].overlay.show_axis_z = bool(int(self.__addon_settings_scene.viewport_show_axes[2]))
-			self.__override['space_data'].overlay.grid_scale = float(self.__addon_settings_scene.viewport_grid_scale)
+			self.__override_setting(overlay, 'show_floor', bool(int(self.__addon_settings_scene.viewport_show_floor)))
+			self.__override_setting(overlay, 'show_axis_x', bool(int(self.__addon_settings_scene.viewport_show_axes[0])))
+			self.__override_setting(overlay, 'show_axis_y', bool(int(self.__addon_settings_scene.viewport_show_axes[1])))
+			self.__override_setting(overlay, 'show_axis_z', bool(int(self.__addon_settings_scene.viewport_show_axes[2])))
+			self.__override_setting(overlay, 'grid_scale', float(self.__addon_settings_scene.viewport_grid_scale))
 			# OVERLAY ATTRIBUTES: Objects
-			self.__override['space_data'].overlay.show_extras = bool(int(self.__addon_settings_scene.viewport_show_extras))
-			self.__override['space_data'].overlay.show_relationship_lines = bool(int(self.__addon_settings_scene.viewport_show_relationship_lines))
-			self.__override['space_data'].overlay.show_outline_selected = bool(int(self.__addon_settings_scene.viewport_show_outline_selected))
-			self.__override['space_data'].overlay.show_bones = bool(int(self.__addon_settings_scene.viewport_show_bones))
-			self.__override['space_data'].overlay.show_motion_paths = bool(int(self.__addon_settings_scene.viewport_show_motion_paths))
-			self.__override['space_data'].overlay.show_object_origins = bool(int(self.__addon_settings_scene.viewport_show_origins))
-			self.__override['space_data'].overlay.show_object_origins_all = bool(int(self.__addon_settings_scene.viewport_show_origins_all))
+			self.__override_setting(overlay, 'show_extras', bool(int(self.__addon_settings_scene.viewport_show_extras)))
+			self.__override_setting(overlay, 'show_relationship_lines', bool(int(self.__addon_settings_scene.viewport_show_relationship_lines)))
+			self.__override_setting(overlay, 'show_outline_selected', bool(int(self.__addon_settings_scene.viewport_show_outline_selected)))
+			self.__override_setting(overlay, 'show_bones', bool(int(self.__addon_settings_scene.viewport_show_bones)))
+			self.__override_setting(overlay, 'show_motion_paths', bool(int(self.__addon_settings_scene.viewport_show_motion_paths)))
+			self.__override_setting(overlay, 'show_object_origins', bool(int(self.__addon_settings_scene.viewport_show_origins)))
+			self.__override_setting(overlay, 'show_object_origins_all', bool(int(self.__addon_settings_scene.viewport_show_origins_all)))
 			# OVERLAY ATTRIBUTES: Geometry
-			self.__override['space_data'].overlay.show_wireframes = bool(int(self.__addon_settings_scene.viewport_show_wireframes))
-			self.__override['space_data'].overlay.show_face_orientation = bool(int(self.__addon_settings_scene.viewport_show_face_orientation))
+			self.__override_setting(overlay, 'show_wireframes', bool(int(self.__addon_settings_scene.viewport_show_wireframes)))
+			self.__override_setting(overlay, 'show_face_orientation', bool(int(self.__addon_settings_scene.viewport_show_face_orientation)))
 
 		# if the settings rely on a specific viewport / SpaceView3D
 		elif (self.__addon_settings_scene.viewportMode != 'CUSTOM' or force_context_data == True) and space_data != None:
@@ -208,47 +583,30 @@ class ContextOverride:
 			if space_data.shading.type == 'RENDERED' and self.__context.engine == 'CYCLES':
 
 				# change the shading type to SOLID
-				self.__override['space_data'].shading.type = 'SOLID'
+				self.__override_setting(shading, 'type', 'SOLID')
 
 				# notify user
 				self.report({"WARNING"}, "Render engine (%s) not supported in lightfield previews. Switched to SOLID mode." % self.__context.engine)
 
 		# always disable the hdri preview spheres
-		self.__override['space_data'].overlay.show_look_dev = False
+		self.__override_setting(overlay, 'show_look_dev', False)
 
 	# Restore the viewport settings
 	def restoreViewportSettings(self):
 
-		# SHADING ATTRIBUTES
-		# define some exceptions that must not be taken into
-		attributeExceptions = ["__doc__", "__module__", "__slots__", "bl_rna", "rna_type", "color_type", "studio_light", "type"]
-
-		# use the "space data" of the selected viewport
-		attributeList = dir(self.__override['space_data'].shading)
-		for attr in attributeList:
-
-			if not attr in attributeExceptions and hasattr(self.__override['space_data'].shading, attr):
-				if getattr(self.__override['space_data'].shading, attr) != self.__shading_restore_backup[attr]:
-				#print("[SHADING]", attr, " = ", self.__shading_restore_backup[attr])
+		# define some exceptions that are not restored
+		attributeExceptions = ["type"]
 
-					try:
-						setattr(self.__override['space_data'].shading, attr, self.__shading_restore_backup[attr])
-					except Exception as e:
-						#print(" # ", e)
-						pass
+		# restore only the settings that were overridden
+		for struct, attr, value in self.__settings_override_backup.values():
 
-		attributeList = dir(self.__override['space_data'].overlay)
-		for attr in attributeList:
-
-			if not attr in attributeExceptions and hasattr(self.__override['space_data'].overlay, attr):
-				if getattr(self.__override['space_data'].overlay, attr) != self.__overlay_restore_backup[attr]:
-				# print("[OVERLAY]", attr, " = ", self.__overlay_restore_backup[attr])
+			try:
+				if not attr in attributeExceptions and getattr(struct, attr) != value: setattr(struct, attr, value)
+			except Exception as e:
+				#print(" # ", e)
+				pass
 
-					try:
-						setattr(self.__override['space_data'].overlay, attr, self.__overlay_restore_backup[attr])
-					except Exception as e:
-						#print(" # ", e)
-						pass
+		self.__settings_override_backup.clear()
 
 	# CLASS PROPERTIES
 	# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -309,11 +667,27 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 	# lightfield
 	lightfield_image = None
 
+	# double buffering
+	use_double_buffering = False
+
 	# DRAWING OPERATION VARIABLES
 	modal_redraw = True
+	_redraw_timer = None
+	_redraw_scheduled = False
 	depsgraph_update_time = 0
 	skip_views = 1
 	restricted_viewcone_limit = 0
+	refinement_order = []
+	refinement_position = 0
+	use_quilt_texture = False
+
+	# REDRAW CULLING
+	redraws_executed = 0
+	redraws_skipped = 0
+
+	# FRAME PACING
+	frame_pacing = None
+	_statistics_redraw_time = 0
 
 	# DEBUGING VARIABLES
 	start_multi_view = 0
@@ -333,6 +707,28 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 	_shading_restore_backup = {}
 	_overlay_restore_backup = {}
 
+	# OBJECT VISIBILITY IN THE VIEW CONE AT THE LAST DEPSGRAPH UPDATE
+	_culling_visibility = None
+
+	# ALLOCATED OFFSCREENS (preset -> estimated GPU memory, least recently used first)
+	_offscreen_usage = None
+
+	# PLAYBACK STREAMING
+	playback_frames_requested = 0
+	playback_frames_rendered = 0
+	playback_frames_dropped = 0
+	_playback_streaming = False
+	_playback_low_resolution = False
+	_playback_frame = None
+
+	# DOUBLE BUFFERING
+	_lightfield_image_back = None
+	_display_executor = None
+	_display_future = None
+
+	# QUILT VIEWER PLAYBACK
+	quilt_player = None
+
 	# METHODS
 	# ++++++++++++++++++++++++++++++++++++++++++++++++++
 	# poll method
@@ -355,8 +751,12 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 		# log info
 		LookingGlassAddonLogger.info("Closing lightfield viewport ...")
 
-		# stop timer
-		context.window_manager.event_timer_remove(self.timerEvent)
+		# stop the redraw timer
+		if bpy.app.timers.is_registered(self._redraw_timer): bpy.app.timers.unregister(self._redraw_timer)
+		LookingGlassAddon.LightfieldViewport = None
+
+		# stop the quilt viewer playback
+		self.stop_quilt_player()
 
 		# remove the app handler that checks for depsgraph updates
 		bpy.app.handlers.depsgraph_update_post.remove(self.trackDepsgraphUpdates)
@@ -367,19 +767,14 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 
 		# log info
 		LookingGlassAddonLogger.info(" [#] Cancelled control handlers.")
+		LookingGlassAddonLogger.info(" [#] Redraws executed: %i, skipped by culling: %i" % (self.redraws_executed, self.redraws_skipped))
+		LookingGlassAddonLogger.info(" [#] Frame pacing: %s" % self.frame_pacing.summary())
 
-		# iterate through all presets
-		for i, preset in self.qs.items():
-
-			# loop through all required views
-			#for view in range(int((self.qs[self.preset]["total_views"] + 1) / 3), self.qs[self.preset]["total_views"] - int((self.qs[self.preset]["total_views"] + 1) / 3)):
-			for view in range(0, len(self.qs[i]["viewOffscreen"])):
-
-				# free the GPUOffscreen for the view rendering
-				self.qs[i]["viewOffscreen"][view].free()
+		# iterate through all presets with allocated offscreens
+		for i in list(self._offscreen_usage.keys()):
 
-			# delete the list of offscreen objects
-			self.qs[i]["viewOffscreen"].clear()
+			# free the GPUOffscreens of the preset
+			self.free_offscreens(i)
 
 		# log info
 		LookingGlassAddonLogger.info(" [#] Freed GPUOffscreens of the lightfield views.")
@@ -391,6 +786,15 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 		# set the button controls for the lightfield window to False
 		if context: context.window_manager.addon_settings.ShowLightfieldWindow = False
 
+		# wait until the last quilt was sent
+		if self._display_executor:
+			self.collect_display()
+			self._display_executor.shutdown()
+			self._display_executor = None
+
+		# delete the back buffer
+		self._lightfield_image_back = None
+
 		# clear the quilt
 		self.device.clear()
 
@@ -425,24 +829,26 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 		# set to the currently chosen quality
 		self.preset = self.last_preset = int(context.scene.addon_settings.quiltPreset)
 
+		# render all views into a single quilt texture?
+		self.use_quilt_texture = self.addon_settings_window_manager.viewport_use_quilt_texture
+
+		# send the quilts in the background while the next one is drawn?
+		self.use_double_buffering = self.addon_settings_window_manager.viewport_use_double_buffering
+		if self.use_double_buffering: self._display_executor = ThreadPoolExecutor(max_workers=1)
+
 		# get all quilt presets from pylio
 		self.qs = pylio.LookingGlassQuilt.formats.get()
 
-		# iterate through all presets
-		for i, preset in self.qs.items():
-
-			# create a list of offscreen objects for this preset
-			self.qs[i]["viewOffscreen"] = []
+		# reset the redraw culling
+		self._culling_visibility = {}
+		self.redraws_executed = self.redraws_skipped = 0
 
-			# loop through all required views
-			#for view in range(int((self.qs[self.preset]["total_views"] + 1) / 3), self.qs[self.preset]["total_views"] - int((self.qs[self.preset]["total_views"] + 1) / 3)):
-			for view in range(0, self.qs[i]["total_views"]):
-
-				# create a GPUOffscreen for the views
-				self.qs[i]["viewOffscreen"].append(gpu.types.GPUOffScreen(int(self.qs[i]["view_width"]), int(self.qs[i]["view_height"])))
+		# the GPUOffscreens of a preset are allocated on first use
+		self._offscreen_usage = {}
+		LookingGlassAddon.viewport_offscreen_memory = 0
 
 		# log info
-		LookingGlassAddonLogger.info(" [#] Prepared GPUOffscreens for view rendering.")
+		LookingGlassAddonLogger.info(" [#] Prepared lazy GPUOffscreen allocation for %s rendering (budget: %i MB)." % ("quilt" if self.use_quilt_texture else "view", bpy.context.preferences.addons[__package__].preferences.viewport_offscreen_budget))
 
 
 		# PREPARE THE OVERRIDE CONTEXT THAT CONTAINS THE RENDER SETTINGS
@@ -479,12 +885,21 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 
 		# HANDLERS FOR OPERATOR CONTROL
 		# ++++++++++++++++++++++++++++++
-		# Create timer event that runs every millisecond to check if the lightfield needs to be updated
-		self.timerEvent = context.window_manager.event_timer_add(0.01, window=context.window)
+		# redraws are scheduled as application timers by the handlers above,
+		# so the operator does not run while the scene is idle
+		# NOTE: the bound method is stored, because application timers are
+		#		identified by the function object
+		self._redraw_timer = self.redraw_timer
+		self._redraw_scheduled = False
+		self.frame_pacing = FramePacing()
+		LookingGlassAddon.LightfieldViewport = self
 
 		# add the modal handler
 		context.window_manager.modal_handler_add(self)
 
+		# schedule the first redraw
+		self.schedule_redraw()
+
 		# log info
 		LookingGlassAddonLogger.info(" [#] Initialized modal operator.")
 		LookingGlassAddonLogger.info(" [#] Done.")
@@ -525,62 +940,147 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 		# Control lightfield redrawing in viewport mode
 		################################################################
 
-		# if the TIMER event for the lightfield rendering is called AND the automatic render mode is active
-		if event.type == 'TIMER' or event.type == 'Z':
+		# if the user requested a redraw via the keyboard
+		if event.type == 'Z':
 
-			# if something has changed OR the user requested a manual redrawing
-			if self.modal_redraw or (not self.modal_redraw and ((self.depsgraph_update_time > 0 and time.time() - self.depsgraph_update_time > LookingGlassAddon.low_resolution_preview_timout) or context.window_manager.addon_settings.viewport_manual_refresh == True)):
+			# redraw the light field
+			self.update_lightfield(context)
 
-				# update the viewport settings
-				self.updateViewportSettings(context)
+			# running modal
+			return {'RUNNING_MODAL'}
 
-				if (not self.modal_redraw and ((self.depsgraph_update_time > 0 and time.time() - self.depsgraph_update_time > LookingGlassAddon.low_resolution_preview_timout) or context.window_manager.addon_settings.viewport_manual_refresh == True)):
+		# pass event through
+		return {'PASS_THROUGH'}
 
-					# reset time of last depsgraph update
-					self.depsgraph_update_time = 0
+	# redraw the light field, if something has changed
+	def update_lightfield(self, context):
 
-					# reset status variable for manual refreshes
-					context.window_manager.addon_settings.viewport_manual_refresh = False
+		# if something has changed OR the user requested a manual redrawing
+		if self.modal_redraw or (not self.modal_redraw and ((self.depsgraph_update_time > 0 and time.time() - self.depsgraph_update_time > LookingGlassAddon.low_resolution_preview_timout) or context.window_manager.addon_settings.viewport_manual_refresh == True)):
 
-					# set to the currently chosen quality
-					self.preset = int(context.scene.addon_settings.quiltPreset)
+			# start a new frame
+			self.frame_pacing.begin_frame()
 
-					# dont skip any views
-					self.skip_views = 1
-					self.restricted_viewcone_limit = 0
+			# update the viewport settings
+			self.updateViewportSettings(context)
+
+			if (not self.modal_redraw and ((self.depsgraph_update_time > 0 and time.time() - self.depsgraph_update_time > LookingGlassAddon.low_resolution_preview_timout) or context.window_manager.addon_settings.viewport_manual_refresh == True)):
+
+				# reset time of last depsgraph update
+				self.depsgraph_update_time = 0
+
+				# reset status variable for manual refreshes
+				context.window_manager.addon_settings.viewport_manual_refresh = False
+
+				# set to the currently chosen quality
+				self.preset = int(context.scene.addon_settings.quiltPreset)
+
+				# dont skip any views
+				self.skip_views = 1
+				self.restricted_viewcone_limit = 0
+				self.refinement_order = []
+
+				# set to redraw
+				self.modal_redraw = True
+
+			# render the views
+			self.render_view(context)
+
+			# Lightfield Viewport
+			if int(self.addon_settings_window_manager.renderMode) == 0 and self.lightfield_image:
+
+				# if double buffering is used OR an animation is streamed
+				if self.use_double_buffering or self._playback_streaming:
 
- 					# set to redraw
-					self.modal_redraw = True
+					# count the rendered frames of the playback
+					if self._playback_streaming: self.playback_frames_rendered += 1
 
-				# render the views
-				self.render_view(context)
+					# send the quilt in the background and swap the buffers
+					self.display_double_buffered()
 
-				# Lightfield Viewport
-				if int(self.addon_settings_window_manager.renderMode) == 0 and self.lightfield_image:
+				else:
 
 					# update the lightfield displayed on the device
 					LookingGlassAddon.update_lightfield_window(int(self.addon_settings_window_manager.renderMode), self.lightfield_image)
+					if self.device: self.frame_pacing.record_display(self.device.service)
 
-				# Quilt Viewer
-				elif int(self.addon_settings_window_manager.renderMode) == 1 and LookingGlassAddon.quiltViewerLightfieldImage:
+			# Quilt Viewer
+			elif int(self.addon_settings_window_manager.renderMode) == 1 and LookingGlassAddon.quiltViewerLightfieldImage:
 
-					# update the lightfield displayed on the device
-					LookingGlassAddon.update_lightfield_window(int(self.addon_settings_window_manager.renderMode), LookingGlassAddon.quiltViewerLightfieldImage)
+				# update the lightfield displayed on the device
+				LookingGlassAddon.update_lightfield_window(int(self.addon_settings_window_manager.renderMode), LookingGlassAddon.quiltViewerLightfieldImage)
 
-				else:
+			else:
 
-					# update the lightfield displayed on the device: show the demo quilt
-					LookingGlassAddon.update_lightfield_window(-1, None)
+				# update the lightfield displayed on the device: show the demo quilt
+				LookingGlassAddon.update_lightfield_window(-1, None)
 
-				# running modal
-				return {'RUNNING_MODAL'}
+			# update the frame statistics in the UI
+			if self.addon_settings_window_manager.viewport_show_frame_statistics and time.time() - self._statistics_redraw_time > 0.5:
+				self._statistics_redraw_time = time.time()
+				for window in context.window_manager.windows:
+					for area in window.screen.areas:
+						if area.type == 'VIEW_3D':
+							for region in area.regions:
+								if region.type == 'UI': region.tag_redraw()
 
-		# pass event through
-		return {'PASS_THROUGH'}
+	# schedule a redraw of the light field
+	# NOTE: Multiple requests before the redraw are coalesced into one and the
+	#		redraws are limited to the maximum frame rate
+	def schedule_redraw(self):
+
+		# if no redraw is scheduled yet
+		if not self._redraw_scheduled:
+
+			self._redraw_scheduled = True
+
+			# wait until the minimum frame time since the last frame passed
+			bpy.app.timers.register(self._redraw_timer, first_interval=self.frame_pacing.delay(bpy.context.window_manager.addon_settings.viewport_max_fps))
+
+	# application timer that redraws the light field
+	# NOTE: returns the time until the next redraw or None, if the live view is idle
+	def redraw_timer(self):
+
+		# if the lightfield viewport was deactivated, the modal operator cancels itself
+		if not bpy.context.window_manager.addon_settings.ShowLightfieldWindow:
+			self._redraw_scheduled = False
+			return None
+
+		# update the internal variable for the settings
+		self.addon_settings_window_manager = bpy.context.window_manager.addon_settings
+		self.addon_settings_scene = bpy.context.scene.addon_settings
+
+		# if the animation playback stopped during the playback streaming
+		if self._playback_streaming and not self.is_animation_playing():
+
+			# redraw with full quality
+			self.stop_playback_streaming(bpy.context)
+
+		# redraw the light field
+		self.update_lightfield(bpy.context)
+
+		# if further redraws are required (e.g., for the progressive refinement)
+		if self.modal_redraw:
+			return self.frame_pacing.delay(bpy.context.window_manager.addon_settings.viewport_max_fps)
+
+		# if an animation is streamed, check regularly if the playback stopped
+		if self._playback_streaming:
+			return bpy.context.scene.render.fps_base / bpy.context.scene.render.fps * 2
+
+		# if the full quality redraw after the last user interaction is pending
+		if self.depsgraph_update_time > 0:
+			return max(0.0, LookingGlassAddon.low_resolution_preview_timout - (time.time() - self.depsgraph_update_time)) + 0.01
+
+		# otherwise the live view is idle
+		self._redraw_scheduled = False
+		return None
 
 	# Application handler that continously checks for changes of the depsgraph
 	def trackDepsgraphUpdates(self, scene, depsgraph):
 
+		# if the quilt viewer is not active, stop its playback
+		if int(self.addon_settings_window_manager.renderMode) != 1: self.stop_quilt_player()
+
 		# if no quilt rendering is currently Running
 		if not LookingGlassAddon.RenderInvoked:
 
@@ -588,14 +1088,56 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 			if (int(self.addon_settings_window_manager.renderMode) == 0 and int(self.addon_settings_window_manager.lightfieldMode) == 0) and len(depsgraph.updates.values()) > 0:
 				# print("DEPSGRAPH UPDATE: ", depsgraph.updates.values())
 
+				# if the redraw culling is active AND none of the changes can be seen in the quilt
+				if self.addon_settings_window_manager.viewport_use_redraw_culling and not self.is_update_visible(scene, depsgraph):
+
+					# skip the redraw
+					self.redraws_skipped += 1
+					LookingGlassAddonLogger.debug(" [#] Skipped redraw, because the changes are outside of the view cone (executed: %i, skipped: %i)" % (self.redraws_executed, self.redraws_skipped))
+					return
+
+				self.redraws_executed += 1
+
 				# remember time of last depsgraph update
 				self.depsgraph_update_time = time.time()
 
 				# allow an update of the Looking Glass viewport
 				self.modal_redraw = True
 
+				# if the playback streaming is activated AND the animation is playing
+				if self.addon_settings_window_manager.viewport_use_playback_streaming and self.is_animation_playing():
+
+					# start the streaming
+					if not self._playback_streaming:
+						self._playback_streaming = True
+						self._playback_low_resolution = False
+						self.playback_frames_requested = self.playback_frames_rendered = self.playback_frames_dropped = 0
+						LookingGlassAddonLogger.info(" [#] Started playback streaming.")
+
+					# remember the requested frame
+					# NOTE: if it changes again before the redraw, the frame is dropped
+					if self._playback_frame != scene.frame_current:
+						self._playback_frame = scene.frame_current
+						self.playback_frames_requested += 1
+
+					# if drawing and reading a quilt takes longer than a frame of the
+					# animation, fall back to the low-resolution preview for this playback
+					if not self._playback_low_resolution and self.frame_pacing.average('draw') + self.frame_pacing.average('readback') > scene.render.fps_base / scene.render.fps * 1000:
+						self._playback_low_resolution = True
+						LookingGlassAddonLogger.info(" [#] Playback streaming cannot keep up with %.2f fps. Falling back to the low-resolution preview." % (scene.render.fps / scene.render.fps_base))
+
+					# set the preset
+					if self._playback_low_resolution: self.preset = int(list(pylio.LookingGlassQuilt.formats.get().keys())[-1])
+					else: self.preset = int(scene.addon_settings.quiltPreset)
+
+					# draw all views without a delayed redraw
+					self.skip_views = 1
+					self.restricted_viewcone_limit = 0
+					self.refinement_order = []
+					self.depsgraph_update_time = 0
+
 				# if the "no preview" is activated
-				if self.addon_settings_window_manager.viewport_use_preview_mode and self.addon_settings_window_manager.lightfield_preview_mode == '0':
+				elif self.addon_settings_window_manager.viewport_use_preview_mode and self.addon_settings_window_manager.lightfield_preview_mode == '0':
 
 					# don't allow an update of the Looking Glass viewport
 					self.modal_redraw = False
@@ -627,12 +1169,30 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 					# only show the center 33% of all views
 					self.restricted_viewcone_limit = int(self.qs[self.preset]["total_views"] / 3)
 
+				# if the "progressive refinement preview" is activated
+				elif self.addon_settings_window_manager.viewport_use_preview_mode and self.addon_settings_window_manager.lightfield_preview_mode == '5':
+
+					# set to the currently chosen quality
+					self.preset = int(scene.addon_settings.quiltPreset)
+					self.skip_views = 1
+
+					# restart the refinement with the central views
+					self.refinement_order = self.refinement_schedule(self.qs[self.preset]["total_views"])
+					self.refinement_position = 0
+
+					# the refinement converges to full quality by itself, so no
+					# delayed redraw is required after the user interaction finished
+					self.depsgraph_update_time = 0
+
 				else:
 
 					# set to the currently chosen quality
 					self.preset = int(scene.addon_settings.quiltPreset)
 					self.skip_views = 1
 
+				# schedule the redraw
+				self.schedule_redraw()
+
 			# if quilt viewer is active AND an image is selected
 			elif int(self.addon_settings_window_manager.renderMode) == 1 and self.addon_settings_window_manager.quiltImage != None:
 
@@ -663,6 +1223,99 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 				# update the quilt image, if something had changed
 				if changed == True: self.addon_settings_window_manager.quiltImage = self.addon_settings_window_manager.quiltImage
 
+				# stream image sequences and movies in step with the timeline
+				self.update_quilt_player(scene)
+
+	# start, switch, or stop the playback of the selected quilt in the quilt viewer
+	def update_quilt_player(self, scene):
+
+		image = self.addon_settings_window_manager.quiltImage
+
+		# if the selected quilt has no frames to stream
+		if image is None or image.source not in ('SEQUENCE', 'MOVIE'):
+			self.stop_quilt_player()
+			return
+
+		# get the color management of the quilt
+		# NOTE: If the settings are not supported, the "Standard" view transform is used
+		color_transform = LookingGlassAddonUI.color_transform(scene, image)
+		supported = color_transform is not None
+		if not supported: color_transform = ('SRGB', 'Standard', 0.0, 1.0)
+
+		# if another quilt or other color management settings were selected,
+		# start a new player
+		if self.quilt_player and not self.quilt_player.is_playing(image, color_transform):
+			self.stop_quilt_player()
+		if self.quilt_player is None:
+			self.quilt_player = QuiltPlayer(image, color_transform)
+			LookingGlassAddonLogger.info(" [#] Started quilt playback of '%s' (%i frames)." % (image.name, self.quilt_player.frame_duration))
+			if not supported: LookingGlassAddonLogger.warning("The color management settings of '%s' are not supported for the playback. The 'Standard' view transform is used." % image.name)
+
+		# show the frame of the timeline
+		self.quilt_player.show_frame(scene)
+
+	# stop the playback of the quilt viewer and free the prefetched frames
+	def stop_quilt_player(self):
+
+		if self.quilt_player:
+			self.quilt_player.stop()
+			self.quilt_player = None
+
+
+	# test if the changes of a depsgraph update can be seen in the quilt
+	def is_update_visible(self, scene, depsgraph):
+
+		# select camera that belongs to the view
+		camera = scene.addon_settings.lookingglassCamera
+		if camera is None or getattr(self, "device", None) is None:
+			return True
+
+		# get focal plane distance depending on synchronization mode
+		if scene.addon_settings.toggleFocalSync: focal_plane = camera.data.dof.focus_distance
+		else: focal_plane = scene.addon_settings.focalPlane
+
+		# get the planes of the view cone in camera coordinates
+		planes = FrustumRenderer.view_cone_planes(scene, camera, self.device.viewCone, focal_plane)
+
+		# get the camera's modelview matrix and correct for the camera scaling
+		view_matrix = camera.matrix_world.copy()
+		view_matrix = view_matrix @ Matrix.Scale(1/camera.scale.x, 4, (1, 0, 0))
+		view_matrix = view_matrix @ Matrix.Scale(1/camera.scale.y, 4, (0, 1, 0))
+		view_matrix = view_matrix @ Matrix.Scale(1/camera.scale.z, 4, (0, 0, 1))
+		world_to_camera = view_matrix.inverted_safe()
+
+		# sort the updated objects from all other updated data-blocks
+		objects = [update.id for update in depsgraph.updates if isinstance(update.id, bpy.types.Object)]
+		object_data = {obj.original.data for obj in objects if obj.original.data}
+
+		for update in depsgraph.updates:
+
+			# object data is tested via its object and the scene is updated
+			# together with its objects
+			if isinstance(update.id, bpy.types.Object) or update.id.original in object_data or (isinstance(update.id, bpy.types.Scene) and objects):
+				continue
+
+			# other data-blocks (e.g., materials, worlds, cameras) can affect
+			# any view
+			return True
+
+		# test all updated objects
+		visible = False
+		for obj in objects:
+
+			# the camera and lights affect all views
+			if obj.original == camera or obj.type in ('LIGHT', 'LIGHT_PROBE'):
+				visible = True
+				continue
+
+			# an object is visible, if it is not hidden and intersects the view cone
+			in_view_cone = obj.original.visible_get() and FrustumRenderer.is_in_view_cone(obj, planes, world_to_camera)
+
+			# the quilt changes, if the object is visible now or was visible before
+			if in_view_cone or self._culling_visibility.get(obj.original.name, True): visible = True
+			self._culling_visibility[obj.original.name] = in_view_cone
+
+		return visible
 
 	# this function is called as a draw handler to enable the Looking Glass Addon
 	# to keep track of the SpaceView3D which is currently manipulated by the User
@@ -683,6 +1336,12 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 		# use the context override class method
 		return self._override.setupVirtualCameraForView(view, self.qs[self.preset]["total_views"], self.device.viewCone, self.device.aspect, viewMatrix, projectionMatrix)
 
+	# set up the cameras for all views
+	def setupVirtualCamerasForViews(self, viewMatrix, projectionMatrix):
+
+		# use the context override class method
+		return self._override.setupVirtualCamerasForViews(self.qs[self.preset]["total_views"], self.device.viewCone, self.device.aspect, viewMatrix, projectionMatrix)
+
 
 	# Save the viewport settings
 	def saveViewportSettings(self):
@@ -740,6 +1399,219 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 		return self._override.restoreViewportSettings()
 
 
+	# order in which the views are drawn by the progressive refinement:
+	# the central view first, then the remaining views on successively finer
+	# interleaved grids, each grid sorted by the distance to the center
+	@staticmethod
+	def refinement_schedule(total_views):
+
+		center = total_views // 2
+		order = [center]
+		scheduled = {center}
+
+		# start with the coarsest grid that still contains more than one view
+		step = 1
+		while step * 2 < total_views: step *= 2
+
+		# refine the grid until every view is scheduled
+		while step >= 1:
+			views = [view for view in range(center % step, total_views, step) if view not in scheduled]
+			views.sort(key=lambda view: abs(view - center))
+			order.extend(views)
+			scheduled.update(views)
+			step //= 2
+
+		return order
+
+	# fill the views that were not drawn yet with the nearest drawn view
+	def fill_unrendered_views(self, rendered):
+
+		for view in range(0, self.qs[self.preset]["total_views"]):
+			if view not in rendered:
+				nearest = min(rendered, key=lambda rendered_view: abs(rendered_view - view))
+				self.lightfield_image.views[view]['view'].data[:] = self.lightfield_image.views[nearest]['view'].data
+
+	# create a LightfieldImage for the current quilt preset
+	def new_lightfield_image(self):
+
+		# TODO: Actually we would use "RGB" and a numpy array with 3
+		#		color channels, because that would be more efficient.
+		#		But we can't read in RGB mode to gpu.types.Buffer
+		#	   due to Blender's default OpenGL settings:
+		#
+		#	   https://developer.blender.org/T91828
+		#
+		#		If we don't so it that way, it causes crashes:
+		#
+		#		https://github.com/regcs/AliceLG/issues/59
+		#
+		#		The Blender behaviour was fixed for v.3.0+. At the
+		#		point when Alice/LG does not support 2.93 anymore,
+		#		we can change this. (because the Blender fix is not)
+
+		# create a pylio LightfieldImage
+		lightfield_image = pylio.LightfieldImage.new(pylio.LookingGlassQuilt, id=self.preset, colormode='RGBA')
+
+		# create a new set of LightfieldViews
+		lightfield_image.set_views([pylio.LightfieldView(np.empty((self.qs[self.preset]["view_height"], self.qs[self.preset]["view_width"], 4), dtype=np.uint8), pylio.LightfieldView.formats.numpyarray) for view in range(0, self.qs[self.preset]["total_views"])], pylio.LightfieldView.formats.numpyarray)
+
+		# if all views are rendered into a single quilt texture, back
+		# the views with a contiguous quilt buffer for the readback
+		if self.use_quilt_texture: lightfield_image.quilt_buffer()
+
+		return lightfield_image
+
+	# send the current quilt to the device in the background and draw the next
+	# quilt into the other buffer
+	def display_double_buffered(self):
+
+		# wait until the previous quilt was sent, so that its buffer can be reused
+		self.collect_display()
+
+		# create the worker for the background transfers
+		if self._display_executor is None: self._display_executor = ThreadPoolExecutor(max_workers=1)
+
+		# get the device and the display settings on the main thread, so that
+		# the worker only sends the quilt
+		send = LookingGlassAddon.prepare_lightfield_window(0, self.lightfield_image)
+
+		# send the current quilt, tagged with its frame during the playback streaming
+		if send and self._playback_streaming: self._display_future = self._display_executor.submit(self.display_frame, send, self._playback_frame)
+		elif send: self._display_future = self._display_executor.submit(send)
+
+		# main-thread sends wait for this send (see LookingGlassAddon.update_lightfield_window)
+		LookingGlassAddon.display_future = self._display_future
+
+		# swap the buffers
+		self.lightfield_image, self._lightfield_image_back = self._lightfield_image_back, self.lightfield_image
+
+	# send the quilt of an animation frame, unless the timeline already moved on
+	# NOTE: This is called by the worker thread with the function returned by
+	#		LookingGlassAddon.prepare_lightfield_window()
+	def display_frame(self, send, frame):
+
+		# drop stale frames
+		if frame != self._playback_frame:
+			self.playback_frames_dropped += 1
+			return
+
+		# update the lightfield displayed on the device
+		send()
+
+	# check if an animation is played in any window
+	@staticmethod
+	def is_animation_playing():
+
+		return any(window.screen.is_animation_playing for window in bpy.context.window_manager.windows if window.screen)
+
+	# stop the playback streaming and redraw with full quality
+	def stop_playback_streaming(self, context):
+
+		self._playback_streaming = False
+
+		# wait until the last frame was sent
+		self.collect_display()
+
+		# set to the currently chosen quality
+		self.preset = int(context.scene.addon_settings.quiltPreset)
+		self.modal_redraw = True
+
+		# log info
+		LookingGlassAddonLogger.info(" [#] Stopped playback streaming (requested frames: %i, rendered: %i, dropped stale: %i, low-resolution fallback: %s)." % (self.playback_frames_requested, self.playback_frames_rendered, self.playback_frames_dropped, self._playback_low_resolution))
+
+	# wait for the quilt that is sent in the background
+	def collect_display(self):
+
+		# if a quilt is sent
+		if self._display_future:
+
+			try:
+				self._display_future.result()
+				if self.device: self.frame_pacing.record_display(self.device.service)
+
+			except Exception as e:
+				LookingGlassAddonLogger.error("Could not send the quilt to the Looking Glass: %s" % e)
+
+			self._display_future = None
+
+	# estimate the GPU memory required by the offscreens of a preset
+	def offscreen_memory(self, preset):
+
+		# each pixel has an RGBA8 color and a 32 bit depth value
+		view_size = int(self.qs[preset]["view_width"]) * int(self.qs[preset]["view_height"]) * 8
+
+		# one reused view offscreen and one quilt offscreen
+		if self.use_quilt_texture: return view_size * (1 + self.qs[preset]["columns"] * self.qs[preset]["rows"])
+
+		# one offscreen per view
+		return view_size * self.qs[preset]["total_views"]
+
+	# allocate the GPUOffscreens of a preset on first use and evict the least
+	# recently used presets if the GPU memory budget is exceeded
+	def allocate_offscreens(self, preset):
+
+		# if the offscreens of this preset already exist
+		if preset in self._offscreen_usage:
+
+			# mark the preset as the most recently used one
+			self._offscreen_usage[preset] = self._offscreen_usage.pop(preset)
+			return
+
+		# memory budget in bytes
+		budget = bpy.context.preferences.addons[__package__].preferences.viewport_offscreen_budget * 1024 * 1024
+		memory = self.offscreen_memory(preset)
+
+		# evict the least recently used presets until the offscreens fit into the budget
+		while self._offscreen_usage and sum(self._offscreen_usage.values()) + memory > budget:
+			self.free_offscreens(next(iter(self._offscreen_usage)))
+
+		# if the preset alone exceeds the budget, it is allocated anyway
+		if memory > budget: LookingGlassAddonLogger.warning("The GPUOffscreens of quilt preset %i require %.1f MB, which exceeds the live view budget of %i MB." % (preset, memory / 1024 / 1024, budget / 1024 / 1024))
+
+		# create a list of offscreen objects for this preset
+		self.qs[preset]["viewOffscreen"] = []
+
+		# if all views are rendered into a single quilt texture
+		if self.use_quilt_texture:
+
+			# create one GPUOffscreen that is reused for all views
+			self.qs[preset]["viewOffscreen"].append(gpu.types.GPUOffScreen(int(self.qs[preset]["view_width"]), int(self.qs[preset]["view_height"])))
+
+			# create a GPUOffscreen for the whole quilt
+			self.qs[preset]["quiltOffscreen"] = gpu.types.GPUOffScreen(int(self.qs[preset]["view_width"] * self.qs[preset]["columns"]), int(self.qs[preset]["view_height"] * self.qs[preset]["rows"]))
+
+		else:
+
+			# loop through all required views
+			for view in range(0, self.qs[preset]["total_views"]):
+
+				# create a GPUOffscreen for the views
+				self.qs[preset]["viewOffscreen"].append(gpu.types.GPUOffScreen(int(self.qs[preset]["view_width"]), int(self.qs[preset]["view_height"])))
+
+		# update the memory accounting
+		self._offscreen_usage[preset] = memory
+		LookingGlassAddon.viewport_offscreen_memory = sum(self._offscreen_usage.values())
+
+		# log info
+		LookingGlassAddonLogger.info(" [#] Allocated GPUOffscreens for quilt preset %i (%.1f MB, in use: %.1f of %i MB)." % (preset, memory / 1024 / 1024, LookingGlassAddon.viewport_offscreen_memory / 1024 / 1024, budget / 1024 / 1024))
+
+	# free the GPUOffscreens of a preset
+	def free_offscreens(self, preset):
+
+		# free the GPUOffscreens for the view rendering
+		for offscreen in self.qs[preset].pop("viewOffscreen", []):
+			offscreen.free()
+
+		# free the GPUOffscreen for the quilt rendering
+		if "quiltOffscreen" in self.qs[preset]: self.qs[preset].pop("quiltOffscreen").free()
+
+		# update the memory accounting
+		memory = self._offscreen_usage.pop(preset, 0)
+		LookingGlassAddon.viewport_offscreen_memory = sum(self._offscreen_usage.values())
+
+		# log info
+		LookingGlassAddonLogger.info(" [#] Freed GPUOffscreens of quilt preset %i (%.1f MB, in use: %.1f MB)." % (preset, memory / 1024 / 1024, LookingGlassAddon.viewport_offscreen_memory / 1024 / 1024))
+
 	@staticmethod
 	def from_texture_to_numpy_array(offscreen, array):
 		"""copy the current texture to a numpy array"""
@@ -780,9 +1652,61 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 				# write pixel data from texture into the buffer (numpy array)
 				framebuffer.read_color(0, 0, array.shape[1], array.shape[0], array.shape[2], 0, 'UBYTE', data=buffer)
 
+	@staticmethod
+	def clear_offscreen(offscreen):
+		"""clear the color data of an offscreen"""
+
+		with offscreen.bind():
+
+			# for Blender versions earlier than 3.0 (prior to the major BGL changes)
+			if bpy.app.version < (3, 0, 0):
+
+				bgl.glClearColor(0.0, 0.0, 0.0, 0.0)
+				bgl.glClear(bgl.GL_COLOR_BUFFER_BIT)
+
+			# for Blender versions later than 3.0 (after the major BGL changes)
+			else:
+
+				gpu.state.active_framebuffer_get().clear(color=(0.0, 0.0, 0.0, 0.0))
+
+	# draw the texture of a view offscreen into its tile of the quilt offscreen
+	@staticmethod
+	def copy_view_to_quilt(view, columns, rows, view_offscreen, quilt_offscreen):
+
+		# calculate view grid indices in the quilt
+		# NOTE: the first view is in the bottom left corner, which is also the
+		#		origin of the framebuffer
+		view_ix = view % columns
+		view_iy = floor(view / columns)
+
+		# get the texture of the view offscreen
+		if bpy.app.version < (3, 0, 0): texture = view_offscreen.color_texture
+		else: texture = view_offscreen.texture_color
+
+		with quilt_offscreen.bind():
+			with gpu.matrix.push_pop(), gpu.matrix.push_pop_projection():
+
+				# reset matrices -> use normalized device coordinates [-1, 1]
+				gpu.matrix.load_matrix(Matrix.Identity(4))
+				gpu.matrix.load_projection_matrix(Matrix.Identity(4))
+
+				# copy the pixels without blending
+				blend = gpu.state.blend_get()
+				gpu.state.blend_set('NONE')
+
+				# draw the view texture into its tile
+				draw_texture_2d(texture, (-1 + 2 * view_ix / columns, -1 + 2 * view_iy / rows), 2 / columns, 2 / rows)
+
+				# restore the previous blend mode
+				gpu.state.blend_set(blend)
+
 	# Draw function which copies data from the 3D View
 	def render_view(self, context):
 
+		# NOTE: The debug messages are only formatted if they are logged, since
+		#		this runs for every view of every frame
+		debug = LookingGlassAddonLogger.isEnabledFor(logging.DEBUG)
+
 		# if the quilt must be redrawn
 		if (self.addon_settings_scene.lookingglassCamera or LookingGlassAddon.BlenderViewport):
 
@@ -791,8 +1715,11 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 
 			self.start_multi_view = time.time()
 
+			# make sure the GPUOffscreens of the preset exist
+			self.allocate_offscreens(self.preset)
+
 			# if the quilt and view settings changed
-			if self.last_preset != self.preset or self.lightfield_image == None:
+			if self.last_preset != self.preset:
 
 				# update the preset variable
 				self.last_preset = self.preset
@@ -803,32 +1730,25 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 				# delete the current LightfieldImage
 				if self.lightfield_image: self.lightfield_image = None
 
-				# TODO: Actually we would use "RGB" and a numpy array with 3
-				#		color channels, because that would be more efficient.
-				#		But we can't read in RGB mode to gpu.types.Buffer
-				#	   due to Blender's default OpenGL settings:
-				#
-				#	   https://developer.blender.org/T91828
-				#
-				#		If we don't so it that way, it causes crashes:
-				#
-				#		https://github.com/regcs/AliceLG/issues/59
-				#
-				#		The Blender behaviour was fixed for v.3.0+. At the
-				#		point when Alice/LG does not support 2.93 anymore,
-				#		we can change this. (because the Blender fix is not)
-
-				# create a pylio LightfieldImage
-				self.lightfield_image = pylio.LightfieldImage.new(pylio.LookingGlassQuilt, id=self.preset, colormode='RGBA')
-
-				# create a new set of LightfieldViews
-				self.lightfield_image.set_views([pylio.LightfieldView(np.empty((self.qs[self.preset]["view_height"], self.qs[self.preset]["view_width"], 4), dtype=np.uint8), pylio.LightfieldView.formats.numpyarray) for view in range(0, self.qs[self.preset]["total_views"])], pylio.LightfieldView.formats.numpyarray)
-
-			LookingGlassAddonLogger.debug("Start rendering lightfield views ...")
-			LookingGlassAddonLogger.debug(" [#] View dimensions: %i x %i" % (self.qs[self.preset]["view_width"], self.qs[self.preset]["view_height"]))
-			LookingGlassAddonLogger.debug(" [#] LightfieldImage views: %i" % len(self.lightfield_image.get_view_data()))
-			LookingGlassAddonLogger.debug(" [#] Using quilt preset: %i (%s, %i x %i)" % (self.preset, self.qs[self.preset]['description'], self.lightfield_image.metadata['quilt_width'], self.lightfield_image.metadata['quilt_height']))
-			LookingGlassAddonLogger.debug(" [#] Preview mode: %s (selected: %s)" % (self.addon_settings_window_manager.viewport_use_preview_mode, self.addon_settings_window_manager.lightfield_preview_mode))
+				# delete the back buffer, which might still be sent in the
+				# background and is recreated for the new preset below
+				self._lightfield_image_back = None
+
+			# create the LightfieldImage, if it does not exist yet
+			if self.lightfield_image == None: self.lightfield_image = self.new_lightfield_image()
+
+			# create the back buffer once, if double buffering is used OR an
+			# animation is streamed
+			# NOTE: The buffers are swapped after each frame and only
+			#		recreated if the quilt preset changes
+			if (self.use_double_buffering or self._playback_streaming) and self._lightfield_image_back == None: self._lightfield_image_back = self.new_lightfield_image()
+
+			if debug:
+				LookingGlassAddonLogger.debug("Start rendering lightfield views ...")
+				LookingGlassAddonLogger.debug(" [#] View dimensions: %i x %i" % (self.qs[self.preset]["view_width"], self.qs[self.preset]["view_height"]))
+				LookingGlassAddonLogger.debug(" [#] LightfieldImage views: %i" % len(self.lightfield_image.get_view_data()))
+				LookingGlassAddonLogger.debug(" [#] Using quilt preset: %i (%s, %i x %i)" % (self.preset, self.qs[self.preset]['description'], self.lightfield_image.metadata['quilt_width'], self.lightfield_image.metadata['quilt_height']))
+				LookingGlassAddonLogger.debug(" [#] Preview mode: %s (selected: %s)" % (self.addon_settings_window_manager.viewport_use_preview_mode, self.addon_settings_window_manager.lightfield_preview_mode))
 
 
 			# PREPARE VIEW & PROJECTION MATRIX
@@ -861,22 +1781,55 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 						scale_y = (self.qs[self.preset]["rows"] / self.qs[self.preset]["columns"]) / self.device.aspect,
 					)
 
-				LookingGlassAddonLogger.debug(" [#] Geting view & projection matrices took %.6f s" % (time.time() - self.start_multi_view))
+				# calculate the offset-projections of all views
+				view_matrices = self.setupVirtualCamerasForViews(camera_view_matrix, camera_projection_matrix)
+
+				if debug: LookingGlassAddonLogger.debug(" [#] Geting view & projection matrices took %.6f s" % (time.time() - self.start_multi_view))
 
 
 				# RENDER THE VIEWS
 				# ++++++++++++++++++++++++++++++++++++++++++++++++
 
+				# if the progressive refinement is active
+				if self.refinement_order:
+
+					# continue with the views that were not drawn yet in the
+					# order of the refinement schedule
+					views = self.refinement_order[self.refinement_position:]
+					refinement_start = time.time()
+
+				else:
+
+					# draw all views
+					views = range(0, self.qs[self.preset]["total_views"])
+
+				# if all views are rendered into a single quilt texture AND this
+				# is not a continued refinement pass
+				if self.use_quilt_texture and not (self.refinement_order and self.refinement_position > 0):
+
+					# clear the quilt, so that skipped views appear black
+					self.clear_offscreen(self.qs[self.preset]["quiltOffscreen"])
+
 				# loop through all required views
-				for view in range(0, self.qs[self.preset]["total_views"]):
+				for view in views:
 
-					with self.qs[self.preset]["viewOffscreen"][view].bind():
+					# if the time budget of this refinement pass is used up
+					if self.refinement_order and view != views[0] and (time.time() - refinement_start) * 1000 > self.addon_settings_window_manager.viewport_refinement_budget:
+
+						# continue on the next modal tick
+						break
+
+					# select the offscreen the view is drawn into
+					if self.use_quilt_texture: view_offscreen = self.qs[self.preset]["viewOffscreen"][0]
+					else: view_offscreen = self.qs[self.preset]["viewOffscreen"][view]
+
+					with view_offscreen.bind():
 
 						start_test = time.time()
-						# calculate the offset-projection of the current view
-						view_matrix, projection_matrix = self.setupVirtualCameraForView(view, camera_view_matrix.copy(), camera_projection_matrix.copy())
+						# get the offset-projection of the current view
+						view_matrix, projection_matrix = view_matrices[view]
 
-						LookingGlassAddonLogger.debug(" [#] [%i] Setting up view camera took %.3f ms" % (view, (time.time() - start_test) * 1000))
+						if debug: LookingGlassAddonLogger.debug(" [#] [%i] Setting up view camera took %.3f ms" % (view, (time.time() - start_test) * 1000))
 						start_test = time.time()
 
 						# if the "skip views preview" is activated AND this view shall be skipped
@@ -885,7 +1838,7 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 							# clear LightfieldView array's color data (so it appears black)
 							self.lightfield_image.views[view]['view'].data[:] = 0
 
-							LookingGlassAddonLogger.debug(" [#] [%i] Clearing skipped view's numpy array took %.3f ms" % (view, (time.time() - start_test) * 1000))
+							if debug: LookingGlassAddonLogger.debug(" [#] [%i] Clearing skipped view's numpy array took %.3f ms" % (view, (time.time() - start_test) * 1000))
 
 						# if the "Restricted viewcone preview" is activated AND this view shall be skipped
 						elif (self.addon_settings_window_manager.viewport_use_preview_mode and self.addon_settings_window_manager.lightfield_preview_mode == '4') and (view < self.restricted_viewcone_limit or view > self.qs[self.preset]["total_views"] - self.restricted_viewcone_limit):
@@ -893,7 +1846,7 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 							# clear LightfieldView array's color data (so it appears black)
 							self.lightfield_image.views[view]['view'].data[:] = 0
 
-							LookingGlassAddonLogger.debug(" [#] [%i] Clearing skipped view's numpy array took %.3f ms" % (view, (time.time() - start_test) * 1000))
+							if debug: LookingGlassAddonLogger.debug(" [#] [%i] Clearing skipped view's numpy array took %.3f ms" % (view, (time.time() - start_test) * 1000))
 
 						else:
 
@@ -902,7 +1855,7 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 								continue
 
 							# draw the viewport rendering to the offscreen for the current view
-							self.qs[self.preset]["viewOffscreen"][view].draw_view3d(
+							view_offscreen.draw_view3d(
 								# we use the "Scene" and the "View Layer" that is active in the Window
 								# the user currently works in
 								scene=context.scene,
@@ -913,14 +1866,22 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 								projection_matrix=projection_matrix,
 								do_color_management = True)
 
-							LookingGlassAddonLogger.debug(" [#] [%i] Drawing view into offscreen took %.3f ms" % (view, (time.time() - start_test) * 1000))
+							# copy the view into its tile of the quilt texture
+							if self.use_quilt_texture: self.copy_view_to_quilt(view, self.qs[self.preset]["columns"], self.qs[self.preset]["rows"], view_offscreen, self.qs[self.preset]["quiltOffscreen"])
+
+							if debug: LookingGlassAddonLogger.debug(" [#] [%i] Drawing view into offscreen took %.3f ms" % (view, (time.time() - start_test) * 1000))
+
+					# count the drawn views of the refinement
+					if self.refinement_order: self.refinement_position += 1
 
 				# restore all viewport shading and overlay settings
 				self.restoreViewportSettings()
 
-				LookingGlassAddonLogger.debug("-----------------------------")
-				LookingGlassAddonLogger.debug("Rendering all views took in total %.3f ms" % ((time.time() - self.start_multi_view) * 1000))
-				LookingGlassAddonLogger.debug("-----------------------------")
+				if debug:
+					LookingGlassAddonLogger.debug("-----------------------------")
+					LookingGlassAddonLogger.debug("Rendering all views took in total %.3f ms" % ((time.time() - self.start_multi_view) * 1000))
+					LookingGlassAddonLogger.debug("-----------------------------")
+				self.frame_pacing.record('draw', time.time() - self.start_multi_view)
 
 
 				# COPY THE VIEWS INTO A BUFFER
@@ -930,34 +1891,66 @@ class LOOKINGGLASS_OT_render_viewport(bpy.types.Operator):
 
 				self.start_multi_view = time.time()
 
-				# loop through all required views
-				for view in range(0, self.qs[self.preset]["total_views"]):
+				# if all views are rendered into a single quilt texture
+				if self.use_quilt_texture:
 
-					# if the "skip views preview" is activated AND this view shall be skipped
-					if (self.addon_settings_window_manager.viewport_use_preview_mode and (self.addon_settings_window_manager.lightfield_preview_mode == '2' or self.addon_settings_window_manager.lightfield_preview_mode == '3')) and view % self.skip_views:
+					# copy the whole quilt texture into the quilt buffer of the LightfieldImage at once
+					self.from_texture_to_numpy_array(self.qs[self.preset]["quiltOffscreen"], self.lightfield_image.quilt_buffer())
 
-						continue
-					# if the "Restricted viewcone preview" is activated AND this view shall be skipped
-					elif (self.addon_settings_window_manager.viewport_use_preview_mode and self.addon_settings_window_manager.lightfield_preview_mode == '4') and (view < self.restricted_viewcone_limit or view > self.qs[self.preset]["total_views"] - self.restricted_viewcone_limit):
+				else:
 
-						continue
-					else:
+					# loop through all required views
+					for view in range(0, self.qs[self.preset]["total_views"]):
 
-						start_test = time.time()
+						# if the "skip views preview" is activated AND this view shall be skipped
+						if (self.addon_settings_window_manager.viewport_use_preview_mode and (self.addon_settings_window_manager.lightfield_preview_mode == '2' or self.addon_settings_window_manager.lightfield_preview_mode == '3')) and view % self.skip_views:
 
-						# copy texture into LightfieldView array
-						self.from_texture_to_numpy_array(self.qs[self.preset]["viewOffscreen"][view], self.lightfield_image.views[view]['view'].data[:])
+							continue
+						# if the progressive refinement did not draw this view yet
+						elif self.refinement_order and view not in self.refinement_order[:self.refinement_position]:
 
-						LookingGlassAddonLogger.debug(" [#] [%i] Copying texture to numpy array took %.3f ms" % (view, (time.time() - start_test) * 1000))
+							continue
+						# if the "Restricted viewcone preview" is activated AND this view shall be skipped
+						elif (self.addon_settings_window_manager.viewport_use_preview_mode and self.addon_settings_window_manager.lightfield_preview_mode == '4') and (view < self.restricted_viewcone_limit or view > self.qs[self.preset]["total_views"] - self.restricted_viewcone_limit):
 
-				LookingGlassAddonLogger.debug("-----------------------------")
-				LookingGlassAddonLogger.debug("Copying all views took in total %.3f ms" % ((time.time() - self.start_multi_view) * 1000))
-				LookingGlassAddonLogger.debug("-----------------------------")
+							continue
+						else:
+
+							start_test = time.time()
+
+							# copy texture into LightfieldView array
+							self.from_texture_to_numpy_array(self.qs[self.preset]["viewOffscreen"][view], self.lightfield_image.views[view]['view'].data[:])
+
+							if debug: LookingGlassAddonLogger.debug(" [#] [%i] Copying texture to numpy array took %.3f ms" % (view, (time.time() - start_test) * 1000))
+
+				if debug:
+					LookingGlassAddonLogger.debug("-----------------------------")
+					LookingGlassAddonLogger.debug("Copying all views took in total %.3f ms" % ((time.time() - self.start_multi_view) * 1000))
+					LookingGlassAddonLogger.debug("-----------------------------")
+				self.frame_pacing.record('readback', time.time() - self.start_multi_view)
+
+				# if the progressive refinement is active
+				if self.refinement_order:
+
+					# fill the views that were not drawn yet, so that the partial
+					# quilt can be displayed
+					if self.refinement_position < len(self.refinement_order): self.fill_unrendered_views(set(self.refinement_order[:self.refinement_position]))
+
+					if debug: LookingGlassAddonLogger.debug(" [#] Progressive refinement: %i of %i views drawn" % (self.refinement_position, len(self.refinement_order)))
 
 			# reset draw variable:
 			# This is here to prevent excessive redrawing
 			self.modal_redraw = False
 
+			# if the progressive refinement is active
+			if self.refinement_order:
+
+				# continue the refinement on the next modal tick
+				if camera != None and self.refinement_position < len(self.refinement_order): self.modal_redraw = True
+
+				# or finish it, if all views were drawn
+				else: self.refinement_order = []
+
 
 
 # ------------ CAMERA FRUSTUM RENDERING -------------
@@ -978,6 +1971,11 @@ class FrustumRenderer:
 		self.frustum_indices_focalplane_face = None
 		self.frustum_shader = None
 
+		# persistent batches of the frustum and the settings they were built for
+		self.frustum_index_buffers = None
+		self.frustum_batches = None
+		self.frustum_batches_key = None
+
 		# notify addon that frustum is activated
 		LookingGlassAddon.FrustumInitialized = True
 
@@ -1032,6 +2030,63 @@ class FrustumRenderer:
 
 
 
+	# calculate the planes of a convex hull around the union of the frustums of
+	# all views in the camera coordinates. Each plane is returned as (normal, distance)
+	# and a point p is inside, if normal.dot(p) + distance >= 0 for all planes.
+	@staticmethod
+	def view_cone_planes(scene, camera, view_cone, focal_plane):
+
+		# we obtain the viewframe of the camera to calculate the opening of the
+		# frustum based on the intercept theorems
+		# NOTE: the larger half-extent is used for both directions, since the
+		#		device aspect ratio may differ from the render aspect ratio
+		view_frame = camera.data.view_frame(scene=scene)
+		view_frame_distance = abs(view_frame[0][2])
+		opening = max(max(abs(corner[0]), abs(corner[1])) for corner in view_frame) / view_frame_distance
+
+		# get the clipping settings
+		clipStart = camera.data.clip_start
+		clipEnd = camera.data.clip_end
+
+		# the outermost views are shifted by this offset and sheared to converge
+		# at the focal plane, so at depth d they are displaced by
+		# offset * |1 - d / focal_plane|, which is bounded by its chord between
+		# the clipping planes
+		offset = focal_plane * tan(radians(view_cone) / 2)
+		shift_start = offset * abs(1 - clipStart / focal_plane) if focal_plane > 0 else offset
+		shift_end = offset * abs(1 - clipEnd / focal_plane) if focal_plane > 0 else offset
+		slope = (shift_end - shift_start) / (clipEnd - clipStart) if clipEnd > clipStart else 0
+
+		# NOTE: the z-value is negative, because the Blender camera always looks into negative z-direction
+		return [
+				# near and far clipping plane
+				(Vector((0, 0, -1)), -clipStart),
+				(Vector((0, 0, 1)), clipEnd),
+				# left and right planes (including the view offsets)
+				(Vector((-1, 0, -(opening + slope))), shift_start - slope * clipStart),
+				(Vector((1, 0, -(opening + slope))), shift_start - slope * clipStart),
+				# upper and lower planes
+				(Vector((0, -1, -opening)), 0),
+				(Vector((0, 1, -opening)), 0),
+				]
+
+	# test if the bounding box of an object intersects the convex hull of the view cone
+	@staticmethod
+	def is_in_view_cone(obj, planes, world_to_camera):
+
+		# transform the bounding box corners into camera coordinates
+		matrix = world_to_camera @ obj.matrix_world
+		corners = [matrix @ Vector(corner) for corner in obj.bound_box]
+
+		# the object is outside, if all corners are outside of one plane
+		for normal, distance in planes:
+			if all(normal.dot(corner) + distance < 0 for corner in corners):
+				return False
+
+		return True
+
+
+
 	# setup the camera frustum shader
 	def setupCameraFrustumShader(self):
 
@@ -1071,12 +2126,61 @@ class FrustumRenderer:
 				(10, 11, 8)
 			)
 
+		# create the index buffers once, since the indices never change
+		self.frustum_index_buffers = {
+			'lines': gpu.types.GPUIndexBuf(type='LINES', seq=self.frustum_indices_lines),
+			'faces': gpu.types.GPUIndexBuf(type='TRIS', seq=self.frustum_indices_faces),
+			'focalplane_outline': gpu.types.GPUIndexBuf(type='LINES', seq=self.frustum_indices_focalplane_outline),
+			'focalplane_face': gpu.types.GPUIndexBuf(type='TRIS', seq=self.frustum_indices_focalplane_face),
+			}
+
+		# the batches are built on the first draw call
+		self.frustum_batches = None
+		self.frustum_batches_key = None
+
 		# compile the shader that will be used for drawing
 		if sys.version_info.major >= 4 or (sys.version_info.major >= 0 and sys.version_info.minor >= 0):
 			self.frustum_shader = gpu.shader.from_builtin('UNIFORM_COLOR')
 		else:
 			self.frustum_shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
 
+	# build the batches of the camera frustum and focal plane
+	# NOTE: All batches share one vertex buffer, which contains the vertices of
+	#		the frustum in camera coordinates. The camera transform is applied
+	#		via the model view matrix, so the batches only need to be rebuilt if
+	#		the view frame, the clipping, or the focal plane settings change.
+	def setupCameraFrustumBatches(self, view_frame, clipStart, clipEnd, focalPlane):
+
+		# get the view frame corners
+		view_frame_upper_right = view_frame[0]
+		view_frame_lower_right = view_frame[1]
+		view_frame_lower_left = view_frame[2]
+		view_frame_upper_left = view_frame[3]
+		view_frame_distance = abs(view_frame_upper_right[2])
+
+		# define the vertices of the camera frustum in camera coordinates
+		# NOTE: - the z-value is negative, because the Blender camera always looks into negative z-direction
+		coords_local = [
+						(corner[0] / view_frame_distance * distance, corner[1] / view_frame_distance * distance, -distance)
+						# near clipping plane, far clipping plane, and focal plane
+						for distance in (clipStart, clipEnd, focalPlane)
+						for corner in (view_frame_lower_right, view_frame_lower_left, view_frame_upper_left, view_frame_upper_right)
+						]
+
+		# fill the vertex buffer
+		vertex_format = gpu.types.GPUVertFormat()
+		vertex_format.attr_add(id="pos", comp_type='F32', len=3, fetch_mode='FLOAT')
+		vertex_buffer = gpu.types.GPUVertBuf(vertex_format, len(coords_local))
+		vertex_buffer.attr_fill("pos", coords_local)
+
+		# create the batches
+		self.frustum_batches = {
+			'lines': gpu.types.GPUBatch(type='LINES', buf=vertex_buffer, elem=self.frustum_index_buffers['lines']),
+			'faces': gpu.types.GPUBatch(type='TRIS', buf=vertex_buffer, elem=self.frustum_index_buffers['faces']),
+			'focalplane_outline': gpu.types.GPUBatch(type='LINES', buf=vertex_buffer, elem=self.frustum_index_buffers['focalplane_outline']),
+			'focalplane_face': gpu.types.GPUBatch(type='TRIS', buf=vertex_buffer, elem=self.frustum_index_buffers['focalplane_face']),
+			}
+
 
 
 	# drawing function, which draws the camera frustum in the active SpaceView3D
@@ -1093,52 +2197,23 @@ class FrustumRenderer:
 					# if the camera is visible
 					if camera.hide_get() == False:
 
-						# get modelview matrix
-						view_matrix = camera.matrix_world.copy()
-
-						# correct for the camera scaling
-						view_matrix = view_matrix @ Matrix.Scale(1/camera.scale.x, 4, (1, 0, 0))
-						view_matrix = view_matrix @ Matrix.Scale(1/camera.scale.y, 4, (0, 1, 0))
-						view_matrix = view_matrix @ Matrix.Scale(1/camera.scale.z, 4, (0, 0, 1))
+						# get modelview matrix and correct for the camera scaling
+						view_matrix = camera.matrix_world @ Matrix.Diagonal((1/camera.scale.x, 1/camera.scale.y, 1/camera.scale.z, 1))
 
 						# we obtain the viewframe of the camera to calculate the focal and clipping world_clip_planes_calc_clip_distance
 						# based on the intercept theorems
 						view_frame = camera.data.view_frame(scene=context.scene)
-						view_frame_upper_right = view_frame[0]
-						view_frame_lower_right = view_frame[1]
-						view_frame_lower_left = view_frame[2]
-						view_frame_upper_left = view_frame[3]
-						view_frame_distance = abs(view_frame_upper_right[2])
 
 						# get the clipping settings
 						clipStart = camera.data.clip_start
 						clipEnd = camera.data.clip_end
 						focalPlane = context.scene.addon_settings.focalPlane
 
-						# TODO: Find a way to predefine the vertex buffers and batches so that these don't need to be created in every frame
-						# define the vertices of the camera frustum in camera coordinates
-						# NOTE: - the z-value is negative, because the Blender camera always looks into negative z-direction
-						coords_local = [
-										# near clipping plane
-										(view_frame_lower_right[0] / view_frame_distance * clipStart, view_frame_lower_right[1] / view_frame_distance * clipStart, -clipStart), (view_frame_lower_left[0] / view_frame_distance * clipStart, view_frame_lower_left[1] / view_frame_distance * clipStart, -clipStart),
-										(view_frame_upper_left[0] / view_frame_distance * clipStart, view_frame_upper_left[1] / view_frame_distance * clipStart, -clipStart), (view_frame_upper_right[0] / view_frame_distance * clipStart, view_frame_upper_right[1] / view_frame_distance * clipStart, -clipStart),
-										# far clipping plane
-										(view_frame_lower_right[0] / view_frame_distance * clipEnd, view_frame_lower_right[1] / view_frame_distance * clipEnd, -clipEnd), (view_frame_lower_left[0] / view_frame_distance * clipEnd, view_frame_lower_left[1] / view_frame_distance * clipEnd, -clipEnd),
-										(view_frame_upper_left[0] / view_frame_distance * clipEnd, view_frame_upper_left[1] / view_frame_distance * clipEnd, -clipEnd), (view_frame_upper_right[0] / view_frame_distance * clipEnd, view_frame_upper_right[1] / view_frame_distance * clipEnd, -clipEnd),
-										# focal plane
-										(view_frame_lower_right[0] / view_frame_distance * focalPlane, view_frame_lower_right[1] / view_frame_distance * focalPlane, -focalPlane), (view_frame_lower_left[0] / view_frame_distance * focalPlane, view_frame_lower_left[1] / view_frame_distance * focalPlane, -focalPlane),
-										(view_frame_upper_left[0] / view_frame_distance * focalPlane, view_frame_upper_left[1] / view_frame_distance * focalPlane, -focalPlane), (view_frame_upper_right[0] / view_frame_distance * focalPlane, view_frame_upper_right[1] / view_frame_distance * focalPlane, -focalPlane),
-										]
-
-						# if the camera fustum shall be drawn
-						if context.scene.addon_settings.showFrustum == True:
-							batch_lines = batch_for_shader(self.frustum_shader, 'LINES', {"pos": coords_local}, indices=self.frustum_indices_lines)
-							batch_faces = batch_for_shader(self.frustum_shader, 'TRIS', {"pos": coords_local}, indices=self.frustum_indices_faces)
-
-						# if the focal plane shall be drawn
-						if context.scene.addon_settings.showFocalPlane == True:
-							batch_focalplane_outline = batch_for_shader(self.frustum_shader, 'LINES', {"pos": coords_local}, indices=self.frustum_indices_focalplane_outline)
-							batch_focalplane_face = batch_for_shader(self.frustum_shader, 'TRIS', {"pos": coords_local}, indices=self.frustum_indices_focalplane_face)
+						# rebuild the batches only if the frustum geometry changed
+						key = (tuple(tuple(corner) for corner in view_frame), clipStart, clipEnd, focalPlane)
+						if self.frustum_batches is None or key != self.frustum_batches_key:
+							self.setupCameraFrustumBatches(view_frame, clipStart, clipEnd, focalPlane)
+							self.frustum_batches_key = key
 
 						# draw everything
 						self.frustum_shader.bind()
@@ -1160,13 +2235,13 @@ class FrustumRenderer:
 						if context.scene.addon_settings.showFrustum == True:
 							# draw outline
 							self.frustum_shader.uniform_float("color", (0.3, 0, 0, 1))
-							batch_lines.draw(self.frustum_shader)
+							self.frustum_batches['lines'].draw(self.frustum_shader)
 
 						# if the focal plane shall be drawn
 						if context.scene.addon_settings.showFocalPlane == True:
 							# draw focal plane outline
 							self.frustum_shader.uniform_float("color", (1, 1, 1, 1))
-							batch_focalplane_outline.draw(self.frustum_shader)
+							self.frustum_batches['focalplane_outline'].draw(self.frustum_shader)
 
 						gpu.state.depth_mask_set(False)
 						gpu.state.blend_set('ALPHA')
@@ -1175,13 +2250,13 @@ class FrustumRenderer:
 						if context.scene.addon_settings.showFrustum == True:
 							# fill faces
 							self.frustum_shader.uniform_float("color", (0.5, 0.5, 0.5, 0.05))
-							batch_faces.draw(self.frustum_shader)
+							self.frustum_batches['faces'].draw(self.frustum_shader)
 
 						# if the focal plane shall be drawn
 						if context.scene.addon_settings.showFocalPlane == True:
 							# draw focal plane face
 							self.frustum_shader.uniform_float("color", (0.1, 0.1, 0.1, 0.25))
-							batch_focalplane_face.draw(self.frustum_shader)
+							self.frustum_batches['focalplane_face'].draw(self.frustum_shader)
 
 						gpu.state.depth_test_set('NONE')
 						gpu.state.blend_set('NONE')
@@ -1197,6 +2272,9 @@ class FrustumRenderer:
 # Class for blocks. Instances store all the data of a Block.
 class Block:
 
+	# time per draw call that may be spent on refreshing the view atlas (in s)
+	atlas_time_budget = 0.008
+
 	# Inititalize the block
 	def __init__(self, x, y, width, height):
 
@@ -1230,6 +2308,12 @@ class Block:
 		self.offscreen_canvas = gpu.types.GPUOffScreen(self.width, self.height)
 		self.offscreen_view = None
 
+		# view atlas, which stores all views of a quilt preset as tiles
+		self.atlas_preset = None
+		self.atlas_views = set()
+		self.offscreen_atlas = None
+		self.offscreen_atlas_view = None
+
 		# create shaders
 		self.__update_shaders()
 
@@ -1263,6 +2347,7 @@ class Block:
 				uniform sampler2D view_texture;
 				uniform vec2 dimensions;
 				uniform float alpha;
+				uniform vec4 view_rect;
 
 				in vec2 texCoord;
 				out vec4 FragColor;
@@ -1293,7 +2378,7 @@ class Block:
 
 					// Shadertoy doesn't have an alpha in this case
 					if(a <= 0.0){
-						FragColor = texture(view_texture, texCoord);
+						FragColor = texture(view_texture, view_rect.xy + texCoord * view_rect.zw);
 						FragColor.a = alpha;
 					}else{
 						FragColor = vec4(0.0, 0.0, 0.0, 0.0);
@@ -1322,6 +2407,7 @@ class Block:
 			hologram_preview_shader_info.sampler(0, 'FLOAT_2D', "view_texture")
 			hologram_preview_shader_info.push_constant('VEC2', "dimensions")
 			hologram_preview_shader_info.push_constant('FLOAT', "alpha")
+			hologram_preview_shader_info.push_constant('VEC4', "view_rect")
 
 			# Define as Interface the attributes that will be transferred from the vertex shader to the fragment shader. 
 			# Before they would be both a vertex shader output and fragment shader input.
@@ -1372,7 +2458,7 @@ class Block:
 
 					// Shadertoy doesn't have an alpha in this case
 					if(a <= 0.0){
-						FragColor = texture(view_texture, texCoord);
+						FragColor = texture(view_texture, view_rect.xy + texCoord * view_rect.zw);
 						FragColor.a = alpha;
 					}else{
 						FragColor = vec4(0.0, 0.0, 0.0, 0.0);
@@ -1591,6 +2677,9 @@ class Block:
 			# update shaders to include the new aspect ratio
 			self.__update_shaders()
 
+			# the views in the atlas are outdated
+			self.atlas_views.clear()
+
 			# block has changed
 			self.changed = True
 
@@ -1615,6 +2704,53 @@ class Block:
 			# block has changed
 			self.changed = True
 
+	# set the quilt preset of the view atlas for this Block
+	def set_atlas_preset(self, preset):
+
+		if not (preset is None or self.atlas_preset == preset):
+			self.atlas_preset = preset
+
+			# free offscreens
+			if self.offscreen_atlas: self.offscreen_atlas.free()
+			if self.offscreen_atlas_view: self.offscreen_atlas_view.free()
+
+			# create a new offscreen for the atlas and one the views are drawn to
+			self.offscreen_atlas = gpu.types.GPUOffScreen(self.qs[self.atlas_preset]['quilt_width'], self.qs[self.atlas_preset]['quilt_height'])
+			self.offscreen_atlas_view = gpu.types.GPUOffScreen(self.qs[self.atlas_preset]['view_width'], self.qs[self.atlas_preset]['view_height'])
+
+			# the views in the atlas are outdated
+			self.atlas_views.clear()
+
+			# block has changed
+			self.changed = True
+
+	# mark all views in the atlas as outdated
+	def invalidate_atlas(self):
+		self.atlas_views.clear()
+
+		# block has changed
+		self.changed = True
+
+	# get the atlas view that corresponds to the current view of the block
+	def get_atlas_view(self):
+		total_views = self.qs[self.preset]['total_views']
+		atlas_total_views = self.qs[self.atlas_preset]['total_views']
+
+		return min(max(round(self.view * (atlas_total_views - 1) / max(total_views - 1, 1)), 0), atlas_total_views - 1)
+
+	# get the outdated atlas views, ordered by their distance to the current view
+	def get_pending_atlas_views(self):
+		view = self.get_atlas_view()
+
+		return sorted(set(range(0, self.qs[self.atlas_preset]['total_views'])) - self.atlas_views, key=lambda v: abs(v - view))
+
+	# get the texture coordinates (offset and scale) of a view in the atlas
+	def get_atlas_rect(self, view):
+		columns = self.qs[self.atlas_preset]['columns']
+		rows = self.qs[self.atlas_preset]['rows']
+
+		return ((view % columns) / columns, floor(view / columns) / rows, 1 / columns, 1 / rows)
+
 	# store view in the block data
 	def set_view(self, view):
 		if not (view is None or self.view == view):
@@ -1628,6 +2764,9 @@ class Block:
 		if not (view_cone is None or self.view_cone == view_cone):
 			self.view_cone = view_cone
 
+			# the views in the atlas are outdated
+			self.atlas_views.clear()
+
 			# block has changed
 			self.changed = True
 
@@ -1655,6 +2794,9 @@ class Block:
 			# update shaders to include the new aspect ratio
 			self.__update_shaders()
 
+			# the views in the atlas are outdated
+			self.atlas_views.clear()
+
 			# block has changed
 			self.changed = True
 
@@ -1703,7 +2845,15 @@ class Block:
 					if not self.active: self.shader.uniform_float("alpha", context.scene.addon_settings.viewport_block_alpha)
 				if context.space_data.type == 'IMAGE_EDITOR':
 					self.shader.uniform_float("alpha", 1)
-				self.shader.uniform_sampler("view_texture", self.offscreen_view.texture_color)
+
+				# if the block has a view atlas, the current view is a lookup of its tile
+				if self.offscreen_atlas:
+					self.shader.uniform_float("view_rect", self.get_atlas_rect(self.get_atlas_view()))
+					self.shader.uniform_sampler("view_texture", self.offscreen_atlas.texture_color)
+
+				else:
+					self.shader.uniform_float("view_rect", (0.0, 0.0, 1.0, 1.0))
+					self.shader.uniform_sampler("view_texture", self.offscreen_view.texture_color)
 
 				# draw the block image
 				self.batch.draw(self.shader)
@@ -1718,6 +2868,13 @@ class Block:
 		if hasattr(self, "shader"): del self.shader
 		if hasattr(self, "batch"): del self.batch
 
+		# free the view atlas
+		if self.offscreen_atlas: self.offscreen_atlas.free()
+		if self.offscreen_atlas_view: self.offscreen_atlas_view.free()
+		self.offscreen_atlas = None
+		self.offscreen_atlas_view = None
+		self.atlas_preset = None
+
 		# free offscreens
 		try: 
 			self.offscreen_view.free()
@@ -1728,6 +2885,9 @@ class Block:
 # Class for rendering a Looking Glass Block in Blenders 3D viewport for live preview
 class BlockRenderer:
 
+	# maximum number of image textures kept in the texture cache
+	image_texture_cache_size = 4
+
 	# ------------ KEYMAP OPERATOR FOR BLOCK RENDERER UPDATES -------------
 	class LOOKINGGLASS_OT_update_block_renderer(bpy.types.Operator):
 		""" This operator updates the block renderer"""
@@ -1897,6 +3057,10 @@ class BlockRenderer:
 		# context override
 		self.__override = None
 
+		# image textures in LRU order and the update counters of the images
+		self.__image_textures = {}
+		self.__image_updates = {}
+
 
 
 	# deinititalize the block renderer
@@ -1975,6 +3139,9 @@ class BlockRenderer:
 				self.add_block(0, 0, 0, 420, 560)
 				self.set_imageeditor_block(0)
 
+				# add depsgraph update handler to count the image updates
+				bpy.app.handlers.depsgraph_update_post.append(self.__image_changes)
+
 				# add draw handler to display the frustum of the Looking Glass camera
 				# after everything else has been drawn in the view
 				self.__block_draw_view_imageeditor_handler = bpy.types.SpaceImageEditor.draw_handler_add(self.__imageeditor_render_view, (context,), 'WINDOW', 'PRE_VIEW')
@@ -2023,6 +3190,14 @@ class BlockRenderer:
 					bpy.types.SpaceImageEditor.draw_handler_remove(self.__block_draw_block_imageeditor_handler, 'WINDOW')
 					self.__block_draw_block_imageeditor_handler = None
 
+				# remove the depsgraph update handler
+				if self.__image_changes in bpy.app.handlers.depsgraph_update_post:
+					bpy.app.handlers.depsgraph_update_post.remove(self.__image_changes)
+
+				# clear the texture cache
+				self.__image_textures.clear()
+				self.__image_updates.clear()
+
 			# update status
 			self.__is_running = False
 
@@ -2064,6 +3239,9 @@ class BlockRenderer:
 			# set selected preset for this block
 			block.set_preset(int(bpy.context.scene.addon_settings.render_quilt_preset))
 
+		# the views are looked up from an atlas of the low-resolution preview
+		block.set_atlas_preset(int(list(pylio.LookingGlassQuilt.formats.get().keys())[-1]))
+
 	# get the block to be rendered in the Blender viewport
 	def get_viewport_block(self):
 		if not self.__viewport3d_block is None:
@@ -2112,9 +3290,50 @@ class BlockRenderer:
 				if block is None or block.preset is None or block.offscreen_view is None:
 					return
 
-				# update the blocks status variable
-				block.changed = True
+				# the views in the atlas are outdated
+				block.invalidate_atlas()
+
+
+	# Application handler that counts the updates of the images
+	def __image_changes(self, scene, depsgraph):
+
+		# for each updated image
+		for update in depsgraph.updates:
+			if isinstance(update.id, bpy.types.Image):
 
+				# increase the update counter of the image
+				pointer = update.id.original.as_pointer()
+				self.__image_updates[pointer] = self.__image_updates.get(pointer, 0) + 1
+
+				# the view of the image editor block must be redrawn
+				block = self.get_imageeditor_block()
+				if block: block.changed = True
+
+	# get the texture of an image from the texture cache
+	# NOTE: The texture is only created again, if the image was updated
+	def get_image_texture(self, context, image):
+
+		# the texture is identified by the image datablock and its update counter
+		pointer = image.as_pointer()
+		key = (pointer, image.name_full, self.__image_updates.get(pointer, 0), image.is_dirty, tuple(image.size), image.filepath_raw, context.space_data.image_user.frame_current)
+
+		# if the texture is in the cache, mark it as most recently used
+		if key in self.__image_textures:
+			self.__image_textures[key] = self.__image_textures.pop(key)
+			return self.__image_textures[key]
+
+		# remove outdated textures of this image
+		for outdated_key in [k for k in self.__image_textures if k[0] == pointer]:
+			del self.__image_textures[outdated_key]
+
+		# remove the least recently used textures, if the cache is full
+		while len(self.__image_textures) >= self.image_texture_cache_size:
+			del self.__image_textures[next(iter(self.__image_textures))]
+
+		# create a texture from the image
+		self.__image_textures[key] = gpu.texture.from_image(image)
+
+		return self.__image_textures[key]
 
 	# render the view for the block
 	def __viewport_render_view(self, context):
@@ -2131,7 +3350,7 @@ class BlockRenderer:
 
 					# select correct block
 					block = self.get_viewport_block()
-					if block is None or block.preset is None or block.offscreen_view is None:
+					if block is None or block.preset is None or block.offscreen_view is None or block.offscreen_atlas is None:
 						return
 
 					# currently selected device
@@ -2144,8 +3363,15 @@ class BlockRenderer:
 						if device.aspect < 1: block.set_dimensions(int(sqrt(context.area.width * context.area.height) * context.scene.addon_settings.viewport_block_scaling_factor * device.aspect), int(sqrt(context.area.width * context.area.height) * context.scene.addon_settings.viewport_block_scaling_factor))
 						if device.aspect >= 1: block.set_dimensions(int(sqrt(context.area.width * context.area.height) * context.scene.addon_settings.viewport_block_scaling_factor), int(sqrt(context.area.width * context.area.height) * context.scene.addon_settings.viewport_block_scaling_factor / device.aspect))
 
-					# if the block changed
-					if block.has_changed(context):
+					# if the shading type changed, the views in the atlas are outdated
+					if block.shading_type != context.space_data.shading.type:
+						block.invalidate_atlas()
+
+					# if views of the atlas are outdated
+					# NOTE: Hovering over the block only changes the atlas tile
+					#		that is looked up, so no view needs to be rendered for it.
+					pending_views = block.get_pending_atlas_views()
+					if pending_views:
 
 						# select camera that belongs to the view
 						camera = context.scene.addon_settings.lookingglassCamera
@@ -2177,37 +3403,56 @@ class BlockRenderer:
 							# get the camera's projection matrix
 							camera_projection_matrix = camera.calc_matrix_camera(
 									depsgraph=context.view_layer.depsgraph,
-									x = block.qs[block.preset]["view_width"],
-									y = block.qs[block.preset]["view_height"],
+									x = block.qs[block.atlas_preset]["view_width"],
+									y = block.qs[block.atlas_preset]["view_height"],
 									scale_x = 1.0,
-									scale_y = (block.qs[block.preset]["rows"] / block.qs[block.preset]["columns"]) / block.aspect,
+									scale_y = (block.qs[block.atlas_preset]["rows"] / block.qs[block.atlas_preset]["columns"]) / block.aspect,
 								)
 
+							# calculate the offset-projections of all views
+							view_matrices = self.__override.setupVirtualCamerasForViews(block.qs[block.atlas_preset]["total_views"], block.view_cone, block.aspect, camera_view_matrix, camera_projection_matrix)
 
-							# RENDER THE VIEW
-							# ++++++++++++++++++++++++++++++++++++++++++++++++
-							with block.offscreen_view.bind():
 
-								# calculate the offset-projection of the current view
-								view_matrix, projection_matrix = self.__override.setupVirtualCameraForView(block.view, block.qs[block.preset]["total_views"], block.view_cone, block.aspect, camera_view_matrix.copy(), camera_projection_matrix.copy())
+							# RENDER THE VIEWS INTO THE ATLAS
+							# ++++++++++++++++++++++++++++++++++++++++++++++++
+							# render the outdated views closest to the current view first
+							# and continue in the next draw calls, if the time is up
+							start = time.time()
+							for view in pending_views:
+
+								with block.offscreen_atlas_view.bind():
+
+									# get the offset-projection of the view
+									view_matrix, projection_matrix = view_matrices[view]
+
+									# draw the viewport rendering to the offscreen for the view
+									block.offscreen_atlas_view.draw_view3d(
+										# we use the "Scene" and the "View Layer" that is active in the Window
+										# the user currently works in
+										scene=context.scene,
+										view_layer=context.view_layer,
+										view3d=context.space_data,
+										region=context.region,
+										view_matrix=view_matrix,
+										projection_matrix=projection_matrix,
+										do_color_management = False)
+
+								# copy the view into its tile of the atlas
+								LOOKINGGLASS_OT_render_viewport.copy_view_to_quilt(view, block.qs[block.atlas_preset]["columns"], block.qs[block.atlas_preset]["rows"], block.offscreen_atlas_view, block.offscreen_atlas)
+								block.atlas_views.add(view)
+
+								if time.time() - start > block.atlas_time_budget:
+									break
 
-								# draw the viewport rendering to the offscreen for the current view
-								block.offscreen_view.draw_view3d(
-									# we use the "Scene" and the "View Layer" that is active in the Window
-									# the user currently works in
-									scene=context.scene,
-									view_layer=context.view_layer,
-									view3d=context.space_data,
-									region=context.region,
-									view_matrix=view_matrix,
-									projection_matrix=projection_matrix,
-									do_color_management = False)
+							# restore all viewport shading and overlay settings
+							self.__override.restoreViewportSettings()
 
-						# restore all viewport shading and overlay settings
-						self.__override.restoreViewportSettings()
+							# if views are still outdated, continue in the next redraw
+							if len(block.atlas_views) < block.qs[block.atlas_preset]["total_views"]:
+								context.area.tag_redraw()
 
-						# reset status variable
-						block.changed = False
+					# reset status variable
+					block.changed = False
 
 
 
@@ -2248,7 +3493,6 @@ class BlockRenderer:
 
 
 	def detect_from_quilt_suffix(self, context, quilt_name):
-		import re
 
 		# select correct block
 		block = self.get_imageeditor_block()
@@ -2330,9 +3574,8 @@ class BlockRenderer:
 							# if the block changed
 							if block.changed and block.offscreen_view:
 
-								# create a texture from the image
-								#if not block.image_texture:
-								block.image_texture = gpu.texture.from_image(image)
+								# get the texture of the image
+								block.image_texture = self.get_image_texture(context, image)
 
 								# if the texture was created
 								if block.image_texture:
@@ -85,6 +85,9 @@ class LOOKINGGLASS_OT_install_dependencies(bpy.types.Operator):
 			# close logfile
 			logfile.close()
 
+			# check the dependencies again on the next call
+			LookingGlassAddon.invalidate_dependency_manifest()
+
 		return {'FINISHED'}
 
 # Preferences pane for this Addon in the Blender preferences
@@ -177,6 +180,21 @@ class LOOKINGGLASS_PT_preferences(AddonPreferences):
 									default='0',
 									name="Camera Mode",
 									)
+	# maximum size of the view cache for rendering
+	render_cache_size: bpy.props.IntProperty(
+									default=2048,
+									min=64,
+									name="View Cache Size (MB)",
+									description="Maximum disk space used by the quilt view cache. If the cache grows larger, the least recently used views are deleted",
+									)
+
+	# GPU memory budget for the offscreens of the live view
+	viewport_offscreen_budget: bpy.props.IntProperty(
+									default=2048,
+									min=64,
+									name="Live View GPU Budget (MB)",
+									description="Maximum GPU memory used for the offscreens of the quilt presets in the live view. If more is required, the offscreens of the least recently used presets are freed",
+									)
 
 	# logger level
 	logger_level: bpy.props.EnumProperty(
@@ -221,6 +239,24 @@ class LOOKINGGLASS_PT_preferences(AddonPreferences):
 		column_2.prop(self, "camera_mode", text="")
 		column_2.scale_x = 0.8
 
+		# view cache size for rendering
+		row_cache_size = layout.row()
+		column_1 = row_cache_size.column()
+		column_1.label(text="View Cache:")
+		column_1.scale_x = 0.2
+		column_2 = row_cache_size.column()
+		column_2.prop(self, "render_cache_size", text="Size (MB)")
+		column_2.scale_x = 0.8
+
+		# GPU memory budget for the live view
+		row_offscreen_budget = layout.row()
+		column_1 = row_offscreen_budget.column()
+		column_1.label(text="Live View:")
+		column_1.scale_x = 0.2
+		column_2 = row_offscreen_budget.column()
+		column_2.prop(self, "viewport_offscreen_budget", text="GPU Budget (MB)")
+		column_2.scale_x = 0.8
+
 		# logger level
 		row_logger = layout.row()
 		column_1 = row_logger.column()
@@ -664,6 +664,16 @@ class LookingGlassAddonUI:
 
 
 
+	# update function for manual refreshes of the lightfield viewport
+	def update_viewport_manual_refresh(self, context):
+
+		# if a refresh was requested AND the lightfield viewport is running
+		if context.window_manager.addon_settings.viewport_manual_refresh and LookingGlassAddon.LightfieldViewport:
+
+			# schedule a redraw
+			LookingGlassAddon.LightfieldViewport.schedule_redraw()
+
+
 	# update function for property updates concerning lightfield window settings
 	def update_lightfield_window_settings(self, context):
 
@@ -673,6 +683,112 @@ class LookingGlassAddonUI:
 			# update the lightfield displayed on the device
 			LookingGlassAddon.update_lightfield_window(int(context.window_manager.addon_settings.renderMode), LookingGlassAddon.quiltViewerLightfieldImage)
 
+		# otherwise stop the quilt viewer playback, so that no quilt frame is
+		# displayed over the live view
+		elif LookingGlassAddon.LightfieldViewport:
+			LookingGlassAddon.LightfieldViewport.stop_quilt_player()
+
+
+	# return the color transform, which is applied to the pixels of an image
+	# as it would be applied by save_render()
+	# NOTE: Only color management settings that can be expressed analytically
+	#		are supported (sRGB display, "Standard" or "Raw" view transform, no
+	#		look and no curves). For all other settings None is returned.
+	#		The transform has the form (encoding, view transform, exposure, gamma).
+	@staticmethod
+	def color_transform(scene, image):
+
+		# get the scene color management settings
+		display_settings = scene.display_settings
+		view_settings = scene.view_settings
+
+		# the pixel data of byte images is encoded in the color space of the
+		# image, while float images are stored in scene linear color space
+		if image.colorspace_settings.name in ('Non-Color', 'Raw'): encoding = 'NONE'
+		elif not image.is_float and image.colorspace_settings.name == 'sRGB': encoding = 'SRGB'
+		elif image.is_float or image.colorspace_settings.name in ('Linear', 'Linear Rec.709'): encoding = 'LINEAR'
+		else: return None
+
+		# if the image uses the scene color management settings
+		if image.use_view_as_render:
+
+			# if the transform can't be calculated in memory
+			if display_settings.display_device != 'sRGB' or view_settings.view_transform not in ('Standard', 'Raw') or view_settings.look != 'None' or view_settings.use_curve_mapping:
+				return None
+
+			return (encoding, view_settings.view_transform, view_settings.exposure, view_settings.gamma)
+
+		# otherwise the standard settings are used
+		else:
+
+			# if the transform can't be calculated in memory
+			if display_settings.display_device != 'sRGB':
+				return None
+
+			return (encoding, 'Standard', 0.0, 1.0)
+
+	# return True, if the color transform does not change the color data
+	@staticmethod
+	def is_identity_transform(transform):
+
+		encoding, view_transform, exposure, gamma = transform
+		return encoding == 'NONE' or (encoding == 'SRGB' and view_transform == 'Standard' and exposure == 0 and gamma == 1)
+
+	# apply a color transform to an array of float colors with the shape (n, 3)
+	# NOTE: This does not use the Blender API, so it can be called by worker threads
+	@staticmethod
+	def apply_color_transform(colors, transform):
+
+		# number of pixels that are processed at once to keep the temporary
+		# arrays small
+		block_size = 262144
+
+		# if the color data is used as it is
+		if LookingGlassAddonUI.is_identity_transform(transform):
+			return
+
+		# apply the transform to the color channels in blocks of pixels
+		encoding, view_transform, exposure, gamma = transform
+		for start in range(0, colors.shape[0], block_size):
+			block = colors[start:start + block_size]
+
+			# decode sRGB to linear
+			if encoding == 'SRGB':
+				block[...] = np.where(block <= 0.04045, block / 12.92, np.power((np.maximum(block, 0.04045) + 0.055) / 1.055, 2.4))
+
+			# apply the exposure in linear color space
+			if exposure != 0:
+				block *= 2 ** exposure
+
+			# encode linear to sRGB for the display
+			if view_transform == 'Standard':
+				block[...] = np.where(block <= 0.0031308, block * 12.92, 1.055 * np.power(np.maximum(block, 0.0031308), 1 / 2.4) - 0.055)
+
+			# apply the gamma on the display values
+			if gamma != 1:
+				block[...] = np.power(np.maximum(block, 0), 1 / gamma)
+
+	# copy the pixels of an image into a float32 array and apply the color
+	# management in memory, as it would be applied by save_render()
+	# NOTE: Returns False, if the color management settings are not supported
+	#		by color_transform() or the image is not an RGB(A) image
+	@staticmethod
+	def read_color_managed_pixels(context, image, pixels):
+
+		# get the color transform of the image
+		transform = LookingGlassAddonUI.color_transform(context.scene, image)
+
+		# only RGB and RGBA images are supported
+		if transform is None or image.channels not in (3, 4):
+			return False
+
+		# copy the pixel data to the array
+		image.pixels.foreach_get(pixels)
+
+		# apply the transform to the color channels
+		LookingGlassAddonUI.apply_color_transform(pixels.reshape(-1, image.channels)[:, :3], transform)
+
+		return True
 
 	# update function for property updates concerning quilt image selection
 	def update_quilt_selection(self, context):
@@ -699,93 +815,83 @@ class LookingGlassAddonUI:
 
 			# GET PIXEL DATA
 			# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-			# TODO: Change. The current approach is hacky and slow, but I don't
-			#		know of any other way to access the pixel data WITH applied
-			#		color management directly in memory. Seems like Blender
-			#		does not expose this pixel data to the Python API
-			#
-			#		I asked this also on stackexchange but got no better way yet:
-			#		https://blender.stackexchange.com/questions/206910/access-image-pixel-data-with-color-management-settings
-			#
-
-			# if the image has the "view as render" option inactive
-			if context.window_manager.addon_settings.quiltImage.use_view_as_render == False:
-
-				# save the original settings
-				tempViewTransform = context.scene.view_settings.view_transform
-				tempLook = context.scene.view_settings.look
-				tempExposure = context.scene.view_settings.exposure
-				tempGamma = context.scene.view_settings.gamma
-				tempUseCurveMapping = context.scene.view_settings.use_curve_mapping
-
-				# apply standard settings
-				context.scene.view_settings.view_transform = "Standard"
-				context.scene.view_settings.look = "None"
-				context.scene.view_settings.exposure = 0
-				context.scene.view_settings.gamma = 1
-				context.scene.view_settings.use_curve_mapping = False
-
-
-			# set the temporary file path
-			tempFilepath = bpy.app.tempdir + 'temp' + str(int(time.time())) + '.png'
-
-			# set the output settings
-			tempUseRenderCache = context.scene.render.use_render_cache
-			tempFileFormat = context.scene.render.image_settings.file_format
-			tempColorDepth = context.scene.render.image_settings.color_depth
-			tempColorMode = context.scene.render.image_settings.color_mode
-			context.scene.render.use_render_cache = False
-			context.scene.render.image_settings.file_format = 'PNG'
-			context.scene.render.image_settings.color_depth = '8'
-			context.scene.render.image_settings.color_mode = 'RGBA'
-
-			# save the image to the temporary directory
-			context.window_manager.addon_settings.quiltImage.save_render(filepath=tempFilepath, scene=context.scene)
-
-			# restore output render settings
-			context.scene.render.use_render_cache = tempUseRenderCache
-			context.scene.render.image_settings.file_format = tempFileFormat
-			context.scene.render.image_settings.color_depth = tempColorDepth
-			context.scene.render.image_settings.color_mode = tempColorMode
-
-			# if the image has the "view as render" option inactive
-			if context.window_manager.addon_settings.quiltImage.use_view_as_render == False:
-
-				# restore the original settings
-				context.scene.view_settings.view_transform = tempViewTransform
-				context.scene.view_settings.look = tempLook
-				context.scene.view_settings.exposure = tempExposure
-				context.scene.view_settings.gamma = tempGamma
-				context.scene.view_settings.use_curve_mapping = tempUseCurveMapping
-
-			# if the file was created
-			if os.path.isfile(tempFilepath) == True:
-
-				# append the loaded image to the list
-				tempImage = bpy.data.images.load(filepath=tempFilepath)
-
-				# copy pixel data to the array and a BGL Buffer
-				tempImage.pixels.foreach_get(LookingGlassAddon.quiltPixels)
-
-			# TODO: The following lines would be enough, if the color
-			#		management settings would be applied in memory. Not deleted
-			#		for later
-			#
-			# # copy pixel data to the array and a BGL Buffer
-			# context.window_manager.addon_settings.quiltImage.pixels.foreach_get(LookingGlassAddon.quiltPixels)
-			# LookingGlassAddon.quiltTextureBuffer = bgl.Buffer(bgl.GL_FLOAT, len(context.window_manager.addon_settings.quiltImage.pixels), LookingGlassAddon.quiltPixels)
-
-			# delete the temporary Blender image
-			bpy.data.images.remove(tempImage)
-
-			# delete the temporary file
-			os.remove(tempFilepath)
+			# apply the color management in memory, if the settings allow it
+			if LookingGlassAddonUI.read_color_managed_pixels(context, context.window_manager.addon_settings.quiltImage, LookingGlassAddon.quiltPixels) == False:
+
+				# NOTE: For all other color management settings, the image is saved
+				#		with the color management applied and loaded again. Blender
+				#		does not expose this pixel data to the Python API:
+				#		https://blender.stackexchange.com/questions/206910/access-image-pixel-data-with-color-management-settings
+
+				# if the image has the "view as render" option inactive
+				if context.window_manager.addon_settings.quiltImage.use_view_as_render == False:
+
+					# save the original settings
+					tempViewTransform = context.scene.view_settings.view_transform
+					tempLook = context.scene.view_settings.look
+					tempExposure = context.scene.view_settings.exposure
+					tempGamma = context.scene.view_settings.gamma
+					tempUseCurveMapping = context.scene.view_settings.use_curve_mapping
+
+					# apply standard settings
+					context.scene.view_settings.view_transform = "Standard"
+					context.scene.view_settings.look = "None"
+					context.scene.view_settings.exposure = 0
+					context.scene.view_settings.gamma = 1
+					context.scene.view_settings.use_curve_mapping = False
+
+
+				# set the temporary file path
+				tempFilepath = bpy.app.tempdir + 'temp' + str(int(time.time())) + '.png'
+
+				# set the output settings
+				tempUseRenderCache = context.scene.render.use_render_cache
+				tempFileFormat = context.scene.render.image_settings.file_format
+				tempColorDepth = context.scene.render.image_settings.color_depth
+				tempColorMode = context.scene.render.image_settings.color_mode
+				context.scene.render.use_render_cache = False
+				context.scene.render.image_settings.file_format = 'PNG'
+				context.scene.render.image_settings.color_depth = '8'
+				context.scene.render.image_settings.color_mode = 'RGBA'
+
+				# save the image to the temporary directory
+				context.window_manager.addon_settings.quiltImage.save_render(filepath=tempFilepath, scene=context.scene)
+
+				# restore output render settings
+				context.scene.render.use_render_cache = tempUseRenderCache
+				context.scene.render.image_settings.file_format = tempFileFormat
+				context.scene.render.image_settings.color_depth = tempColorDepth
+				context.scene.render.image_settings.color_mode = tempColorMode
+
+				# if the image has the "view as render" option inactive
+				if context.window_manager.addon_settings.quiltImage.use_view_as_render == False:
+
+					# restore the original settings
+					context.scene.view_settings.view_transform = tempViewTransform
+					context.scene.view_settings.look = tempLook
+					context.scene.view_settings.exposure = tempExposure
+					context.scene.view_settings.gamma = tempGamma
+					context.scene.view_settings.use_curve_mapping = tempUseCurveMapping
+
+				# if the file was created
+				if os.path.isfile(tempFilepath) == True:
+
+					# append the loaded image to the list
+					tempImage = bpy.data.images.load(filepath=tempFilepath)
+
+					# copy pixel data to the array and a BGL Buffer
+					tempImage.pixels.foreach_get(LookingGlassAddon.quiltPixels)
+
+				# delete the temporary Blender image
+				bpy.data.images.remove(tempImage)
+
+				# delete the temporary file
+				os.remove(tempFilepath)
 
 			# CREATE A NEW PYLIGHTIO LIGHTFIELD IMAGE FROM THE BLENDER QUILT
 			# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-			# convert to uint8
-			quiltPixels = 255 * LookingGlassAddon.quiltPixels
-			quiltPixels = quiltPixels.astype(dtype=np.uint8)
+			# convert to uint8 without full-size float temporaries
+			quiltPixels = pylio.PixelConverter.float_to_uint8(LookingGlassAddon.quiltPixels)
 
 			# if no quilt viewer LightfieldImage is selected
 			if context.window_manager.addon_settings.quiltImage is None:
@@ -860,6 +966,7 @@ class LookingGlassAddonSettingsWM(bpy.types.PropertyGroup):
 												 ('2', 'Skipped-views Preview I', 'Skip every second view'),
 												 ('3', 'Skipped-views Preview II', 'Skip every third view'),
 												 ('4', 'Restricted Viewcone Preview', 'Render only a restricted view cone'),
+												 ('5', 'Progressive Refinement', 'Render the central views first and fill in the remaining views over successive updates'),
 												 ],
 										default='0',
 										name="Light Field Preview Mode",
@@ -881,10 +988,57 @@ class LookingGlassAddonSettingsWM(bpy.types.PropertyGroup):
 										default = True,
 										)
 
+	viewport_use_quilt_texture: bpy.props.BoolProperty(
+										name="Single Quilt Texture",
+										description="If enabled, all views are rendered into one quilt-sized texture which is read back at once (takes effect when the light field window is opened)",
+										default = False,
+										)
+
+	viewport_refinement_budget: bpy.props.FloatProperty(
+										name="Refinement Budget (ms)",
+										description="Time that may be spent on drawing views per update of the progressive refinement preview",
+										default = 30.0,
+										min = 5.0,
+										max = 1000.0,
+										)
+
+	viewport_use_redraw_culling: bpy.props.BoolProperty(
+										name="Redraw Culling",
+										description="If enabled, scene changes that are outside of the view cone of the Looking Glass camera do not redraw the light field. Objects outside of the view cone can still cast shadows or reflections into it",
+										default = False,
+										)
+
+	viewport_use_double_buffering: bpy.props.BoolProperty(
+										name="Double Buffering",
+										description="If enabled, the quilt is converted and sent to the Looking Glass in the background while the next quilt is drawn into a second buffer (takes effect when the light field window is opened)",
+										default = False,
+										)
+
 	viewport_manual_refresh: bpy.props.BoolProperty(
 										name="Refresh Looking Glass",
 										description="Redraw the light field in the Looking Glass",
 										default = False,
+										update=LookingGlassAddonUI.update_viewport_manual_refresh,
+										)
+
+	viewport_use_playback_streaming: bpy.props.BoolProperty(
+										name="Playback Streaming",
+										description="If enabled, quilts are sent in the background during animation playback, stale frames are dropped, and the low-resolution preview is used if the full quality cannot keep up with the scene frame rate",
+										default = False,
+										)
+
+	viewport_show_frame_statistics: bpy.props.BoolProperty(
+										name="Frame Statistics",
+										description="Show the frame rate, jitter, and the durations of the drawing, readback, conversion, and sending of the light field",
+										default = False,
+										)
+
+	viewport_max_fps: bpy.props.IntProperty(
+										name="Maximum Frame Rate",
+										description="Maximum number of light field redraws per second",
+										default = 30,
+										min = 1,
+										max = 120,
 										)
 
 
@@ -1005,6 +1159,56 @@ class LookingGlassAddonSettingsScene(bpy.types.PropertyGroup):
 										update=LookingGlassAddonUI.update_render_setting_without_preset,
 										)
 
+	# Reuse rendered views from the view cache
+	render_use_cache: bpy.props.BoolProperty(
+										name="Use View Cache",
+										description="If enabled, rendered views are stored in a cache on disk and reused in later render jobs, if camera, render settings, and scene did not change",
+										default = False,
+										)
+
+	# Write render statistics to a log file next to the output
+	render_use_telemetry: bpy.props.BoolProperty(
+										name="Write Render Statistics",
+										description="If enabled, the render time of each view, the assembly and save time of each quilt, and the throughput are written to a JSON-lines file next to the output file",
+										default = False,
+										)
+
+	# Draft mode: render only every k-th view
+	render_use_draft: bpy.props.BoolProperty(
+										name="Draft Mode",
+										description="If enabled, only every k-th view is rendered. The remaining views are synthesized from the depth of their neighbouring views. This is much faster, but less accurate and meant for previews",
+										default = False,
+										)
+
+	# View step for the draft mode
+	render_draft_step: bpy.props.IntProperty(
+										name = "View Step",
+										default = 4,
+										min = 2,
+										max = 16,
+										description = "Only every k-th view is rendered in draft mode",
+										)
+
+	# Sample profile for Cycles renders
+	render_sample_profile: bpy.props.EnumProperty(
+									items = [('0', 'Uniform', 'All views are rendered with the samples specified in the render settings'),
+											 ('1', 'Linear', 'The samples decrease linearly from the central view to the outermost views of the view cone'),
+											 ('2', 'Cosine', 'The samples decrease with the cosine of the distance from the central view, which keeps more views close to full quality')],
+									default='0',
+									name="Sample Profile",
+									description="Distribution of the Cycles render samples over the views of the quilt",
+									)
+
+	# Sample factor of the outermost views
+	render_sample_minimum: bpy.props.FloatProperty(
+										name = "Outer Views",
+										subtype='FACTOR',
+										default = 0.5,
+										min = 0.05,
+										max = 1.0,
+										description = "Fraction of the render samples used for the outermost views of the view cone",
+										)
+
 	# Orientation of the views
 	render_device_type: bpy.props.EnumProperty(
 										items = LookingGlassAddonUI.emulated_device_list_callback,
@@ -1537,6 +1741,23 @@ class LOOKINGGLASS_PT_panel_render(bpy.types.Panel):
 		row_metadata = row_general_options.row(align = True)
 		render_add_suffix = row_metadata.prop(context.scene.addon_settings, "render_add_suffix")
 
+		# View cache
+		row_use_cache = row_general_options.row(align = True)
+		row_use_cache.prop(context.scene.addon_settings, "render_use_cache")
+
+		# Render statistics
+		row_telemetry = row_general_options.row(align = True)
+		row_telemetry.prop(context.scene.addon_settings, "render_use_telemetry")
+
+		# Draft mode
+		row_draft = row_general_options.row(align = True)
+		row_draft.prop(context.scene.addon_settings, "render_use_draft")
+		if context.scene.addon_settings.render_use_draft: row_draft.prop(context.scene.addon_settings, "render_draft_step", text="Step")
+
+		# the draft mode is only available in single camera mode
+		if context.preferences.addons[__package__].preferences.camera_mode == '1':
+			row_draft.enabled = False
+
 		# Render orientation
 		row_orientation = layout.row(align = True)
 		column_1 = row_orientation.row(align = True)
@@ -1564,6 +1785,20 @@ class LOOKINGGLASS_PT_panel_render(bpy.types.Panel):
 		column_2.prop(context.scene.addon_settings, "render_output", text="")
 		column_2.scale_x = 0.7
 
+		# Sample profile for Cycles
+		row_samples = layout.row(align = True)
+		column_1 = row_samples.row(align = True)
+		column_1.label(text="Samples:")
+		column_1.scale_x = 0.3
+		column_2 = row_samples.row(align = True)
+		column_2.prop(context.scene.addon_settings, "render_sample_profile", text="")
+		if context.scene.addon_settings.render_sample_profile != '0': column_2.prop(context.scene.addon_settings, "render_sample_minimum", text="")
+		column_2.scale_x = 0.7
+
+		# the sample profile is only available for Cycles in single camera mode
+		if context.scene.render.engine != "CYCLES" or context.preferences.addons[__package__].preferences.camera_mode == '1':
+			row_samples.enabled = False
+
 		# if no lockfile was detected on start-up OR the render job is running
 		if not LookingGlassAddon.has_lockfile or LookingGlassAddon.RenderInvoked:
 
@@ -1598,6 +1833,10 @@ class LOOKINGGLASS_PT_panel_render(bpy.types.Panel):
 
 			# disable the UI
 			row_metadata.enabled = False
+			row_use_cache.enabled = False
+			row_telemetry.enabled = False
+			row_draft.enabled = False
+			row_samples.enabled = False
 			row_use_device.enabled = False
 			row_orientation.enabled = False
 			row_preset.enabled = False
@@ -1622,6 +1861,10 @@ class LOOKINGGLASS_PT_panel_render(bpy.types.Panel):
 		# disable the render settings, if a rendering process is running
 		if LookingGlassAddon.RenderInvoked == True:
 			row_metadata.enabled = False
+			row_use_cache.enabled = False
+			row_telemetry.enabled = False
+			row_draft.enabled = False
+			row_samples.enabled = False
 			row_use_device.enabled = False
 			row_orientation.enabled = False
 			row_preset.enabled = False
@@ -1635,6 +1878,10 @@ class LOOKINGGLASS_PT_panel_render(bpy.types.Panel):
 
 			# disable all elements
 			row_metadata.enabled = False
+			row_use_cache.enabled = False
+			row_telemetry.enabled = False
+			row_draft.enabled = False
+			row_samples.enabled = False
 			row_use_device.enabled = False
 			row_orientation.enabled = False
 			row_preset.enabled = False
@@ -1731,6 +1978,33 @@ class LOOKINGGLASS_PT_panel_lightfield(bpy.types.Panel):
 			row_output.prop(context.window_manager.addon_settings, "lightfield_preview_mode", text="")
 			row_output.separator()
 			row_output.prop(context.window_manager.addon_settings, "viewport_use_preview_mode", text="", icon='IMAGE_ZDEPTH')
+			row_output.prop(context.window_manager.addon_settings, "viewport_use_quilt_texture", text="", icon='TEXTURE')
+			row_output.prop(context.window_manager.addon_settings, "viewport_use_double_buffering", text="", icon='SORTTIME')
+			row_output.prop(context.window_manager.addon_settings, "viewport_use_redraw_culling", text="", icon='MOD_MASK')
+			row_output.prop(context.window_manager.addon_settings, "viewport_use_playback_streaming", text="", icon='PLAY')
+
+			# maximum frame rate of the live view
+			row_fps = column.row(align = True)
+			row_fps.prop(context.window_manager.addon_settings, "viewport_max_fps")
+			row_fps.prop(context.window_manager.addon_settings, "viewport_show_frame_statistics", text="", icon='TIME')
+
+			# frame statistics of the live view
+			if context.window_manager.addon_settings.viewport_show_frame_statistics and LookingGlassAddon.LightfieldViewport:
+				frame_pacing = LookingGlassAddon.LightfieldViewport.frame_pacing
+				column_statistics = column.column(align = True)
+				column_statistics.label(text="%.1f fps (jitter: %.1f ms)" % (frame_pacing.fps, frame_pacing.jitter))
+				for stage in frame_pacing.stages:
+					column_statistics.label(text="%s: %.1f ms" % (stage.capitalize(), frame_pacing.average(stage)))
+
+			# time budget of the progressive refinement
+			if context.window_manager.addon_settings.lightfield_preview_mode == '5':
+				row_refinement = column.row(align = True)
+				row_refinement.prop(context.window_manager.addon_settings, "viewport_refinement_budget")
+				row_refinement.enabled = context.window_manager.addon_settings.viewport_use_preview_mode
+
+			# GPU memory used by the live view offscreens
+			row_memory = column.row()
+			row_memory.label(text="GPU Memory: %.1f / %i MB" % (LookingGlassAddon.viewport_offscreen_memory / 1024 / 1024, context.preferences.addons[__package__].preferences.viewport_offscreen_budget))
 
 
 		# if the lightfield window is in quilt viewer mode